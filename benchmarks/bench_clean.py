@@ -0,0 +1,59 @@
+"""Compares the str.translate cleaning engine with the original per-character loop.
+
+Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/bench_clean.py
+"""
+
+import random
+import timeit
+
+import dcl
+from dcl._maps import _diacritic_cleaner_map
+
+LENGTHS = (10, 1_000, 100_000, 1_000_000)
+DENSITIES = (0.0, 0.05, 0.5)
+
+_accented = sorted(k for k in _diacritic_cleaner_map if len(k) == 1)
+_plain = "abcdefghijklmnopqrstuvwxyz ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def legacy_clean_diacritics(string):
+    ret = []
+    for i in string:
+        if i in _diacritic_cleaner_map.keys():
+            ret.append(_diacritic_cleaner_map[i])
+        else:
+            ret.append(i)
+    return "".join(ret)
+
+
+def make_corpus(length, density, seed=0):
+    rng = random.Random(seed)
+    return "".join(
+        rng.choice(_accented) if rng.random() < density else rng.choice(_plain)
+        for _ in range(length)
+    )
+
+
+def best_of(func, arg, repeat=5):
+    number = max(1, 100_000 // max(len(arg), 1))
+    return min(timeit.repeat(lambda: func(arg), number=number, repeat=repeat)) / number
+
+
+def main():
+    print(f"{'length':>10} {'density':>8} {'legacy':>12} {'translate':>12} {'speedup':>8}")
+    for length in LENGTHS:
+        for density in DENSITIES:
+            corpus = make_corpus(length, density)
+            assert legacy_clean_diacritics(corpus) == dcl.clean_diacritics(corpus)
+            legacy = best_of(legacy_clean_diacritics, corpus)
+            fast = best_of(dcl.clean_diacritics, corpus)
+            print(
+                f"{length:>10} {density:>8.0%} {legacy * 1e6:>10.1f}us "
+                f"{fast * 1e6:>10.1f}us {legacy / fast:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
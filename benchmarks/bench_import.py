@@ -0,0 +1,98 @@
+"""Measures how long `import dcl` takes, using `python -X importtime`.
+
+Each run imports dcl in a fresh interpreter. The bytecode cache is written
+by a first untimed import, since installed packages are always imported
+from bytecode. Exits with status 1 if the median exceeds --max-ms, so it can
+guard the import time in CI.
+
+Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/bench_import.py
+    PYTHONPATH=. python benchmarks/bench_import.py --runs 50 --max-ms 40
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+# import time: self [us] | cumulative | imported package
+_line = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)")
+
+
+def _environment():
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+def import_time(module="dcl", env=None):
+    """Imports module in a new interpreter, returning its cumulative import time and modules.
+
+    Times are in seconds. The modules map each name to its own import time,
+    for the modules imported while importing the given one.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        stderr=subprocess.PIPE,
+        check=True,
+        text=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        match = _line.match(line)
+        if match is None:
+            continue
+        own, cumulative, indent, name = match.groups()
+        modules[name] = int(own) / 1e6
+        if len(indent) == 1:
+            if name == module:
+                return int(cumulative) / 1e6, modules
+            # A module imported on startup, such as site.
+            modules = {}
+    raise RuntimeError(f"{module} was already imported on startup")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the import time of dcl.")
+    parser.add_argument("--runs", type=int, default=20, help="Fresh interpreters to import dcl in.")
+    parser.add_argument(
+        "--max-ms", type=float, help="Exit with status 1 if the median import time is above this."
+    )
+    parser.add_argument("--top", type=int, default=10, help="Show the slowest N modules.")
+    args = parser.parse_args(argv)
+
+    env = _environment()
+    subprocess.run([sys.executable, "-c", "import dcl"], env=env, check=True)
+
+    times = []
+    walls = []
+    slowest = {}
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        cumulative, modules = import_time(env=env)
+        walls.append(time.perf_counter() - start)
+        times.append(cumulative)
+        for name, own in modules.items():
+            slowest[name] = min(slowest.get(name, own), own)
+
+    median = statistics.median(times) * 1e3
+    print(f"import dcl over {args.runs} runs")
+    print(f"  median {median:.1f}ms  min {min(times) * 1e3:.1f}ms  max {max(times) * 1e3:.1f}ms")
+    print(f"  interpreter wall time, median {statistics.median(walls) * 1e3:.1f}ms")
+    print("slowest modules, best own time")
+    for name, own in sorted(slowest.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"  {own * 1e3:>7.2f}ms  {name}")
+
+    if args.max_ms is not None and median > args.max_ms:
+        print(f"import time {median:.1f}ms is above {args.max_ms}ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
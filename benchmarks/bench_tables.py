@@ -0,0 +1,72 @@
+"""Reports the memory footprint and lookup speed of the compact code point tables.
+
+Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/bench_tables.py
+"""
+
+import sys
+import timeit
+
+from dcl import _maps
+
+
+def deep_size(obj, seen=None):
+    """The size of an object and everything it holds, counting shared objects once."""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_size(i, seen) for i in obj)
+    return size
+
+
+def name_by_dict(char):
+    entry = _maps._diacritic_reverse_map.get(char)
+    if entry is None:
+        return
+    return entry[1][0]
+
+
+def name_by_table(char):
+    try:
+        code = ord(char)
+    except TypeError:
+        code = -1
+    if 0xC0 <= code < 0x200:
+        entry = _maps._diacritic_tables.latin[code - 0xC0]
+    elif 0x1E00 <= code < 0x1F00:
+        entry = _maps._diacritic_tables.extended[code - 0x1E00]
+    else:
+        return name_by_dict(char)
+    if entry:
+        return _maps._diacritic_id_names[entry >> 8][0]
+
+
+def main():
+    dicts = deep_size(_maps._diacritic_cleaner_map) + deep_size(_maps._diacritic_reverse_map)
+    dense = (
+        sys.getsizeof(_maps._diacritic_tables.latin)
+        + sys.getsizeof(_maps._diacritic_tables.extended)
+        + deep_size(_maps._diacritic_id_names)
+    )
+    print("memory footprint")
+    print(f"  _diacritic_cleaner_map + _diacritic_reverse_map  {dicts:>8} bytes")
+    print(f"  compact array tables + id names                 {dense:>8} bytes")
+    print(f"  ratio                                           {dicts / dense:>8.1f}x")
+
+    print("single character name lookup, time per call")
+    for char in ("é", "ẃ", "x", "ж"):
+        assert name_by_dict(char) == name_by_table(char)
+        by_dict = timeit.timeit(lambda: name_by_dict(char), number=1_000_000)
+        by_table = timeit.timeit(lambda: name_by_table(char), number=1_000_000)
+        print(f"  {char!r}  dict {by_dict * 1e3:.0f}ns  compact tables {by_table * 1e3:.0f}ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,371 @@
+"""Benchmark suite covering every public dcl function.
+
+Only the standard library is used. Text functions are timed on generated
+corpora of several lengths, diacritic densities and script mixes, and
+single character functions on one letter at a time. Results are written as
+JSON, and can be compared against a saved baseline to flag regressions.
+
+Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/suite.py run --output baseline.json
+    PYTHONPATH=. python benchmarks/suite.py run --output current.json
+    PYTHONPATH=. python benchmarks/suite.py compare baseline.json current.json
+
+    # or run and compare in one go
+    PYTHONPATH=. python benchmarks/suite.py run --compare baseline.json
+
+    # check dcl.instrumentation adds nothing while it is off
+    PYTHONPATH=. python benchmarks/suite.py instrumentation
+
+Lengths go up to 100 MB with --sizes, for example --sizes 10 1e6 1e8.
+"""
+
+import argparse
+import atexit
+import datetime
+import fnmatch
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+import unicodedata
+from collections import deque
+
+import dcl
+from dcl._maps import _diacritic_cleaner_map, _diacritic_map
+from dcl.objects import Character, DiacriticApplicant
+
+DEFAULT_SIZES = (10, 1_000, 100_000, 1_000_000)
+DENSITIES = (0.0, 0.05, 0.5)
+
+# Composed characters only. Combining marks clean to nothing, and are added
+# by the nfd script.
+_accented = sorted(k for k, v in _diacritic_cleaner_map.items() if len(k) == 1 and v)
+_scripts = {
+    "latin": "abcdefghijklmnopqrstuvwxyz ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    # One in five characters is Cyrillic or Greek, so the strings are UCS-2.
+    "mixed": "abcdefghijklmnopqrstuvwxyz ABCDEFGHIJKLMNOP абвгдежзиклмн αβγδεζηθ",
+    # CJK and an emoji outside the BMP, so the strings are UCS-4.
+    "cjk": "abcdefghijklmnopqrstuvwxyz 中文字符日本語漢字한국어\U0001f600",
+    # Latin, with accented letters decomposed into a letter and combining marks.
+    "nfd": "abcdefghijklmnopqrstuvwxyz ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+}
+
+_BLOCK = 1 << 16
+
+
+def make_corpus(length, density, script, seed=0):
+    """Generates a corpus by repeating a random block, so 100 MB is quick to build."""
+    rng = random.Random(f"{density}-{script}-{seed}")
+    plain = _scripts[script]
+    block = "".join(
+        rng.choice(_accented) if rng.random() < density else rng.choice(plain)
+        for _ in range(min(length, _BLOCK))
+    )
+    if script == "nfd":
+        block = unicodedata.normalize("NFD", block)
+    return (block * (length // len(block) + 1))[:length]
+
+
+def _drain(iterator):
+    deque(iterator, maxlen=0)
+
+
+def _file_case(text):
+    # The input file is written once during setup, so only clean_file is timed.
+    directory = tempfile.mkdtemp(prefix="dcl-bench-")
+    atexit.register(shutil.rmtree, directory, ignore_errors=True)
+    path_in = os.path.join(directory, "in.txt")
+    with open(path_in, "w", encoding="utf-8") as f:
+        f.write(text)
+    return path_in, os.path.join(directory, "out.txt")
+
+
+_cleaner = dcl.Cleaner()
+_matcher = dcl.FoldedMatcher("crème brûlée")
+_automaton = dcl.FoldedAutomaton(["São Paulo", "Zürich", "Malmö", "crème brûlée", "naïve"])
+_table = _cleaner.table
+
+# name -> (prepare, run). prepare turns a corpus into the argument given to run.
+TEXT_CASES = {
+    "clean_diacritics": (None, dcl.clean_diacritics),
+    "clean_diacritics(keep)": (None, lambda s: dcl.clean_diacritics(s, keep=["caron"])),
+    "Cleaner": (None, _cleaner),
+    "clean_with_offsets": (None, dcl.clean_with_offsets),
+    # Both strings are equal once cleaned, so the whole of them is compared.
+    "folded_equals": (lambda s: (s, s.translate(_table)), lambda pair: dcl.folded_equals(*pair)),
+    # The needle is never found, so the whole haystack is searched.
+    "folded_find": (None, lambda s: dcl.folded_find(s, "crème brûlée")),
+    "folded_contains": (None, lambda s: dcl.folded_contains(s, "crème brûlée")),
+    "FoldedMatcher": (None, _matcher.contains),
+    "FoldedAutomaton": (None, lambda s: _drain(_automaton.finditer(s))),
+    "fold_key": (None, dcl.fold_key),
+    "has_diacritics": (None, dcl.has_diacritics),
+    "count_diacritics": (None, dcl.count_diacritics),
+    "get_diacritics": (None, dcl.get_diacritics),
+    "iter_diacritics": (None, lambda s: _drain(dcl.iter_diacritics(s))),
+    "cantake": (None, lambda s: dcl.cantake(s, "acute")),
+    "apply_to_string": (None, lambda s: dcl.apply_to_string(s, "acute")),
+    "clean_utf8": (lambda s: s.encode("utf-8"), dcl.clean_utf8),
+    # Includes copying the bytearray, since the input is modified.
+    "clean_utf8_into": (lambda s: s.encode("utf-8"), lambda b: dcl.clean_utf8_into(bytearray(b))),
+    "clean_stream": (None, lambda s: dcl.clean_stream(io.StringIO(s), io.StringIO())),
+    "clean_file": (_file_case, lambda paths: dcl.clean_file(*paths)),
+    "clean_many": (lambda s: s.split(" "), lambda words: _drain(dcl.clean_many(words))),
+    "has_many": (lambda s: s.split(" "), lambda words: _drain(dcl.has_many(words))),
+    "count_many": (lambda s: s.split(" "), lambda words: _drain(dcl.count_many(words))),
+}
+
+
+def _letter(diacritic):
+    return next(iter(_diacritic_map[diacritic])).lower()
+
+
+_diacritic_functions = [
+    name for name in dir(dcl) if name in _diacritic_map and callable(getattr(dcl, name))
+]
+_applicant_properties = [
+    name for name, value in vars(DiacriticApplicant).items() if isinstance(value, property)
+]
+
+_offsets = dcl.clean_with_offsets("Le café crème")[1]
+_key_cache = dcl.KeyCache()
+
+
+def _register_cycle():
+    # Registering and unregistering together, so the tables stay the same.
+    dcl.register_diacritic("horn", {"O": "\u01a0", "U": "\u01af"})
+    dcl.unregister_diacritic("horn")
+
+
+# name -> zero argument callable.
+CHAR_CASES = {
+    "apply": lambda: dcl.apply("a", "acute"),
+    "apply(raw=True)": lambda: dcl.apply("a", "acute", raw=True),
+    "lookup": lambda: dcl.lookup("é"),
+    "get_diacritic_name_from_character": lambda: dcl.get_diacritic_name_from_character("é"),
+    "isdiacritictype": lambda: dcl.isdiacritictype("acute"),
+    "cantakelist": lambda: dcl.cantakelist("caron"),
+    "Character": lambda: Character("é", "acute"),
+    "Character.raw": lambda: Character("é", "acute").raw,
+    "OffsetMap.span": lambda: _offsets.span(8, 13),
+    "KeyCache.key": lambda: _key_cache.key("Jürgen Müller"),
+    "register_diacritic+unregister_diacritic": _register_cycle,
+}
+for _name in _diacritic_functions:
+    CHAR_CASES[_name] = (
+        lambda function, letter: lambda: function(letter)
+    )(getattr(dcl, _name), _letter(_name))
+for _name in _applicant_properties:
+    CHAR_CASES[f"DiacriticApplicant.{_name}"] = (
+        lambda name, letter: lambda: getattr(DiacriticApplicant(letter), name)
+    )(_name, _letter(_name))
+
+
+def uncovered():
+    """The public callables in dcl which no case benchmarks."""
+    covered = set(TEXT_CASES)
+    for case in CHAR_CASES:
+        covered.update(name.split("(")[0].split(".")[0] for name in case.split("+"))
+    public = set()
+    for name, value in vars(dcl).items():
+        if name.startswith("_") or not callable(value):
+            continue
+        # Exceptions aren't worth timing.
+        if isinstance(value, type) and issubclass(value, BaseException):
+            continue
+        public.add(name)
+    return sorted(public - covered)
+
+
+def measure(func, target=0.02, repeat=7):
+    """Returns the best time per call, in seconds, running each repeat for about target seconds."""
+    start = time.perf_counter()
+    func()
+    single = time.perf_counter() - start
+    number = max(1, int(target / single)) if single > 0 else 1000
+    if single > target * 5:
+        repeat = min(repeat, 3)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def iter_cases(sizes, pattern):
+    for case, func in CHAR_CASES.items():
+        if fnmatch.fnmatchcase(case, pattern):
+            yield case, func
+    for size in sizes:
+        for density in DENSITIES:
+            for script in _scripts:
+                corpus = None
+                for name, (prepare, run) in TEXT_CASES.items():
+                    case = f"{name}[n={size},density={density:.0%},script={script}]"
+                    if not fnmatch.fnmatchcase(case, pattern):
+                        continue
+                    if corpus is None:
+                        corpus = make_corpus(size, density, script)
+                    arg = corpus if prepare is None else prepare(corpus)
+                    yield case, (lambda run, arg: lambda: run(arg))(run, arg)
+
+
+def run(args):
+    missing = uncovered()
+    if missing:
+        print(f"warning: no benchmark for {', '.join(missing)}", file=sys.stderr)
+
+    results = {}
+    for case, func in iter_cases(args.sizes, args.filter):
+        results[case] = measure(func)
+        if not args.quiet:
+            print(f"{results[case] * 1e6:>14.3f}us  {case}")
+
+    report = {
+        "meta": {
+            "dcl": dcl.__version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            return compare(json.load(f), report, args.threshold)
+    return 0
+
+
+def compare(baseline, current, threshold, noise=50e-9):
+    """Prints cases which changed by more than threshold. Returns 1 if any got slower.
+
+    Differences smaller than noise seconds are ignored, since sub-microsecond
+    cases jitter by more than the threshold from run to run.
+    """
+    regressions = 0
+    for case, now in sorted(current["results"].items()):
+        before = baseline["results"].get(case)
+        if before is None or abs(now - before) < noise:
+            continue
+        change = now / before - 1
+        if change > threshold:
+            regressions += 1
+            print(f"REGRESSION  {change:>+8.1%}  {case}")
+        elif change < -threshold:
+            print(f"improvement {change:>+8.1%}  {case}")
+    print(f"{regressions} regression(s) beyond {threshold:.0%}")
+    return 1 if regressions else 0
+
+
+# Cases for the functions dcl.instrumentation wraps. Each looks the function
+# up on every call, so it runs whichever version is installed.
+INSTRUMENTED_CASES = {
+    "clean_diacritics": lambda: dcl.clean_diacritics("Le café crème"),
+    "get_diacritics": lambda: dcl.get_diacritics("Le café crème"),
+    "cantake": lambda: dcl.cantake("clock", "acute"),
+    "apply": lambda: dcl.apply("a", "acute"),
+    "apply_to_string": lambda: dcl.apply_to_string("clock", "acute"),
+}
+
+
+def check_instrumentation(args, noise=100e-9):
+    """Checks that dcl.instrumentation costs nothing once recording stops. Returns 1 if it does.
+
+    Recording replaces the functions with timed wrappers, so the check is
+    that the originals are back in place afterwards. Each case is also
+    timed before recording ever started, while recording and after it
+    stopped, for information. Cases more than threshold slower afterwards
+    are flagged, ignoring differences under noise seconds, as these calls
+    take well under a microsecond.
+    """
+    import dcl.instrumentation
+
+    def best(func):
+        # These calls take under a microsecond, so the best of several
+        # rounds is taken to keep scheduling noise out of the comparison.
+        return min(measure(func) for _ in range(5))
+
+    def slower(name):
+        return after[name] / before[name] - 1 > args.threshold and after[name] - before[name] > noise
+
+    originals = {name: getattr(dcl, name) for name in INSTRUMENTED_CASES}
+    before = {name: best(func) for name, func in INSTRUMENTED_CASES.items()}
+    with dcl.instrumentation.recording():
+        on = {name: best(func) for name, func in INSTRUMENTED_CASES.items()}
+    after = {name: best(func) for name, func in INSTRUMENTED_CASES.items()}
+
+    failures = 0
+    for name, func in INSTRUMENTED_CASES.items():
+        # A case which looks slower is timed again, in case the machine was
+        # busy, before it is flagged.
+        for _ in range(3):
+            if not slower(name):
+                break
+            after[name] = min(after[name], best(func))
+        change = after[name] / before[name] - 1
+        restored = getattr(dcl, name) is originals[name]
+        failures += not restored
+        print(
+            f"{before[name] * 1e6:>10.3f}us off  {on[name] * 1e6:>10.3f}us on  "
+            f"{after[name] * 1e6:>10.3f}us off again ({change:>+6.1%})  {name}"
+            + ("" if restored else "  NOT RESTORED")
+            + ("  slower" if slower(name) else "")
+        )
+    print(f"{failures} function(s) not restored after recording stopped")
+    return 1 if failures else 0
+
+
+def _size(value):
+    return int(float(value))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="dcl benchmark suite.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks.")
+    run_parser.add_argument("--output", "-o", help="Write the results to this JSON file.")
+    run_parser.add_argument("--sizes", nargs="+", type=_size, default=DEFAULT_SIZES)
+    run_parser.add_argument("--filter", default="*", help="Only run cases matching this glob.")
+    run_parser.add_argument("--compare", metavar="BASELINE", help="Compare against a saved baseline.")
+    run_parser.add_argument("--threshold", type=float, default=0.10)
+    run_parser.add_argument("--quiet", "-q", action="store_true")
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two saved results.")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10)
+
+    instrumentation_parser = subparsers.add_parser(
+        "instrumentation", help="Check dcl.instrumentation has no overhead while off."
+    )
+    instrumentation_parser.add_argument("--threshold", type=float, default=0.10)
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        return run(args)
+    if args.command == "instrumentation":
+        return check_instrumentation(args)
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    return compare(baseline, current, args.threshold)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
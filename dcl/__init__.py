@@ -8,6 +8,8 @@ DCL currently supports a multitude of diacritics:
 * breve
 * caron
 * cedilla
+* circumflex
+* double_acute
 * grave
 * interpunct
 * macron
@@ -20,618 +22,755 @@ DCL currently supports a multitude of diacritics:
 * tilde
 * tittle
 * umlaut/diaresis
-* umlaut_and_macron
+* umlaut_and_macron/diaresis_and_macron
 
 We can use these functions directly from the dcl object to convert a single string
 into the given letter with the appropriate diacritic.
 """
 
+import codecs as _codecs
+import io as _io
+import os as _os
+import re as _re
+import types as _types
+from array import array as _array
+from functools import lru_cache as _lru_cache
 from typing import (
+    Any as _Any,
     Dict as _Dict, 
     List as _List,
-    Iterable as _Iterable
+    Iterable as _Iterable,
+    Iterator as _Iterator,
+    Optional as _Optional,
+    Tuple as _Tuple,
+    Union as _Union
 )
 
-from ._maps import _diacritic_map, _diacritic_cleaner_map
-from .errors import *
-from .objects import *
+from ._batch import map_chunks as _map_chunks
+from . import _maps
+from .errors import DiacriticError
+from .objects import (
+    Character,
+    Cleaner,
+    DiacriticApplicant,
+    FoldedAutomaton,
+    FoldedMatcher,
+    KeyCache,
+    OffsetMap,
+    _apply,
+    _fold_key
+)
 
 __version__ = "1.0.1"
 
 
-diacritic_list = [
-    "acute",
-    "breve",
-    "caron",
-    "cedilla",
-    "diaresis",
-    "grave",
-    "interpunct",
-    "macron",
-    "ogonek",
-    "ring",
-    "ring_and_acute",
-    "slash",
-    "stroke",
-    "stroke_and_acute",
-    "tilde",
-    "tittle",
-    "umlaut",
-    "umlaut_and_macron",
-]
-
-isdiacritictype = frozenset(diacritic_list).__contains__
-
-def _apply_diacritic(string, accent):
-    a = DiacriticApplicant(string)
-    return getattr(a, accent)
-
-
-def grave(string: str):
-    """Returns the given character with a grave diacritic.
+# Every built in diacritic, aliases included, taken from the map so the two
+# can't drift apart. Registered diacritics are added to the end.
+diacritic_list = sorted(_maps._diacritic_map)
 
-    This function only takes a string of length 1.
+_diacritic_types = frozenset(diacritic_list)
 
-    Parameters
-    ----------
-    string: str
-        The string to give the grave diacritic.
 
-    Returns
-    -------
-    Character
-        The string with the grave diacritic.
-
-    Raises
-    ------
-    AccentError
-        The given string could not be given a grave diacritic.
-    TypeError
-        The parameter was not a string.
-    ValueError
-        The string was not of length 1.
-    """
-    return _apply_diacritic(string, "grave")
-
-
-def acute(string: str):
-    """Returns the given character with an acute diacritic.
-
-    This function only takes a string of length 1.
+def isdiacritictype(diacritic: str) -> bool:
+    """Returns whether the given name is a diacritic, including registered ones.
 
     Parameters
     ----------
-    string: str
-        The string to give the acute diacritic.
+    diacritic: str
+        The name to check.
 
     Returns
     -------
-    Character
-        The string with the acute diacritic.
-
-    Raises
-    ------
-    AccentError
-        The given string could not be given an acute diacritic.
-    TypeError
-        The parameter was not a string.
-    ValueError
-        The string was not of length 1.
+    bool
+        Whether the name is a diacritic.
     """
-    return _apply_diacritic(string, "acute")
+    return diacritic in _diacritic_types or diacritic in _maps._diacritic_tables.registered
 
 
-def circumflex(string: str):
-    """Returns the given character with a circumflex diacritic.
+def apply(string: str, diacritic: str, raw: bool = False) -> _Union[Character, str]:
+    """Returns the given character with the given diacritic.
 
     This function only takes a string of length 1.
 
     Parameters
     ----------
     string: str
-        The string to give the circumflex diacritic.
+        The string to give the diacritic.
+    diacritic: str
+        The name of the diacritic.
+    raw: bool
+        Whether to return a plain str instead of a Character.
 
     Returns
     -------
-    Character
-        The string with the circumflex diacritic.
+    Union[Character, str]
+        The string with the diacritic.
 
     Raises
     ------
-    AccentError
-        The given string could not be given a circumflex diacritic.
+    DiacriticError
+        The given string could not be given the diacritic.
     TypeError
         The parameter was not a string.
     ValueError
-        The string was not of length 1.
+        The string was not of length 1, or the diacritic does not exist.
     """
-    return _apply_diacritic(string, "circumflex")
+    try:
+        char = _maps._diacritic_tables.apply[string, diacritic]
+    except (KeyError, TypeError):
+        char = _apply(string, diacritic)
 
+    if raw:
+        return char
 
-def tilde(string: str):
-    """Returns the given character with a tilde diacritic.
+    return Character(char, diacritic)
 
-    This function only takes a string of length 1.
+
+def apply_to_string(text: str, diacritic: str, strict: bool = False) -> str:
+    """Returns the given string with a diacritic on every letter which can take it.
 
     Parameters
     ----------
-    string: str
-        The string to give the tilde diacritic.
+    text: str
+        The string to give the diacritic.
+    diacritic: str
+        The name of the diacritic.
+    strict: bool
+        Whether to raise an error if any character can't take the diacritic,
+        instead of leaving it unchanged.
 
     Returns
     -------
-    Character
-        The string with the tilde diacritic.
+    str
+        The string with the diacritic.
 
     Raises
     ------
-    AccentError
-        The given string could not be given a tilde diacritic.
+    DiacriticError
+        Strict was given, and a character could not be given the diacritic.
     TypeError
-        The parameter was not a string.
+        The text was not a string.
     ValueError
-        The string was not of length 1.
+        The diacritic does not exist.
     """
-    return _apply_diacritic(string, "tilde")
-
-
-def umlaut(string: str):
-    """Returns the given character with an umlaut diacritic.
+    if not isinstance(text, str):
+        raise TypeError(f"apply_to_string function takes str, not {type(text).__name__}")
+
+    tables = _maps._diacritic_tables
+    try:
+        table = tables.apply_tables[diacritic]
+    except KeyError:
+        raise ValueError(f"'{diacritic}' is not a valid diacritic") from None
+
+    if strict:
+        # The pattern is compiled once, then kept in the re module's cache.
+        match = _re.search(tables.reject_patterns[diacritic], text)
+        if match is not None:
+            raise DiacriticError(match.group(), diacritic.replace("_", " "))
+
+    return text.translate(table)
+
+
+# The functions giving a single diacritic, such as dcl.acute, are created on
+# first access by __getattr__ below rather than on import. Each maps to the
+# diacritic it applies, which differs for the diaresis aliases.
+_diacritic_functions = {
+    "grave": "grave",
+    "acute": "acute",
+    "double_acute": "double_acute",
+    "circumflex": "circumflex",
+    "tilde": "tilde",
+    "umlaut": "umlaut",
+    "caron": "caron",
+    "ring": "ring",
+    "cedilla": "cedilla",
+    "slash": "slash",
+    "ogonek": "ogonek",
+    "macron": "macron",
+    "breve": "breve",
+    "tittle": "tittle",
+    "stroke": "stroke",
+    "interpunct": "interpunct",
+    "umlaut_and_macron": "umlaut_and_macron",
+    "ring_and_acute": "ring_and_acute",
+    "stroke_and_acute": "stroke_and_acute",
+    # Aliases
+    "diaresis": "umlaut",
+    "diaresis_and_macron": "umlaut_and_macron",
+}
+
+_diacritic_function_doc = """Returns the given character with {article} {diacritic} diacritic.
 
     This function only takes a string of length 1.
 
     Parameters
     ----------
     string: str
-        The string to give the umlaut diacritic.
+        The string to give the {diacritic} diacritic.
 
     Returns
     -------
     Character
-        The string with the umlaut diacritic.
+        The string with the {diacritic} diacritic.
 
     Raises
     ------
-    AccentError
-        The given string could not be given an umlaut diacritic.
+    DiacriticError
+        The given string could not be given {article} {diacritic} diacritic.
     TypeError
         The parameter was not a string.
     ValueError
         The string was not of length 1.
     """
-    return _apply_diacritic(string, "umlaut")
 
 
-def caron(string: str):
-    """Returns the given character with a caron diacritic.
+def _make_diacritic_function(name, diacritic):
+    def function(string: str) -> Character:
+        return apply(string, diacritic)
 
-    This function only takes a string of length 1.
+    spoken = name.replace("_", " ")
+    function.__name__ = function.__qualname__ = name
+    function.__doc__ = _diacritic_function_doc.format(
+        article="an" if spoken[0] in "aeiou" else "a", diacritic=spoken
+    )
+    if diacritic != name:
+        function.__doc__ = function.__doc__.replace(
+            "diacritic.\n", f"diacritic ({diacritic.replace('_', ' ')}).\n", 1
+        )
+    return function
 
-    Parameters
-    ----------
-    string: str
-        The string to give the caron diacritic.
 
-    Returns
-    -------
-    Character
-        The string with the caron diacritic.
+def __getattr__(name: str) -> _Any:
+    diacritic = _diacritic_functions.get(name)
+    if diacritic is None:
+        # Registered diacritics are not stored, since they can be unregistered.
+        if name in _maps._diacritic_tables.registered:
+            return _make_diacritic_function(name, name)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    Raises
-    ------
-    AccentError
-        The given string could not be given a caron diacritic.
-    TypeError
-        The parameter was not a string.
-    ValueError
-        The string was not of length 1.
-    """
-    return _apply_diacritic(string, "caron")
+    # Stored in the module, so __getattr__ is only called once per function.
+    function = globals()[name] = _make_diacritic_function(name, diacritic)
+    return function
 
 
-def ring(string: str):
-    """Returns the given character with a ring diacritic.
+def __dir__() -> _List[str]:
+    return sorted(set(globals()) | set(_diacritic_functions) | set(_maps._diacritic_tables.registered))
 
-    This function only takes a string of length 1.
+
+def register_diacritic(name: str, mapping: _Dict[str, str], symbol: _Optional[str] = None) -> None:
+    """Adds a diacritic, so every function in dcl can apply, find and clean it.
+
+    Only the table entries for the new characters are built. The tables are
+    then replaced all at once, so calls running in other threads see either
+    the old diacritics or the new ones, never a mix. Registrations only last
+    for the current process, so worker processes started with the spawn
+    method, such as by ``clean_many(workers=...)`` on Windows and macOS, don't
+    see them.
 
     Parameters
     ----------
-    string: str
-        The string to give the ring diacritic.
-
-    Returns
-    -------
-    Character
-        The string with the ring diacritic.
+    name: str
+        The name of the diacritic, which must be a valid identifier. It
+        becomes available as ``dcl.<name>``.
+    mapping: Dict[str, str]
+        Each letter which can take the diacritic, mapped to the letter with
+        it. Lower case forms are added automatically.
+    symbol: Optional[str]
+        The character shown for the diacritic, as in ``Character.diacritic``.
 
     Raises
     ------
-    AccentError
-        The given string could not be given a ring diacritic.
     TypeError
-        The parameter was not a string.
+        A parameter was not of the right type.
     ValueError
-        The string was not of length 1.
+        The name is taken or invalid, a letter or character was not a
+        single letter, or a character already cleans to another letter.
     """
-    return _apply_diacritic(string, "ring")
-
-
-def cedilla(string: str):
-    """Returns the given character with a cedilla diacritic.
-
-    This function only takes a string of length 1.
+    if not isinstance(name, str):
+        raise TypeError(f"register_diacritic function takes str, not {type(name).__name__}")
+    if not name.isidentifier() or name.startswith("_"):
+        raise ValueError(f"'{name}' is not a valid diacritic name")
+    if not isinstance(mapping, dict):
+        raise TypeError(f"mapping must be dict, not {type(mapping).__name__}")
+    if symbol is not None and (not isinstance(symbol, str) or len(symbol) != 1):
+        raise ValueError("symbol must be a single character")
+
+    letters = {}
+    for base, char in mapping.items():
+        if not isinstance(base, str) or not isinstance(char, str):
+            raise TypeError("mapping must map str to str")
+        if len(base) != 1 or len(char) != 1 or not base.isalpha() or not char.isalpha():
+            raise ValueError(f"{base!r} and {char!r} must both be single letters")
+        # Stored in upper case, like the built in diacritics.
+        if len(base.upper()) == 1 and len(char.upper()) == 1:
+            base, char = base.upper(), char.upper()
+        if len(base.lower()) != 1:
+            raise ValueError(f"{base!r} has no single lower case letter")
+        letters[base] = char
+
+    from . import _registry
+
+    with _registry.lock:
+        tables = _maps._diacritic_tables
+        if name in tables.map or name in _diacritic_functions or name in globals():
+            raise ValueError(f"'{name}' is already a diacritic or dcl name")
+        for base, char in letters.items():
+            for composed, letter in ((char, base), (char.lower(), base.lower())):
+                current = tables.cleaner.get(composed, letter)
+                if composed.isascii() or current != letter:
+                    raise ValueError(f"{composed!r} can't be {letter!r} with a diacritic")
+
+        _maps._diacritic_tables = _registry.add_diacritic(tables, name, letters, symbol)
+        global diacritic_list
+        diacritic_list = diacritic_list + [name]
+
+
+def unregister_diacritic(name: str) -> None:
+    """Removes a diacritic added by ``register_diacritic``.
+
+    Characters which are also produced by another diacritic keep being
+    found and cleaned.
 
     Parameters
     ----------
-    string: str
-        The string to give the ring diacritic.
-
-    Returns
-    -------
-    Character
-        The string with the ring diacritic.
+    name: str
+        The name of the registered diacritic.
 
     Raises
     ------
-    AccentError
-        The given string could not be given a ring diacritic.
-    TypeError
-        The parameter was not a string.
     ValueError
-        The string was not of length 1.
+        The diacritic was not registered. Built in diacritics can't be removed.
     """
-    return _apply_diacritic(string, "cedilla")
-
-def slash(string: str):
-    """Returns the given character with a slash diacritic.
-
-    This function only takes a string of length 1.
+    from . import _registry
+
+    with _registry.lock:
+        tables = _maps._diacritic_tables
+        if name not in tables.registered:
+            raise ValueError(f"'{name}' is not a registered diacritic")
+        _maps._diacritic_tables = _registry.remove_diacritic(tables, name)
+        global diacritic_list
+        diacritic_list = [diacritic for diacritic in diacritic_list if diacritic != name]
+
+
+@_lru_cache(maxsize=64)
+def _subset_table(tables, diacritics, keep):
+    # A str.translate table cleaning the characters with a diacritic in
+    # diacritics, or any diacritic if it is None, unless they also have one
+    # in keep. Aliases such as umlaut and diaresis share their characters, so
+    # keeping either keeps both.
+    mapping = {}
+    for name in tables.map if diacritics is None else diacritics:
+        for k, v in tables.map[name].items():
+            mapping[v] = k
+            mapping[v.lower()] = k.lower()
+    for name in keep:
+        for v in tables.map[name].values():
+            mapping.pop(v, None)
+            mapping.pop(v.lower(), None)
+
+    # Combining marks are cleaned by the same rule, by the diacritics they stand for.
+    for char, (base, names) in tables.reverse.items():
+        if not base and (diacritics is None or not diacritics.isdisjoint(names)) and keep.isdisjoint(names):
+            mapping[char] = ""
+
+    mapping = {k: v for k, v in mapping.items() if len(k) == 1}
+    return _maps._dense_table(mapping) if mapping else []
+
+
+def _diacritic_names(function, argument, names):
+    try:
+        if isinstance(names, str):
+            raise TypeError
+        names = frozenset(names)
+    except TypeError:
+        raise TypeError(
+            f"{function} function takes a list of diacritic names for {argument}, not {type(names).__name__}"
+        ) from None
+    # Checked as a set first, so the common case costs a single comparison.
+    # The rest are checked like every other function checks a name.
+    if not names <= _diacritic_types:
+        for name in names - _diacritic_types:
+            if not isdiacritictype(name):
+                raise ValueError(f"'{name}' is not a valid diacritic")
+    return names
+
+
+def clean_diacritics(
+    string: str, diacritics: _Optional[_Iterable[str]] = None, keep: _Optional[_Iterable[str]] = None
+) -> str:
+    """Returns the given string cleaned from diacritics.
 
     Parameters
     ----------
-    string: str
-        The string to give the slash diacritic.
+    string: Iterable
+        The string to clean accents from.
+    diacritics: Optional[Iterable[str]]
+        The diacritics to clean. If not provided, all diacritics will be cleaned.
+    keep: Optional[Iterable[str]]
+        Diacritics to leave in place, even if they would be cleaned otherwise.
 
     Returns
     -------
-    Character
-        The string with the slash diacritic.
-
-    Raises
-    ------
-    AccentError
-        The given string could not be given a slash diacritic.
-    TypeError
-        The parameter was not a string.
-    ValueError
-        The string was not of length 1.
+    str
+        The cleaned string.
     """
-    return _apply_diacritic(string, "slash")
+    if not isinstance(string, str):
+        raise TypeError(f"clean_diacritics function takes str, not {type(string).__name__}")
 
+    if diacritics is None and keep is None:
+        if string.isascii():
+            return string
+        return string.translate(_maps._diacritic_tables.translate)
 
-def ogonek(string: str):
-    """Returns the given character with an ogonek diacritic.
+    # The table for each subset is built once, then kept in _subset_table's cache.
+    if diacritics is not None:
+        diacritics = _diacritic_names("clean_diacritics", "diacritics", diacritics)
+    keep = frozenset() if keep is None else _diacritic_names("clean_diacritics", "keep", keep)
+    if string.isascii():
+        return string
+    return string.translate(_subset_table(_maps._diacritic_tables, diacritics, keep))
 
-    This function only takes a string of length 1.
+
+def clean_with_offsets(text: str) -> _Tuple[str, OffsetMap]:
+    """Returns the given string cleaned from diacritics, with a map back to its offsets.
+
+    The map gives the position in the original string of every character in
+    the cleaned one, so a match found in the cleaned string can be located
+    in the original.
 
     Parameters
     ----------
-    string: str
-        The string to give the ogonek diacritic.
+    text: str
+        The string to clean accents from.
 
     Returns
     -------
-    Character
-        The string with the ogonek diacritic.
-
-    Raises
-    ------
-    AccentError
-        The given string could not be given an ogonek diacritic.
-    TypeError
-        The parameter was not a string.
-    ValueError
-        The string was not of length 1.
+    Tuple[str, OffsetMap]
+        The cleaned string, and the map from its positions to the original's.
     """
-    return _apply_diacritic(string, "ogonek")
-
-
-def macron(string: str):
-    """Returns the given character with a macron diacritic.
-
-    This function only takes a string of length 1.
+    if not isinstance(text, str):
+        raise TypeError(f"clean_with_offsets function takes str, not {type(text).__name__}")
+
+    if text.isascii():
+        return text, OffsetMap(None, len(text))
+
+    tables = _maps._diacritic_tables
+    cleaned = text.translate(tables.translate)
+    resizing = tables.resizing_regex
+    if resizing is None or resizing.search(text) is None:
+        return cleaned, OffsetMap(None, len(text))
+
+    # Characters between the resizing ones keep their relative positions, so
+    # only the runs between them are copied across.
+    offsets = _array("I")
+    last = 0
+    for match in resizing.finditer(text):
+        start = match.start()
+        offsets.extend(range(last, start))
+        offsets.extend([start] * len(tables.translate[ord(match.group())]))
+        last = start + 1
+    offsets.extend(range(last, len(text)))
+    return cleaned, OffsetMap(offsets, len(text))
+
+
+def folded_equals(a: str, b: str) -> bool:
+    """Returns whether two strings are equal once cleaned from diacritics.
+
+    Neither string is cleaned as a whole, unless one holds combining marks.
+    They are compared a chunk at a time, only cleaning the chunks which
+    differ, so the comparison stops at the first chunk which doesn't match.
 
     Parameters
     ----------
-    string: str
-        The string to give the macron diacritic.
+    a: str
+        The first string to compare.
+    b: str
+        The second string to compare.
 
     Returns
     -------
-    Character
-        The string with the macron diacritic.
-
-    Raises
-    ------
-    AccentError
-        The given string could not be given a macron diacritic.
-    TypeError
-        The parameter was not a string.
-    ValueError
-        The string was not of length 1.
+    bool
+        Whether the strings are equal regardless of diacritics.
     """
-    return _apply_diacritic(string, "macron")
+    if not isinstance(a, str) or not isinstance(b, str):
+        wrong = b if isinstance(a, str) else a
+        raise TypeError(f"folded_equals function takes str, not {type(wrong).__name__}")
+
+    if a == b:
+        return True
+    if a.isascii() and b.isascii():
+        return False
+
+    tables = _maps._diacritic_tables
+    table = tables.translate
+    # Combining marks clean to nothing, so strings holding them no longer
+    # line up character for character, and are cleaned as a whole.
+    resizing = tables.resizing_regex
+    if resizing is not None and (resizing.search(a) is not None or resizing.search(b) is not None):
+        return a.translate(table) == b.translate(table)
+
+    length = len(a)
+    if length != len(b):
+        return False
+
+    # The chunks start small, so an early mismatch is found quickly, and grow
+    # so long strings are cleaned at str.translate speed.
+    start = 0
+    size = 32
+    while start < length:
+        end = start + size
+        x = a[start:end]
+        y = b[start:end]
+        if x != y and x.translate(table) != y.translate(table):
+            return False
+        start = end
+        if size < 4096:
+            size *= 2
+    return True
 
 
-def breve(string: str):
-    """Returns the given character with a breve diacritic.
+def folded_find(haystack: str, needle: str, start: _Optional[int] = None, end: _Optional[int] = None) -> int:
+    """Returns the lowest index in haystack where needle is found regardless of diacritics, or -1.
 
-    This function only takes a string of length 1.
+    Like ``str.find``, but neither string has to be cleaned first. For
+    searching for the same needle many times, use a ``FoldedMatcher``.
 
     Parameters
     ----------
-    string: str
-        The string to give the breve diacritic.
+    haystack: str
+        The string to search in.
+    needle: str
+        The string to search for.
+    start: Optional[int]
+        Where to start searching, interpreted as in slice notation.
+    end: Optional[int]
+        Where to stop searching, interpreted as in slice notation.
 
     Returns
     -------
-    Character
-        The string with the breve diacritic.
-
-    Raises
-    ------
-    AccentError
-        The given string could not be given a breve diacritic.
-    TypeError
-        The parameter was not a string.
-    ValueError
-        The string was not of length 1.
+    int
+        The index in haystack where needle starts, or -1 if it wasn't found.
     """
-    return _apply_diacritic(string, "breve")
-
+    if not isinstance(haystack, str) or not isinstance(needle, str):
+        wrong = needle if isinstance(haystack, str) else haystack
+        raise TypeError(f"folded_find function takes str, not {type(wrong).__name__}")
+    return FoldedMatcher(needle).find(haystack, start, end)
 
-def tittle(string: str):
-    """Returns the given character with a tittle diacritic.
 
-    This function only takes a string of length 1.
+def folded_contains(haystack: str, needle: str) -> bool:
+    """Returns whether needle is found in haystack regardless of diacritics.
 
     Parameters
     ----------
-    string: str
-        The string to give the tittle diacritic.
+    haystack: str
+        The string to search in.
+    needle: str
+        The string to search for.
 
     Returns
     -------
-    Character
-        The string with the tittle diacritic.
-
-    Raises
-    ------
-    AccentError
-        The given string could not be given a tittle diacritic.
-    TypeError
-        The parameter was not a string.
-    ValueError
-        The string was not of length 1.
+    bool
+        Whether needle was found.
     """
-    return _apply_diacritic(string, "tittle")
+    if not isinstance(haystack, str) or not isinstance(needle, str):
+        wrong = needle if isinstance(haystack, str) else haystack
+        raise TypeError(f"folded_contains function takes str, not {type(wrong).__name__}")
+    return FoldedMatcher(needle).contains(haystack)
 
 
-def stroke(string: str):
-    """Returns the given character with a stroke diacritic.
+def fold_key(string: str) -> _Tuple[str, str]:
+    """Returns a key for sorting or grouping strings regardless of diacritics.
 
-    This function only takes a string of length 1.
+    The key is the cleaned string, followed by the string itself, so strings
+    which clean to the same thing still sort in a stable order and stay
+    distinct. For data where the same strings repeat, a ``KeyCache`` saves
+    cleaning them again.
 
     Parameters
     ----------
     string: str
-        The string to give the stroke diacritic.
+        The string to make a key for.
 
     Returns
     -------
-    Character
-        The string with the stroke diacritic.
-
-    Raises
-    ------
-    AccentError
-        The given string could not be given a stroke diacritic.
-    TypeError
-        The parameter was not a string.
-    ValueError
-        The string was not of length 1.
+    Tuple[str, str]
+        The cleaned string and the given one.
     """
-    return _apply_diacritic(string, "stroke")
-
-
-def interpunct(string: str):
-    """Returns the given character with an interpunct diacritic.
-
-    This function only takes a string of length 1.
+    if not isinstance(string, str):
+        raise TypeError(f"fold_key function takes str, not {type(string).__name__}")
+    return _fold_key(string)
 
-    Parameters
-    ----------
-    string: str
-        The string to give the interpunct diacritic.
 
-    Returns
-    -------
-    Character
-        The string with the interpunct diacritic.
+def _is_text_stream(stream):
+    if isinstance(stream, _io.TextIOBase):
+        return True
+    if isinstance(stream, (_io.RawIOBase, _io.BufferedIOBase)):
+        return False
+    return hasattr(stream, "encoding")
 
-    Raises
-    ------
-    AccentError
-        The given string could not be given an interpunct diacritic.
-    TypeError
-        The parameter was not a string.
-    ValueError
-        The string was not of length 1.
-    """
-    return _apply_diacritic(string, "interpunct")
 
-def umlaut_and_macron(string: str):
-    """Returns the given character with an umlaut and macron diacritic.
+def clean_stream(src: _Any, dst: _Any, chunk_size: int = 65536) -> int:
+    """Cleans diacritics from a file object, writing the result to another.
 
-    This function only takes a string of length 1.
+    The source is read in chunks of a fixed size and each cleaned chunk
+    is written straight away, so memory use does not grow with the input.
+    Either file object may be opened in text or binary mode. Binary data
+    is read and written as UTF-8, and characters which are split across
+    two chunks are handled correctly.
 
     Parameters
     ----------
-    string: str
-        The string to give the umlaut and macron diacritic.
+    src: file object
+        The file object to read from.
+    dst: file object
+        The file object to write the cleaned text to.
+    chunk_size: int
+        The number of characters, or bytes in binary mode, read at once.
 
     Returns
     -------
-    Character
-        The string with the umlaut and macron diacritic.
-
-    Raises
-    ------
-    AccentError
-        The given string could not be given an umlaut and macron diacritic.
-    TypeError
-        The parameter was not a string.
-    ValueError
-        The string was not of length 1.
+    int
+        The number of characters read.
     """
-    return _apply_diacritic(string, "umlaut_and_macron")
-
-
-def ring_and_acute(string: str):
-    """Returns the given character with a ring and acute diacritic.
-
-    This function only takes a string of length 1.
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, not {chunk_size}")
+
+    decoder = None
+    if isinstance(src.read(0), bytes):
+        decoder = _codecs.getincrementaldecoder("utf-8")()
+    encode = not _is_text_stream(dst)
+    table = _maps._diacritic_tables.translate
+    total = 0
+
+    while True:
+        chunk = src.read(chunk_size)
+        text = chunk if decoder is None else decoder.decode(chunk, final=not chunk)
+        if text:
+            total += len(text)
+            if not text.isascii():
+                text = text.translate(table)
+            dst.write(text.encode("utf-8") if encode else text)
+        if not chunk:
+            break
+
+    return total
+
+
+def clean_file(
+    path_in: _Union[str, _os.PathLike],
+    path_out: _Union[str, _os.PathLike],
+    chunk_size: int = 65536,
+) -> int:
+    """Cleans diacritics from a UTF-8 file, writing the result to another file.
 
     Parameters
     ----------
-    string: str
-        The string to give the ring and acute diacritic.
+    path_in: Union[str, PathLike]
+        The path of the file to clean.
+    path_out: Union[str, PathLike]
+        The path to write the cleaned file to. This must not be the same
+        file as path_in.
+    chunk_size: int
+        The number of bytes read at once.
 
     Returns
     -------
-    Character
-        The string with the ring and acute diacritic.
-
-    Raises
-    ------
-    AccentError
-        The given string could not be given a ring and acute diacritic.
-    TypeError
-        The parameter was not a string.
-    ValueError
-        The string was not of length 1.
+    int
+        The number of characters read.
     """
-    return _apply_diacritic(string, "ring_and_acute")
+    with open(path_in, "rb") as src, open(path_out, "wb") as dst:
+        return clean_stream(src, dst, chunk_size)
 
 
-def stroke_and_acute(string: str):
-    """Returns the given character with a stroke and acute diacritic.
+def _utf8_is_dense(tables, buffer):
+    # Every match costs a Python call, so once more than about 1 in 20 bytes
+    # starts a composed character it's quicker to decode, translate and
+    # encode again. The first few kilobytes are taken as a sample.
+    sample = len(tables.utf8_regex.findall(buffer, 0, 4096))
+    return sample * 20 > min(len(buffer), 4096)
 
-    This function only takes a string of length 1.
 
-    Parameters
-    ----------
-    string: str
-        The string to give the stroke and acute diacritic.
+def _clean_utf8_decoded(tables, buffer):
+    # surrogateescape lets invalid UTF-8 pass through untouched, as it does
+    # when working on the bytes.
+    text = str(buffer, "utf-8", "surrogateescape")
+    return text.translate(tables.translate).encode("utf-8", "surrogateescape")
 
-    Returns
-    -------
-    Character
-        The string with the stroke and acute diacritic.
-
-    Raises
-    ------
-    AccentError
-        The given string could not be given a stroke and acute diacritic.
-    TypeError
-        The parameter was not a string.
-    ValueError
-        The string was not of length 1.
-    """
-    return _apply_diacritic(string, "stroke_and_acute")
 
-# Aliases
-
-def diaresis(string: str):
-    """Returns the given character with a diaresis diacritic (umlaut).
-
-    This function only takes a string of length 1.
+def clean_utf8(buffer: _Union[bytes, bytearray, memoryview]) -> bytes:
+    """Cleans diacritics from UTF-8 encoded data, without decoding it.
 
     Parameters
     ----------
-    string: str
-        The string to give the diaresis diacritic.
+    buffer: bytes-like object
+        The UTF-8 data to clean accents from. Any object supporting the
+        buffer protocol is accepted.
 
     Returns
     -------
-    Character
-        The string with the diaresis diacritic.
-
-    Raises
-    ------
-    AccentError
-        The given string could not be given a diaresis diacritic.
-    TypeError
-        The parameter was not a string.
-    ValueError
-        The string was not of length 1.
+    bytes
+        The cleaned data. If nothing needed cleaning and a bytes object
+        was given, the same object is returned.
     """
-    return _apply_diacritic(string, "diaresis")
-
-def diaresis_and_macron(string: str):
-    """Returns the given character with a diaresis (umlaut) and macron diacritic.
-
-    This function only takes a string of length 1.
+    if not isinstance(buffer, (bytes, bytearray, memoryview)):
+        try:
+            memoryview(buffer).release()
+        except TypeError:
+            raise TypeError(
+                f"clean_utf8 function takes a bytes-like object, not {type(buffer).__name__}"
+            ) from None
 
-    Parameters
-    ----------
-    string: str
-        The string to give the diaresis and macron diacritic.
+    tables = _maps._diacritic_tables
+    if _utf8_is_dense(tables, buffer):
+        return _clean_utf8_decoded(tables, buffer)
 
-    Returns
-    -------
-    Character
-        The string with the diaresis and macron diacritic.
+    utf8_map = tables.utf8_map
+    return tables.utf8_regex.sub(lambda match: utf8_map[match.group()], buffer)
 
-    Raises
-    ------
-    AccentError
-        The given string could not be given a diaresis and macron diacritic.
-    TypeError
-        The parameter was not a string.
-    ValueError
-        The string was not of length 1.
-    """
-    return _apply_diacritic(string, "diaresis_and_macron")
 
+def clean_utf8_into(buffer: bytearray) -> int:
+    """Cleans diacritics from UTF-8 encoded data in place.
 
-def clean_diacritics(string: str) -> str:
-    """Returns the given string cleaned from diacritics.
+    Every composed character is replaced by its single byte base letter,
+    and the rest of the data is moved up, so the bytearray shrinks.
 
     Parameters
     ----------
-    string: Iterable
-        The string to clean accents from.
-    diacritics: Optional[List[str]]
-        The list of diacritics to clean. If not provided, all diacritics will be cleaned.
+    buffer: bytearray
+        The UTF-8 data to clean accents from.
 
     Returns
     -------
-    str
-        The cleaned string.
+    int
+        The new length of the buffer.
     """
-    if not isinstance(string, str):
-        raise TypeError(f"clean_diacritics function takes str, not {type(string).__name__}")
-
-    ret = []
-
-    for i in string:
-        if i in _diacritic_cleaner_map.keys():
-            ret.append(_diacritic_cleaner_map[i])
-        else:
-            ret.append(i)
+    if not isinstance(buffer, bytearray):
+        raise TypeError(f"clean_utf8_into function takes bytearray, not {type(buffer).__name__}")
+
+    tables = _maps._diacritic_tables
+    if _utf8_is_dense(tables, buffer):
+        buffer[:] = _clean_utf8_decoded(tables, buffer)
+        return len(buffer)
+
+    size = len(buffer)
+    read = write = 0
+    with memoryview(buffer) as view:
+        for match in tables.utf8_regex.finditer(buffer):
+            start, end = match.span()
+            if write != read:
+                view[write:write + start - read] = view[read:start]
+            write += start - read
+            base = tables.utf8_map[match.group()]
+            view[write:write + len(base)] = base
+            write += len(base)
+            read = end
+        if write != read:
+            view[write:write + size - read] = view[read:size]
+        write += size - read
+
+    del buffer[write:]
+    return write
 
-    return "".join(ret)
 
 def has_diacritics(string: _Iterable) -> bool:
     """Returns a bool as to whether the string contains diacritics.
@@ -649,10 +788,10 @@ def has_diacritics(string: _Iterable) -> bool:
     if not isinstance(string, str):
         raise TypeError(f"has_diacritics function takes str, not {type(string).__name__}")
 
-    for i in string:
-        if i in _diacritic_cleaner_map.keys():
-            return True
-    return False
+    if string.isascii():
+        return False
+
+    return _maps._diacritic_tables.regex.search(string) is not None
 
 def get_diacritic_name_from_character(chararcter: _Iterable) -> str:
     """Get the diacritic name from a character.
@@ -667,13 +806,78 @@ def get_diacritic_name_from_character(chararcter: _Iterable) -> str:
     Union[str, None]
         The diacritic name.
     """
-    if not chararcter in _diacritic_cleaner_map.keys():
+    entry = _maps._diacritic_tables.reverse.get(chararcter)
+    if entry is None:
         return
-    
-    for key in _diacritic_map.keys():
-        for v in _diacritic_map[key].values():
-            if chararcter.upper() == v:
-                return key
+
+    return entry[1][0]
+
+
+def lookup(character: str) -> _Optional[_Tuple[str, _Tuple[str, ...]]]:
+    """Get the base letter and diacritic names of a character.
+
+    Parameters
+    ----------
+    character: str
+        The character to look up.
+
+    Returns
+    -------
+    Optional[Tuple[str, Tuple[str, ...]]]
+        The base letter, in the same case as the character, and the name
+        of every diacritic which produces the character. None if the
+        character has no diacritic. A combining mark, such as U+0301, has
+        an empty base letter.
+    """
+    return _maps._diacritic_tables.reverse.get(character)
+
+
+def iter_diacritics(string: str) -> _Iterator[_Tuple[int, Character]]:
+    """Iterate over the diacritics in a string, from left to right.
+
+    The string is walked once, and nothing is kept between characters,
+    so this is suitable for very long strings. Decomposed characters, a
+    letter followed by combining marks, are found as one Character
+    holding the letter and its marks.
+
+    Parameters
+    ----------
+    string: str
+        The string to get the diacritics from.
+
+    Returns
+    -------
+    Iterator[Tuple[int, Character]]
+        The index of each character with a diacritic, and its
+        Character representation.
+    """
+    if not isinstance(string, str):
+        raise TypeError(f"iter_diacritics function takes str, not {type(string).__name__}")
+
+    return _iter_diacritics(string)
+
+
+def _iter_diacritics(string):
+    tables = _maps._diacritic_tables
+    reverse = tables.reverse
+    for match in tables.regex.finditer(string):
+        char = match.group()
+        entry = reverse.get(char)
+        if entry is not None and entry[0]:
+            yield match.start(), Character(char, entry[1][0])
+            continue
+        # Combining marks belong to the letter before them, which the pattern
+        # can't include without losing its quick scan for the first character.
+        start = match.start()
+        base, names = reverse[char[0]]
+        if not base and start and string[start - 1].isalpha():
+            start -= 1
+            char = string[start] + char
+        composed = tables.decomposed.get(char)
+        if composed is not None:
+            names = reverse[composed][1]
+        yield start, Character(char, names[0])
+
 
 def get_diacritics(string: _Iterable) -> _Dict[int, Character]:
     """Get all the diacritics from a string.
@@ -686,19 +890,14 @@ def get_diacritics(string: _Iterable) -> _Dict[int, Character]:
     Returns
     -------
     Dict[int, Character]
-        A dict with str.index as the key,
-        and Charaacter as the value.
+        A dict with the index of each diacritic as the key,
+        and Character as the value.
     """
     if not isinstance(string, str):
         raise TypeError(f"get_diacritics function takes str, not {type(string).__name__}")
 
-    ret = {}
+    return dict(_iter_diacritics(string))
 
-    for i in string:
-        if i in _diacritic_cleaner_map.keys():
-            ret[string.index(i)] = Character(i, get_diacritic_name_from_character(i))
-    
-    return ret
 
 def count_diacritics(string: _Iterable) -> int:
     """Returns a sum of all the characters with diacritics in a string.
@@ -713,7 +912,23 @@ def count_diacritics(string: _Iterable) -> int:
     int
         The number of diacritics.
     """
-    return len(get_diacritics(string))
+    if not isinstance(string, str):
+        raise TypeError(f"count_diacritics function takes str, not {type(string).__name__}")
+
+    if string.isascii():
+        return 0
+
+    return _count_diacritics(string)
+
+
+def _count_diacritics(string):
+    # Only the matches are counted, no Character objects are created.
+    count = 0
+    for _ in _maps._diacritic_tables.regex.finditer(string):
+        count += 1
+
+    return count
+
 
 def cantake(characters: _Iterable, diacritic: str) -> bool:
     """Returns whether all characters in the iterable can take the given diacritic.
@@ -731,9 +946,10 @@ def cantake(characters: _Iterable, diacritic: str) -> bool:
     if not isdiacritictype(diacritic):
         raise ValueError(f"'{diacritic}' is not a valid diacritic")
     
+    letters = _maps._diacritic_tables.map[diacritic]
     for c in characters:
         try:
-            _diacritic_map[diacritic][c.upper()]
+            letters[c.upper()]
         except KeyError:
             return False
     
@@ -756,4 +972,133 @@ def cantakelist(diacritic: str) -> _List[str]:
     """
     if not isdiacritictype(diacritic):
         raise ValueError(f"'{diacritic}' is not a valid diacritic")
-    return list(map(str.lower, _diacritic_map[diacritic].keys()))
\ No newline at end of file
+    return list(map(str.lower, _maps._diacritic_tables.map[diacritic].keys()))
+
+
+def _check_chunk(function, chunk):
+    for string in chunk:
+        if not isinstance(string, str):
+            raise TypeError(
+                f"{function} function takes an iterable of str, not {type(string).__name__}"
+            ) from None
+
+
+def _clean_chunk(chunk):
+    isascii = str.isascii
+    translate = str.translate
+    table = _maps._diacritic_tables.translate
+    try:
+        return [s if isascii(s) else translate(s, table) for s in chunk]
+    except TypeError:
+        _check_chunk("clean_many", chunk)
+        raise
+
+
+def _has_chunk(chunk):
+    isascii = str.isascii
+    search = _maps._diacritic_tables.regex.search
+    try:
+        return [not isascii(s) and search(s) is not None for s in chunk]
+    except TypeError:
+        _check_chunk("has_many", chunk)
+        raise
+
+
+def _count_chunk(chunk):
+    isascii = str.isascii
+    try:
+        return [0 if isascii(s) else _count_diacritics(s) for s in chunk]
+    except TypeError:
+        _check_chunk("count_many", chunk)
+        raise
+
+
+def clean_many(
+    strings: _Iterable[str], *, workers: _Optional[int] = None, chunksize: int = 1024
+) -> _Iterator[str]:
+    """Cleans diacritics from every string in an iterable.
+
+    The strings are processed in chunks, and the cleaned strings are
+    yielded in the same order as they were given.
+
+    Parameters
+    ----------
+    strings: Iterable[str]
+        The strings to clean accents from.
+    workers: Optional[int]
+        The number of worker processes to spread the chunks over.
+        If not provided, everything runs in the current process.
+    chunksize: int
+        The number of strings handled at once.
+
+    Returns
+    -------
+    Iterator[str]
+        The cleaned strings.
+    """
+    return _map_chunks(_clean_chunk, strings, workers, chunksize)
+
+
+def has_many(
+    strings: _Iterable[str], *, workers: _Optional[int] = None, chunksize: int = 1024
+) -> _Iterator[bool]:
+    """Checks every string in an iterable for diacritics.
+
+    Parameters
+    ----------
+    strings: Iterable[str]
+        The strings to check.
+    workers: Optional[int]
+        The number of worker processes to spread the chunks over.
+        If not provided, everything runs in the current process.
+    chunksize: int
+        The number of strings handled at once.
+
+    Returns
+    -------
+    Iterator[bool]
+        Whether each string has diacritics, in order.
+    """
+    return _map_chunks(_has_chunk, strings, workers, chunksize)
+
+
+def count_many(
+    strings: _Iterable[str], *, workers: _Optional[int] = None, chunksize: int = 1024
+) -> _Iterator[int]:
+    """Counts the diacritics in every string in an iterable.
+
+    Parameters
+    ----------
+    strings: Iterable[str]
+        The strings to count diacritics from.
+    workers: Optional[int]
+        The number of worker processes to spread the chunks over.
+        If not provided, everything runs in the current process.
+    chunksize: int
+        The number of strings handled at once.
+
+    Returns
+    -------
+    Iterator[int]
+        The number of diacritics in each string, in order.
+    """
+    return _map_chunks(_count_chunk, strings, workers, chunksize)
+
+
+# Lists the lazily created functions too, so star imports still include them.
+# Submodules, such as errors and objects, are left out, since the names
+# they hold are exported here already.
+__all__ = sorted(
+    {
+        name
+        for name, value in globals().items()
+        if not name.startswith("_") and not isinstance(value, _types.ModuleType)
+    }
+    | set(_diacritic_functions)
+)
+
+# Imported last, since it wraps the functions above.
+if _os.environ.get("DCL_INSTRUMENTATION", "0") != "0":
+    from . import instrumentation as _instrumentation
+
+    _instrumentation.enable()
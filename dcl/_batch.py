@@ -0,0 +1,48 @@
+from collections import deque
+from itertools import islice
+
+
+def _chunks(iterable, chunksize):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def map_chunks(func, iterable, workers, chunksize):
+    """Applies func to chunks of the iterable, yielding the results in order.
+
+    func takes a list and returns a list. When workers is given, the chunks
+    are spread over a process pool, with a bounded number of chunks in flight
+    so the iterable is still consumed lazily.
+    """
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be at least 1, not {workers}")
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, not {chunksize}")
+
+    if workers is None:
+        return _map_serial(func, iterable, chunksize)
+    return _map_pool(func, iterable, workers, chunksize)
+
+
+def _map_serial(func, iterable, chunksize):
+    for chunk in _chunks(iterable, chunksize):
+        yield from func(chunk)
+
+
+def _map_pool(func, iterable, workers, chunksize):
+    # Imported here, since concurrent.futures takes longer to import than the
+    # rest of dcl and most callers never use a pool.
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(workers) as executor:
+        pending = deque()
+        for chunk in _chunks(iterable, chunksize):
+            pending.append(executor.submit(func, chunk))
+            if len(pending) > workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
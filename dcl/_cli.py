@@ -0,0 +1,263 @@
+import argparse
+import io
+import os
+import sys
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+from . import (
+    __version__,
+    _clean_chunk,
+    _count_chunk,
+    _has_chunk,
+    _iter_diacritics,
+    _map_chunks,
+    clean_stream,
+)
+
+
+def _grep_chunk(chunk):
+    return [line for line, has in zip(chunk, _has_chunk(chunk)) if has]
+
+
+def _stats_chunk(chunk):
+    counter = Counter()
+    for line in chunk:
+        for _, char in _iter_diacritics(line):
+            counter[char.diacritic_name] += 1
+    return [counter]
+
+
+class _Reader:
+    """Yields the lines of every input in turn, counting the characters read."""
+
+    def __init__(self, files):
+        self.files = files
+        self.characters = 0
+        self.lines = 0
+
+    def __iter__(self):
+        for f in self.files:
+            for line in f:
+                self.characters += len(line)
+                self.lines += 1
+                yield line
+
+
+def _map_lines(func, args, reader):
+    workers = args.jobs if args.jobs > 1 else None
+    return _map_chunks(func, reader, workers, args.chunksize)
+
+
+def _clean(args, reader, out):
+    if args.jobs == 1:
+        # No need to split into lines, so very long lines are fine too.
+        for f in reader.files:
+            reader.characters += clean_stream(f, out)
+        return 0
+    for line in _map_lines(_clean_chunk, args, reader):
+        out.write(line.encode("utf-8"))
+    return 0
+
+
+def _has(args, reader, out):
+    found = False
+    for line in _map_lines(_grep_chunk, args, reader):
+        found = True
+        if args.quiet:
+            break
+        out.write(line.encode("utf-8"))
+    return 0 if found else 1
+
+
+def _count(args, reader, out):
+    total = 0
+    for count in _map_lines(_count_chunk, args, reader):
+        if args.lines:
+            out.write(f"{count}\n".encode("utf-8"))
+        total += count
+    if not args.lines:
+        out.write(f"{total}\n".encode("utf-8"))
+    return 0
+
+
+def _stats(args, reader, out):
+    counter = Counter()
+    for chunk_counter in _map_lines(_stats_chunk, args, reader):
+        counter.update(chunk_counter)
+    rows = [
+        ("characters", reader.characters),
+        ("lines", reader.lines),
+        ("diacritics", sum(counter.values())),
+    ]
+    rows.extend(sorted(counter.items(), key=lambda item: (-item[1], item[0])))
+    width = max(len(name) for name, _ in rows)
+    for name, value in rows:
+        out.write(f"{name:<{width}}  {value}\n".encode("utf-8"))
+    return 0
+
+
+class _Utf8Writer:
+    """Encodes text written to it as UTF-8, for the csv module to write to stdout."""
+
+    def __init__(self, out):
+        self.out = out
+
+    def write(self, text):
+        return self.out.write(text.encode("utf-8"))
+
+
+def _csv(args, reader, out):
+    from .csvtools import clean_columns
+
+    columns = args.columns
+    if not args.header:
+        try:
+            columns = [int(column) for column in columns]
+        except ValueError:
+            print("dcl csv: columns must be indexes with --no-header", file=sys.stderr)
+            return 2
+    fmtparams = {} if args.delimiter is None else {"delimiter": args.delimiter}
+    try:
+        clean_columns(
+            reader,
+            _Utf8Writer(out),
+            columns,
+            "excel-tab" if args.tsv else "excel",
+            header=args.header,
+            has_column=args.has_column,
+            count_column=args.count_column,
+            workers=args.jobs if args.jobs > 1 else None,
+            chunksize=args.chunksize,
+            **fmtparams,
+        )
+    except ValueError as error:
+        print(f"dcl csv: {error}", file=sys.stderr)
+        return 2
+    return 0
+
+
+_commands = {
+    "clean": (_clean, "Remove diacritics from the input."),
+    "has": (_has, "Print the lines which contain diacritics."),
+    "count": (_count, "Count the diacritics in the input."),
+    "stats": (_stats, "Summarise the diacritics found in the input."),
+    "csv": (_csv, "Remove diacritics from some columns of CSV input."),
+}
+
+
+def _positive_int(value):
+    jobs = int(value)
+    if jobs < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, not {jobs}")
+    return jobs
+
+
+def _parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m dcl", description="Diacritic tools for the command line."
+    )
+    parser.add_argument("--version", action="version", version=f"dcl {__version__}")
+    subparsers = parser.add_subparsers(dest="command", metavar="command", required=True)
+
+    for name, (func, help) in _commands.items():
+        sub = subparsers.add_parser(name, help=help, description=help)
+        sub.set_defaults(func=func)
+        sub.add_argument(
+            "files", nargs="*", metavar="FILE", help="UTF-8 files to read, standard input if none."
+        )
+        sub.add_argument(
+            "-j",
+            "--jobs",
+            type=_positive_int,
+            default=1,
+            metavar="N",
+            help="Split the input into blocks of lines across N processes. Output order is kept.",
+        )
+        sub.add_argument(
+            "--chunksize",
+            type=_positive_int,
+            default=1024,
+            metavar="N",
+            help="The number of lines in each block (default: %(default)s).",
+        )
+        sub.add_argument(
+            "--benchmark",
+            action="store_true",
+            help="Report the number of characters processed per second to standard error.",
+        )
+        if name == "has":
+            sub.add_argument(
+                "-q", "--quiet", action="store_true", help="Print nothing, only set the exit status."
+            )
+        if name == "count":
+            sub.add_argument(
+                "--lines", action="store_true", help="Print the count for each line instead of the total."
+            )
+        if name == "csv":
+            sub.add_argument(
+                "-c",
+                "--column",
+                action="append",
+                required=True,
+                dest="columns",
+                metavar="NAME",
+                help="A column to clean, by name, or by index from 0 with --no-header. Can be repeated.",
+            )
+            sub.add_argument(
+                "--no-header",
+                action="store_false",
+                dest="header",
+                help="The first row is data, not column names.",
+            )
+            sub.add_argument("--tsv", action="store_true", help="Read and write tab separated values.")
+            sub.add_argument("--delimiter", metavar="CHAR", help="The field delimiter, overriding --tsv.")
+            sub.add_argument(
+                "--has-column",
+                metavar="NAME",
+                help="Add a column of this name, saying whether each row had diacritics.",
+            )
+            sub.add_argument(
+                "--count-column",
+                metavar="NAME",
+                help="Add a column of this name, counting the diacritics in each row.",
+            )
+
+    return parser
+
+
+def main(argv=None):
+    args = _parser().parse_args(argv)
+    out = sys.stdout.buffer
+
+    with ExitStack() as stack:
+        if args.files:
+            files = [
+                stack.enter_context(open(path, encoding="utf-8", newline=""))
+                for path in args.files
+            ]
+        else:
+            files = [io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")]
+        reader = _Reader(files)
+
+        start = time.perf_counter()
+        try:
+            status = args.func(args, reader, out)
+            out.flush()
+        except BrokenPipeError:
+            # The reader went away, such as with `| head`. Point stdout at
+            # devnull so the interpreter doesn't fail flushing it at exit.
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            return 1
+        elapsed = time.perf_counter() - start
+
+    if args.benchmark:
+        rate = reader.characters / elapsed if elapsed else float("inf")
+        print(
+            f"dcl {args.command}: {reader.characters} characters in {elapsed:.3f}s "
+            f"({rate:,.0f} characters/s)",
+            file=sys.stderr,
+        )
+
+    return status
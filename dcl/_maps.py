@@ -1,3 +1,26 @@
+import re
+import sys
+from array import array
+from collections import namedtuple
+
+# The tables derived from _diacritic_map are generated ahead of time by
+# `python -m dcl._tablegen`, so none of them have to be built on import.
+from ._tables import (
+    _diacritic_apply_letters,
+    _diacritic_apply_map,
+    _diacritic_cleaner_map,
+    _diacritic_decomposed_map,
+    _diacritic_extended_entries,
+    _diacritic_fold_classes,
+    _diacritic_id_names,
+    _diacritic_latin_entries,
+    _diacritic_pattern,
+    _diacritic_reject_patterns,
+    _diacritic_reverse_map,
+    _diacritic_utf8_map,
+    _diacritic_utf8_pattern,
+)
+
 _diacritic_map = {
     "grave": {
         "A": "\u00c0", 
@@ -157,11 +180,6 @@ _diacritic_map = {
     }
 }
 
-_diacritic_cleaner_map = {}
-for val in _diacritic_map.values():
-    _diacritic_cleaner_map.update({v: k for k, v in val.items()})
-    _diacritic_cleaner_map.update({v.lower(): k.lower() for k, v in val.items()})
-
 _diacritic_char_map = {
     "circumflex": "\u02c6", 
     "caron": "\u02c7", 
@@ -177,4 +195,148 @@ _diacritic_char_map = {
     "interpunct": "\u00b7", 
     "double_acute": "\u02dd",
     "grave": "`"
-}
\ No newline at end of file
+}
+
+
+def _dense_table(mapping):
+    # Expands {character: replacement} into a list indexed by code point, for
+    # str.translate. A dict would be slower, because str.translate treats every
+    # failed lookup as a LookupError, which is costly for each unmapped
+    # character. Code points past the end of the list are left untouched.
+    table = list(range(max(map(ord, mapping)) + 1))
+    for k, v in mapping.items():
+        table[ord(k)] = v
+    return table
+
+
+def _class_pattern(chars):
+    # A regex character class matching any of the given single characters.
+    return "[" + "".join(sorted(chars)) + "]"
+
+
+def _resizing_regex(cleaner):
+    # Matches the characters which don't clean to exactly one character, so
+    # offsets into a cleaned string stop lining up with the original after
+    # them. These are the combining marks, which clean to nothing.
+    chars = [k for k, v in cleaner.items() if len(k) == 1 and len(v) != 1]
+    return re.compile(_class_pattern(chars)) if chars else None
+
+
+def _bytes_table(translate):
+    # Table used by bytes.translate to clean Latin-1 encoded text. It is many
+    # times quicker than str.translate, which looks up every character of a
+    # non-ASCII string one at a time. Every built in composed Latin-1
+    # character cleans to a single ASCII letter. A registered one may clean to
+    # a letter outside Latin-1, and then there is no table, so None is
+    # returned and str.translate is used instead.
+    try:
+        return bytes(entry if isinstance(entry, int) else ord(entry) for entry in translate[:256])
+    except (TypeError, ValueError):
+        return None
+
+
+# Every table derived from _diacritic_map, as one snapshot. Registering a
+# diacritic publishes a new snapshot by rebinding _diacritic_tables, and a
+# snapshot is never changed once it is published. Readers take
+# _diacritic_tables once, without locking, and always see a consistent set.
+_DiacriticTablesBase = namedtuple(
+    "_DiacriticTables",
+    (
+        # name -> {upper case letter: composed character}, and the symbol of
+        # each diacritic, as in _diacritic_map and _diacritic_char_map.
+        "map",
+        "char_map",
+        # The names of the diacritics added by register_diacritic, in order.
+        "registered",
+        # Composed character -> base letter, and -> (base letter, names).
+        # Combining marks standing for a diacritic are included, with an
+        # empty base letter.
+        "cleaner",
+        "reverse",
+        # Decomposed form -> composed character, such as "e\u0301" -> "é".
+        "decomposed",
+        # (letter, name) -> composed character.
+        "apply",
+        # name -> str.translate table giving the diacritic to every letter
+        # which can take it, and a pattern matching the letters which can't.
+        "apply_tables",
+        "reject_patterns",
+        # Tables used by str.translate and bytes.translate to clean a string
+        # in one pass, and a regex matching characters which resize. The
+        # bytes table is None when Latin-1 text can't be cleaned to Latin-1.
+        "translate",
+        "bytes_table",
+        "resizing_regex",
+        # Character class matching any composed character or combining mark,
+        # with the marks following it, used to jump straight from one
+        # diacritic to the next at C speed, and the same for UTF-8 data.
+        "pattern",
+        "regex",
+        "utf8_map",
+        "utf8_pattern",
+        "utf8_regex",
+        # base letter -> character class matching it and everything which
+        # cleans to it.
+        "fold_classes",
+        # Compact tables over the Latin ranges every built in composed
+        # character falls in, U+00C0 to U+01FF and U+1E00 to U+1EFF, indexed
+        # by code point minus the start of the range. Each entry holds the
+        # base letter in its low byte and a diacritic id in its high byte,
+        # with 0 meaning no diacritic. An id indexes id_names, the names of
+        # every diacritic producing the character, or None for an id freed
+        # by unregister_diacritic. A registered letter whose base is outside
+        # Latin-1 has no entry. These are meant for vectorised lookups, such
+        # as in dcl.numpy. For a single character, reverse is quicker, since
+        # str hashes are cached.
+        "latin",
+        "extended",
+        "id_names",
+    ),
+)
+
+
+class _DiacriticTables(_DiacriticTablesBase):
+    # Compared and hashed by identity, so a snapshot can key a cache of
+    # tables derived from it.
+    __slots__ = ()
+    __eq__ = object.__eq__
+    __ne__ = object.__ne__
+    __hash__ = object.__hash__
+
+
+def _initial_tables():
+    translate = _dense_table({k: v for k, v in _diacritic_cleaner_map.items() if len(k) == 1})
+    latin = array("H", _diacritic_latin_entries)
+    extended = array("H", _diacritic_extended_entries)
+    if sys.byteorder == "big":
+        latin.byteswap()
+        extended.byteswap()
+
+    return _DiacriticTables(
+        map=_diacritic_map,
+        char_map=_diacritic_char_map,
+        registered=(),
+        cleaner=_diacritic_cleaner_map,
+        reverse=_diacritic_reverse_map,
+        decomposed=_diacritic_decomposed_map,
+        apply=_diacritic_apply_map,
+        apply_tables={
+            key: _dense_table(letters) for key, letters in _diacritic_apply_letters.items()
+        },
+        reject_patterns=_diacritic_reject_patterns,
+        translate=translate,
+        bytes_table=_bytes_table(translate),
+        resizing_regex=_resizing_regex(_diacritic_cleaner_map),
+        pattern=_diacritic_pattern,
+        regex=re.compile(_diacritic_pattern),
+        utf8_map=_diacritic_utf8_map,
+        utf8_pattern=_diacritic_utf8_pattern,
+        utf8_regex=re.compile(_diacritic_utf8_pattern),
+        fold_classes=_diacritic_fold_classes,
+        latin=latin,
+        extended=extended,
+        id_names=_diacritic_id_names,
+    )
+
+
+_diacritic_tables = _initial_tables()
@@ -0,0 +1,268 @@
+"""Adds and removes diacritics at runtime, by publishing a new snapshot of the tables.
+
+Only the entries a diacritic touches are changed. Every other table is shared
+with the previous snapshot, which is never modified, so readers holding it are
+unaffected. This module is imported on the first registration, so importing
+dcl doesn't pay for the lock.
+"""
+
+import re
+import threading
+from array import array
+
+from . import _maps
+from ._tablegen import build_marks, build_pattern, build_utf8_pattern
+
+# Held while a new snapshot is built from the current one and published, so
+# two registrations at once can't lose each other's changes.
+lock = threading.Lock()
+
+
+def _pairs(letters):
+    # Each composed character with its base letter, in both cases.
+    for base, char in letters.items():
+        yield char, base
+        yield char.lower(), base.lower()
+
+
+def _compact_slot(latin, extended, char):
+    # The compact table and index holding a character, if it falls in one of
+    # the ranges they cover.
+    code = ord(char)
+    if 0xC0 <= code < 0x200:
+        return latin, code - 0xC0
+    if 0x1E00 <= code < 0x1F00:
+        return extended, code - 0x1E00
+    return None, 0
+
+
+def _finish(tables, changed):
+    # Rebuilds what depends on the characters whose entries changed: the
+    # compiled regexes, the bytes table and the compact tables.
+    if any(ord(char) < 256 for char in changed):
+        tables = tables._replace(bytes_table=_maps._bytes_table(tables.translate))
+
+    latin = array("H", tables.latin)
+    extended = array("H", tables.extended)
+    slots = []
+    for char in changed:
+        target, index = _compact_slot(latin, extended, char)
+        if target is not None:
+            target[index] = 0
+            slots.append((target, index, char))
+
+    # Ids no entry refers to any more are freed, so they can be given out
+    # again and the ids of a long running process stay below 256. Freed ids
+    # at the end are dropped.
+    used = {entry >> 8 for entry in latin} | {entry >> 8 for entry in extended}
+    id_names = [names if ident in used else None for ident, names in enumerate(tables.id_names)]
+    id_names[0] = ()
+    for target, index, char in slots:
+        entry = tables.reverse.get(char)
+        if entry is None:
+            continue
+        base, names = entry
+        # Letters whose base is outside Latin-1 have no compact entry, and
+        # dcl.numpy takes them from reverse instead.
+        if not base or ord(base) >= 256:
+            continue
+        if names not in id_names:
+            if None in id_names:
+                id_names[id_names.index(None)] = names
+            else:
+                id_names.append(names)
+        ident = id_names.index(names)
+        if ident >= 256:
+            raise ValueError("too many diacritics are registered for the compact tables")
+        target[index] = ident << 8 | ord(base)
+    while id_names[-1] is None:
+        id_names.pop()
+
+    return tables._replace(
+        regex=re.compile(tables.pattern),
+        utf8_regex=re.compile(tables.utf8_pattern),
+        latin=latin,
+        extended=extended,
+        id_names=tuple(id_names),
+    )
+
+
+def add_diacritic(tables, name, letters, symbol):
+    """Returns a new snapshot with the diacritic added.
+
+    letters maps upper case base letters to their composed upper case
+    characters, and has been validated already.
+    """
+    diacritic_map = dict(tables.map)
+    diacritic_map[name] = dict(letters)
+    char_map = tables.char_map
+    if symbol is not None:
+        char_map = dict(char_map)
+        char_map[name] = symbol
+
+    cleaner = dict(tables.cleaner)
+    reverse = dict(tables.reverse)
+    apply_map = dict(tables.apply)
+    applied = {}
+    for char, base in _pairs(letters):
+        cleaner[char] = base
+        entry = reverse.get(char)
+        reverse[char] = (base, (name,)) if entry is None else (entry[0], entry[1] + (name,))
+        apply_map[base, name] = applied[base] = char
+
+    apply_tables = dict(tables.apply_tables)
+    apply_tables[name] = _maps._dense_table(applied)
+    reject_patterns = dict(tables.reject_patterns)
+    reject_patterns[name] = "[^" + "".join(sorted(applied)) + "]"
+
+    # Characters new to the tables. The rest already clean to the same base
+    # letter, which add_diacritic's caller checks.
+    added = sorted({char for char, _ in _pairs(letters) if len(char) == 1} - set(tables.cleaner))
+
+    # New characters are found in decomposed text too, and a combining mark
+    # dcl doesn't know yet is taken to stand for this diacritic.
+    decomposed, marks = build_marks(added, reverse)
+    marks = {mark: (name,) for mark in marks if mark not in cleaner}
+    if decomposed:
+        decomposed = {**tables.decomposed, **decomposed}
+    else:
+        decomposed = tables.decomposed
+    for mark in sorted(marks):
+        cleaner[mark] = ""
+        reverse[mark] = ("", (name,))
+        added.append(mark)
+
+    translate = tables.translate
+    pattern = tables.pattern
+    utf8_map = tables.utf8_map
+    utf8_pattern = tables.utf8_pattern
+    fold_classes = tables.fold_classes
+    if added:
+        translate = list(translate)
+        size = max(map(ord, added)) + 1
+        if size > len(translate):
+            translate.extend(range(len(translate), size))
+
+        new_utf8 = {}
+        fold_classes = dict(fold_classes)
+        for char in added:
+            base = cleaner[char]
+            translate[ord(char)] = base
+            new_utf8[char.encode("utf-8")] = base.encode("utf-8")
+            if base:
+                fold_classes[base] = fold_classes.get(base, "[" + base + "]")[:-1] + char + "]"
+
+        pattern = build_pattern(cleaner)
+        utf8_map = dict(utf8_map)
+        utf8_map.update(new_utf8)
+        utf8_pattern = utf8_pattern + b"|" + build_utf8_pattern(new_utf8)
+
+    tables = tables._replace(
+        map=diacritic_map,
+        char_map=char_map,
+        registered=tables.registered + (name,),
+        cleaner=cleaner,
+        reverse=reverse,
+        decomposed=decomposed,
+        apply=apply_map,
+        apply_tables=apply_tables,
+        reject_patterns=reject_patterns,
+        translate=translate,
+        resizing_regex=_maps._resizing_regex(cleaner) if marks else tables.resizing_regex,
+        pattern=pattern,
+        utf8_map=utf8_map,
+        utf8_pattern=utf8_pattern,
+        fold_classes=fold_classes,
+    )
+    return _finish(tables, [char for char, _ in _pairs(letters) if len(char) == 1])
+
+
+def remove_diacritic(tables, name):
+    """Returns a new snapshot without the registered diacritic."""
+    letters = tables.map[name]
+    diacritic_map = dict(tables.map)
+    del diacritic_map[name]
+    char_map = tables.char_map
+    if name in char_map:
+        char_map = dict(char_map)
+        del char_map[name]
+
+    cleaner = dict(tables.cleaner)
+    reverse = dict(tables.reverse)
+    apply_map = dict(tables.apply)
+    removed = []
+    for char, base in _pairs(letters):
+        apply_map.pop((base, name), None)
+        entry = reverse.get(char)
+        if entry is None or name not in entry[1]:
+            continue
+        names = tuple(n for n in entry[1] if n != name)
+        if names:
+            reverse[char] = (entry[0], names)
+        else:
+            del reverse[char], cleaner[char]
+            if len(char) == 1:
+                removed.append(char)
+
+    # The combining marks only this diacritic stood for go with it.
+    marks = [k for k, v in reverse.items() if v == ("", (name,))]
+    for mark in marks:
+        del reverse[mark], cleaner[mark]
+        removed.append(mark)
+    decomposed = tables.decomposed
+    if removed:
+        gone = set(removed)
+        decomposed = {k: v for k, v in decomposed.items() if v not in gone}
+
+    apply_tables = dict(tables.apply_tables)
+    del apply_tables[name]
+    reject_patterns = dict(tables.reject_patterns)
+    del reject_patterns[name]
+
+    translate = tables.translate
+    pattern = tables.pattern
+    utf8_map = tables.utf8_map
+    utf8_pattern = tables.utf8_pattern
+    fold_classes = tables.fold_classes
+    if removed:
+        translate = list(translate)
+        utf8_map = dict(utf8_map)
+        fold_classes = dict(fold_classes)
+        for char in removed:
+            translate[ord(char)] = ord(char)
+            base = tables.cleaner[char]
+            del utf8_map[char.encode("utf-8")]
+            if not base:
+                continue
+            fold_class = fold_classes[base].replace(char, "")
+            if fold_class == "[" + base + "]":
+                del fold_classes[base]
+            else:
+                fold_classes[base] = fold_class
+
+        # Entries past the last character cleaned were only added for the
+        # removed ones, so the table goes back to its previous length.
+        while translate and translate[-1] == len(translate) - 1:
+            translate.pop()
+
+        pattern = build_pattern(cleaner)
+        utf8_pattern = build_utf8_pattern(utf8_map)
+
+    tables = tables._replace(
+        map=diacritic_map,
+        char_map=char_map,
+        registered=tuple(n for n in tables.registered if n != name),
+        cleaner=cleaner,
+        reverse=reverse,
+        decomposed=decomposed,
+        apply=apply_map,
+        apply_tables=apply_tables,
+        reject_patterns=reject_patterns,
+        translate=translate,
+        resizing_regex=_maps._resizing_regex(cleaner) if marks else tables.resizing_regex,
+        pattern=pattern,
+        utf8_map=utf8_map,
+        utf8_pattern=utf8_pattern,
+        fold_classes=fold_classes,
+    )
+    return _finish(tables, [char for char, _ in _pairs(letters) if len(char) == 1])
@@ -0,0 +1,218 @@
+"""Generates dcl/_tables.py, the lookup tables derived from _diacritic_map.
+
+The tables are precomputed so that importing dcl doesn't have to build them.
+After changing _diacritic_map, regenerate them with
+
+    python -m dcl._tablegen
+
+and check that the generated module is up to date with
+
+    python -m dcl._tablegen --check
+"""
+
+import argparse
+import os
+import re
+import sys
+import unicodedata
+from array import array
+
+_HEADER = '''\
+# Generated by `python -m dcl._tablegen` from _diacritic_map in _maps.py.
+# Do not edit by hand, regenerate it instead.
+'''
+
+
+def build_utf8_pattern(utf8_map):
+    """Builds a bytes pattern matching any key of utf8_map, grouped by leading bytes."""
+    last_bytes = {}
+    for k in sorted(utf8_map):
+        last_bytes.setdefault(k[:-1], []).append(k[-1:])
+    return b"|".join(
+        re.escape(lead) + b"[" + b"".join(map(re.escape, last)) + b"]"
+        for lead, last in last_bytes.items()
+    )
+
+
+def build_pattern(cleaner):
+    """Builds a pattern matching a composed character or combining mark, and any marks after it."""
+    single = sorted(k for k in cleaner if len(k) == 1)
+    marks = [k for k in single if not cleaner[k]]
+    pattern = "[" + "".join(single) + "]"
+    if marks:
+        pattern += "[" + "".join(marks) + "]*"
+    return pattern
+
+
+def build_marks(chars, reverse):
+    """Finds the decomposed form of each composed character, and the combining marks standing for a diacritic.
+
+    Returns the decomposed forms mapped to their composed characters, and
+    each combining mark which follows a letter on its own mapped to the
+    names of the diacritics of the first character it was found in.
+    """
+    decomposed = {}
+    marks = {}
+    for char in chars:
+        nfd = unicodedata.normalize("NFD", char)
+        if len(nfd) == 1:
+            continue
+        decomposed[nfd] = char
+        if len(nfd) == 2:
+            marks.setdefault(nfd[1], reverse[char][1])
+    return decomposed, marks
+
+
+def build_tables(diacritic_map):
+    """Builds every derived table from a diacritic map, keyed by the name it is stored as."""
+    cleaner = {}
+    for val in diacritic_map.values():
+        cleaner.update({v: k for k, v in val.items()})
+        cleaner.update({v.lower(): k.lower() for k, v in val.items()})
+
+    # Each composed character, in both cases, to its base letter and the names
+    # of every diacritic which produces it, in _diacritic_map order.
+    reverse = {}
+    for key, val in diacritic_map.items():
+        for k, v in val.items():
+            for char, base in ((v, k), (v.lower(), k.lower())):
+                if char in reverse:
+                    reverse[char] = (reverse[char][0], reverse[char][1] + (key,))
+                else:
+                    reverse[char] = (base, (key,))
+
+    # Decomposed text, as on macOS file systems, spells "é" as "e" followed by
+    # U+0301. Each combining mark standing for a diacritic cleans to nothing,
+    # and has no base letter.
+    decomposed, marks = build_marks([k for k in reverse if len(k) == 1], reverse)
+    for mark, names in sorted(marks.items()):
+        cleaner[mark] = ""
+        reverse[mark] = ("", names)
+
+    # Every letter, in both cases, keyed with each diacritic it can take, and
+    # the same grouped by diacritic.
+    apply_map = {}
+    apply_letters = {}
+    for key, val in diacritic_map.items():
+        letters = apply_letters[key] = {}
+        for k, v in val.items():
+            apply_map[k, key] = letters[k] = v
+            apply_map[k.lower(), key] = letters[k.lower()] = v.lower()
+
+    # A character class matching any character which can't take each diacritic.
+    reject_patterns = {
+        key: "[^" + "".join(sorted(letters)) + "]" for key, letters in apply_letters.items()
+    }
+
+    # str.translate and re can only work on single code points, which rules
+    # out the lower case form of "İ" (it lowers to "i" followed by U+0307).
+    single = {k: v for k, v in cleaner.items() if len(k) == 1}
+    pattern = build_pattern(cleaner)
+
+    # A character class for every letter, matching it and each character which
+    # cleans to it, used to search for a cleaned string in the original.
+    preimages = {}
+    for k, v in single.items():
+        if v:
+            preimages.setdefault(v, []).append(k)
+    fold_classes = {
+        base: "[" + base + "".join(sorted(chars)) + "]" for base, chars in sorted(preimages.items())
+    }
+
+    # The UTF-8 encoding of every composed character, mapped to its base letter.
+    # All of them are two or three bytes long, and UTF-8 is prefix free, so the
+    # pattern matches them by their leading bytes followed by a class of the
+    # possible last bytes.
+    utf8_map = {k.encode("utf-8"): v.encode("utf-8") for k, v in single.items()}
+    utf8_pattern = build_utf8_pattern(utf8_map)
+
+    # Compact tables over U+00C0 to U+01FF and U+1E00 to U+1EFF. Each entry
+    # holds the base letter in its low byte and a diacritic id in its high
+    # byte, stored little endian.
+    id_names = [()]
+    latin = array("H", bytes(2 * 0x140))
+    extended = array("H", bytes(2 * 0x100))
+    for char, (base, names) in reverse.items():
+        if len(char) != 1 or not base:
+            continue
+        if names not in id_names:
+            id_names.append(names)
+        code = ord(char)
+        entry = id_names.index(names) << 8 | ord(base)
+        if 0xC0 <= code < 0x200:
+            latin[code - 0xC0] = entry
+        elif 0x1E00 <= code < 0x1F00:
+            extended[code - 0x1E00] = entry
+    if sys.byteorder == "big":
+        latin.byteswap()
+        extended.byteswap()
+
+    return {
+        "_diacritic_cleaner_map": cleaner,
+        "_diacritic_reverse_map": reverse,
+        "_diacritic_apply_map": apply_map,
+        "_diacritic_apply_letters": apply_letters,
+        "_diacritic_reject_patterns": reject_patterns,
+        "_diacritic_pattern": pattern,
+        "_diacritic_decomposed_map": decomposed,
+        "_diacritic_fold_classes": fold_classes,
+        "_diacritic_utf8_map": utf8_map,
+        "_diacritic_utf8_pattern": utf8_pattern,
+        "_diacritic_id_names": tuple(id_names),
+        "_diacritic_latin_entries": latin.tobytes(),
+        "_diacritic_extended_entries": extended.tobytes(),
+    }
+
+
+def _format(value, indent=""):
+    inner = indent + "    "
+    if isinstance(value, dict):
+        lines = [f"{inner}{ascii(k)}: {_format(v, inner)},\n" for k, v in value.items()]
+        return "{\n" + "".join(lines) + indent + "}"
+    if isinstance(value, (bytes, str)) and len(value) > 64:
+        lines = [f"{inner}{ascii(value[i:i + 64])}\n" for i in range(0, len(value), 64)]
+        return "(\n" + "".join(lines) + indent + ")"
+    return ascii(value)
+
+
+def render(tables):
+    """Renders the source of the generated module."""
+    return _HEADER + "".join(f"\n{name} = {_format(value)}\n" for name, value in tables.items())
+
+
+def _path():
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "_tables.py")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m dcl._tablegen", description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--check", action="store_true", help="Exit with status 1 if _tables.py is out of date."
+    )
+    args = parser.parse_args(argv)
+
+    from ._maps import _diacritic_map
+
+    source = render(build_tables(_diacritic_map))
+    path = _path()
+
+    if args.check:
+        try:
+            with open(path, encoding="ascii") as f:
+                current = f.read()
+        except FileNotFoundError:
+            current = None
+        if current != source:
+            print(f"{path} is out of date, run `python -m dcl._tablegen`", file=sys.stderr)
+            return 1
+        print(f"{path} is up to date")
+        return 0
+
+    with open(path, "w", encoding="ascii") as f:
+        f.write(source)
+    print(f"wrote {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
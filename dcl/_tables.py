@@ -0,0 +1,1503 @@
+# Generated by `python -m dcl._tablegen` from _diacritic_map in _maps.py.
+# Do not edit by hand, regenerate it instead.
+
+_diacritic_cleaner_map = {
+    '\xc0': 'A',
+    '\xc8': 'E',
+    '\xcc': 'I',
+    '\xd2': 'O',
+    '\xd9': 'U',
+    '\u1e80': 'W',
+    '\u1ef2': 'Y',
+    '\xe0': 'a',
+    '\xe8': 'e',
+    '\xec': 'i',
+    '\xf2': 'o',
+    '\xf9': 'u',
+    '\u1e81': 'w',
+    '\u1ef3': 'y',
+    '\xc1': 'A',
+    '\u0106': 'C',
+    '\xc9': 'E',
+    '\u01f4': 'G',
+    '\xcd': 'I',
+    '\u1e30': 'K',
+    '\u0139': 'L',
+    '\u0143': 'N',
+    '\xd3': 'O',
+    '\u0154': 'R',
+    '\u015a': 'S',
+    '\xda': 'U',
+    '\u1e82': 'W',
+    '\xdd': 'Y',
+    '\u0179': 'Z',
+    '\xe1': 'a',
+    '\u0107': 'c',
+    '\xe9': 'e',
+    '\u01f5': 'g',
+    '\xed': 'i',
+    '\u1e31': 'k',
+    '\u013a': 'l',
+    '\u0144': 'n',
+    '\xf3': 'o',
+    '\u0155': 'r',
+    '\u015b': 's',
+    '\xfa': 'u',
+    '\u1e83': 'w',
+    '\xfd': 'y',
+    '\u017a': 'z',
+    '\u0150': 'O',
+    '\u0170': 'U',
+    '\u0151': 'o',
+    '\u0171': 'u',
+    '\xc2': 'A',
+    '\xca': 'E',
+    '\u011c': 'G',
+    '\u0124': 'H',
+    '\xce': 'I',
+    '\u0134': 'J',
+    '\xd4': 'O',
+    '\u015c': 'S',
+    '\xdb': 'U',
+    '\u0174': 'W',
+    '\u0176': 'Y',
+    '\xe2': 'a',
+    '\xea': 'e',
+    '\u011d': 'g',
+    '\u0125': 'h',
+    '\xee': 'i',
+    '\u0135': 'j',
+    '\xf4': 'o',
+    '\u015d': 's',
+    '\xfb': 'u',
+    '\u0175': 'w',
+    '\u0177': 'y',
+    '\xc3': 'A',
+    '\u0128': 'I',
+    '\xd1': 'N',
+    '\xd5': 'O',
+    '\u0168': 'U',
+    '\xe3': 'a',
+    '\u0129': 'i',
+    '\xf1': 'n',
+    '\xf5': 'o',
+    '\u0169': 'u',
+    '\xc4': 'A',
+    '\xcb': 'E',
+    '\xcf': 'I',
+    '\xd6': 'O',
+    '\xdc': 'U',
+    '\u1e84': 'W',
+    '\u0178': 'Y',
+    '\xe4': 'a',
+    '\xeb': 'e',
+    '\xef': 'i',
+    '\xf6': 'o',
+    '\xfc': 'u',
+    '\u1e85': 'w',
+    '\xff': 'y',
+    '\xc5': 'A',
+    '\u016e': 'U',
+    '\xe5': 'a',
+    '\u016f': 'u',
+    '\xc7': 'C',
+    '\u1e10': 'D',
+    '\u0122': 'G',
+    '\u0136': 'K',
+    '\u013b': 'L',
+    '\u0145': 'N',
+    '\u0156': 'R',
+    '\u015e': 'S',
+    '\u0162': 'T',
+    '\xe7': 'c',
+    '\u1e11': 'd',
+    '\u0123': 'g',
+    '\u0137': 'k',
+    '\u013c': 'l',
+    '\u0146': 'n',
+    '\u0157': 'r',
+    '\u015f': 's',
+    '\u0163': 't',
+    '\u010c': 'C',
+    '\u010e': 'D',
+    '\u011a': 'E',
+    '\u01e6': 'G',
+    '\u01e8': 'K',
+    '\u013d': 'L',
+    '\u0147': 'N',
+    '\u0158': 'R',
+    '\u0160': 'S',
+    '\u0164': 'T',
+    '\u017d': 'Z',
+    '\u010d': 'c',
+    '\u010f': 'd',
+    '\u011b': 'e',
+    '\u01e7': 'g',
+    '\u01e9': 'k',
+    '\u013e': 'l',
+    '\u0148': 'n',
+    '\u0159': 'r',
+    '\u0161': 's',
+    '\u0165': 't',
+    '\u017e': 'z',
+    '\xd8': 'O',
+    '\u0141': 'L',
+    '\xf8': 'o',
+    '\u0142': 'l',
+    '\u0104': 'A',
+    '\u0118': 'E',
+    '\u012e': 'I',
+    '\u0172': 'U',
+    '\u0105': 'a',
+    '\u0119': 'e',
+    '\u012f': 'i',
+    '\u0173': 'u',
+    '\u0100': 'A',
+    '\u0112': 'E',
+    '\u012a': 'I',
+    '\u014c': 'O',
+    '\u016a': 'U',
+    '\u0101': 'a',
+    '\u0113': 'e',
+    '\u012b': 'i',
+    '\u014d': 'o',
+    '\u016b': 'u',
+    '\u0102': 'A',
+    '\u0114': 'E',
+    '\u011e': 'G',
+    '\u012c': 'I',
+    '\u014e': 'O',
+    '\u016c': 'U',
+    '\u0103': 'a',
+    '\u0115': 'e',
+    '\u011f': 'g',
+    '\u012d': 'i',
+    '\u014f': 'o',
+    '\u016d': 'u',
+    '\u1e02': 'B',
+    '\u010a': 'C',
+    '\u1e0a': 'D',
+    '\u0116': 'E',
+    '\u1e1e': 'F',
+    '\u0120': 'G',
+    '\u0130': 'I',
+    '\u1e40': 'M',
+    '\u1e56': 'P',
+    '\u1e60': 'S',
+    '\u1e6a': 'T',
+    '\u017b': 'Z',
+    '\u1e03': 'b',
+    '\u010b': 'c',
+    '\u1e0b': 'd',
+    '\u0117': 'e',
+    '\u1e1f': 'f',
+    '\u0121': 'g',
+    'i\u0307': 'i',
+    '\u1e41': 'm',
+    '\u1e57': 'p',
+    '\u1e61': 's',
+    '\u1e6b': 't',
+    '\u017c': 'z',
+    '\u0110': 'D',
+    '\u01e4': 'G',
+    '\u0126': 'H',
+    '\u0166': 'T',
+    '\u0111': 'd',
+    '\u01e5': 'g',
+    '\u0127': 'h',
+    '\u0167': 't',
+    '\u013f': 'L',
+    '\u0140': 'l',
+    '\u01de': 'A',
+    '\u01df': 'a',
+    '\u01fa': 'A',
+    '\u01fb': 'a',
+    '\u01fe': 'O',
+    '\u01ff': 'o',
+    '\u0300': '',
+    '\u0301': '',
+    '\u0302': '',
+    '\u0303': '',
+    '\u0304': '',
+    '\u0306': '',
+    '\u0307': '',
+    '\u0308': '',
+    '\u030a': '',
+    '\u030b': '',
+    '\u030c': '',
+    '\u0327': '',
+    '\u0328': '',
+}
+
+_diacritic_reverse_map = {
+    '\xc0': ('A', ('grave',)),
+    '\xe0': ('a', ('grave',)),
+    '\xc8': ('E', ('grave',)),
+    '\xe8': ('e', ('grave',)),
+    '\xcc': ('I', ('grave',)),
+    '\xec': ('i', ('grave',)),
+    '\xd2': ('O', ('grave',)),
+    '\xf2': ('o', ('grave',)),
+    '\xd9': ('U', ('grave',)),
+    '\xf9': ('u', ('grave',)),
+    '\u1e80': ('W', ('grave',)),
+    '\u1e81': ('w', ('grave',)),
+    '\u1ef2': ('Y', ('grave',)),
+    '\u1ef3': ('y', ('grave',)),
+    '\xc1': ('A', ('acute',)),
+    '\xe1': ('a', ('acute',)),
+    '\u0106': ('C', ('acute',)),
+    '\u0107': ('c', ('acute',)),
+    '\xc9': ('E', ('acute',)),
+    '\xe9': ('e', ('acute',)),
+    '\u01f4': ('G', ('acute',)),
+    '\u01f5': ('g', ('acute',)),
+    '\xcd': ('I', ('acute',)),
+    '\xed': ('i', ('acute',)),
+    '\u1e30': ('K', ('acute',)),
+    '\u1e31': ('k', ('acute',)),
+    '\u0139': ('L', ('acute',)),
+    '\u013a': ('l', ('acute',)),
+    '\u0143': ('N', ('acute',)),
+    '\u0144': ('n', ('acute',)),
+    '\xd3': ('O', ('acute',)),
+    '\xf3': ('o', ('acute',)),
+    '\u0154': ('R', ('acute',)),
+    '\u0155': ('r', ('acute',)),
+    '\u015a': ('S', ('acute',)),
+    '\u015b': ('s', ('acute',)),
+    '\xda': ('U', ('acute',)),
+    '\xfa': ('u', ('acute',)),
+    '\u1e82': ('W', ('acute',)),
+    '\u1e83': ('w', ('acute',)),
+    '\xdd': ('Y', ('acute',)),
+    '\xfd': ('y', ('acute',)),
+    '\u0179': ('Z', ('acute',)),
+    '\u017a': ('z', ('acute',)),
+    '\u0150': ('O', ('double_acute',)),
+    '\u0151': ('o', ('double_acute',)),
+    '\u0170': ('U', ('double_acute',)),
+    '\u0171': ('u', ('double_acute',)),
+    '\xc2': ('A', ('circumflex',)),
+    '\xe2': ('a', ('circumflex',)),
+    '\xca': ('E', ('circumflex',)),
+    '\xea': ('e', ('circumflex',)),
+    '\u011c': ('G', ('circumflex',)),
+    '\u011d': ('g', ('circumflex',)),
+    '\u0124': ('H', ('circumflex',)),
+    '\u0125': ('h', ('circumflex',)),
+    '\xce': ('I', ('circumflex',)),
+    '\xee': ('i', ('circumflex',)),
+    '\u0134': ('J', ('circumflex',)),
+    '\u0135': ('j', ('circumflex',)),
+    '\xd4': ('O', ('circumflex',)),
+    '\xf4': ('o', ('circumflex',)),
+    '\u015c': ('S', ('circumflex',)),
+    '\u015d': ('s', ('circumflex',)),
+    '\xdb': ('U', ('circumflex',)),
+    '\xfb': ('u', ('circumflex',)),
+    '\u0174': ('W', ('circumflex',)),
+    '\u0175': ('w', ('circumflex',)),
+    '\u0176': ('Y', ('circumflex',)),
+    '\u0177': ('y', ('circumflex',)),
+    '\xc3': ('A', ('tilde',)),
+    '\xe3': ('a', ('tilde',)),
+    '\u0128': ('I', ('tilde',)),
+    '\u0129': ('i', ('tilde',)),
+    '\xd1': ('N', ('tilde',)),
+    '\xf1': ('n', ('tilde',)),
+    '\xd5': ('O', ('tilde',)),
+    '\xf5': ('o', ('tilde',)),
+    '\u0168': ('U', ('tilde',)),
+    '\u0169': ('u', ('tilde',)),
+    '\xc4': ('A', ('umlaut', 'diaresis')),
+    '\xe4': ('a', ('umlaut', 'diaresis')),
+    '\xcb': ('E', ('umlaut', 'diaresis')),
+    '\xeb': ('e', ('umlaut', 'diaresis')),
+    '\xcf': ('I', ('umlaut', 'diaresis')),
+    '\xef': ('i', ('umlaut', 'diaresis')),
+    '\xd6': ('O', ('umlaut', 'diaresis')),
+    '\xf6': ('o', ('umlaut', 'diaresis')),
+    '\xdc': ('U', ('umlaut', 'diaresis')),
+    '\xfc': ('u', ('umlaut', 'diaresis')),
+    '\u1e84': ('W', ('umlaut', 'diaresis')),
+    '\u1e85': ('w', ('umlaut', 'diaresis')),
+    '\u0178': ('Y', ('umlaut', 'diaresis')),
+    '\xff': ('y', ('umlaut', 'diaresis')),
+    '\xc5': ('A', ('ring',)),
+    '\xe5': ('a', ('ring',)),
+    '\u016e': ('U', ('ring',)),
+    '\u016f': ('u', ('ring',)),
+    '\xc7': ('C', ('cedilla',)),
+    '\xe7': ('c', ('cedilla',)),
+    '\u1e10': ('D', ('cedilla',)),
+    '\u1e11': ('d', ('cedilla',)),
+    '\u0122': ('G', ('cedilla',)),
+    '\u0123': ('g', ('cedilla',)),
+    '\u0136': ('K', ('cedilla',)),
+    '\u0137': ('k', ('cedilla',)),
+    '\u013b': ('L', ('cedilla',)),
+    '\u013c': ('l', ('cedilla',)),
+    '\u0145': ('N', ('cedilla',)),
+    '\u0146': ('n', ('cedilla',)),
+    '\u0156': ('R', ('cedilla',)),
+    '\u0157': ('r', ('cedilla',)),
+    '\u015e': ('S', ('cedilla',)),
+    '\u015f': ('s', ('cedilla',)),
+    '\u0162': ('T', ('cedilla',)),
+    '\u0163': ('t', ('cedilla',)),
+    '\u010c': ('C', ('caron',)),
+    '\u010d': ('c', ('caron',)),
+    '\u010e': ('D', ('caron',)),
+    '\u010f': ('d', ('caron',)),
+    '\u011a': ('E', ('caron',)),
+    '\u011b': ('e', ('caron',)),
+    '\u01e6': ('G', ('caron',)),
+    '\u01e7': ('g', ('caron',)),
+    '\u01e8': ('K', ('caron',)),
+    '\u01e9': ('k', ('caron',)),
+    '\u013d': ('L', ('caron',)),
+    '\u013e': ('l', ('caron',)),
+    '\u0147': ('N', ('caron',)),
+    '\u0148': ('n', ('caron',)),
+    '\u0158': ('R', ('caron',)),
+    '\u0159': ('r', ('caron',)),
+    '\u0160': ('S', ('caron',)),
+    '\u0161': ('s', ('caron',)),
+    '\u0164': ('T', ('caron',)),
+    '\u0165': ('t', ('caron',)),
+    '\u017d': ('Z', ('caron',)),
+    '\u017e': ('z', ('caron',)),
+    '\xd8': ('O', ('slash',)),
+    '\xf8': ('o', ('slash',)),
+    '\u0141': ('L', ('slash',)),
+    '\u0142': ('l', ('slash',)),
+    '\u0104': ('A', ('ogonek',)),
+    '\u0105': ('a', ('ogonek',)),
+    '\u0118': ('E', ('ogonek',)),
+    '\u0119': ('e', ('ogonek',)),
+    '\u012e': ('I', ('ogonek',)),
+    '\u012f': ('i', ('ogonek',)),
+    '\u0172': ('U', ('ogonek',)),
+    '\u0173': ('u', ('ogonek',)),
+    '\u0100': ('A', ('macron',)),
+    '\u0101': ('a', ('macron',)),
+    '\u0112': ('E', ('macron',)),
+    '\u0113': ('e', ('macron',)),
+    '\u012a': ('I', ('macron',)),
+    '\u012b': ('i', ('macron',)),
+    '\u014c': ('O', ('macron',)),
+    '\u014d': ('o', ('macron',)),
+    '\u016a': ('U', ('macron',)),
+    '\u016b': ('u', ('macron',)),
+    '\u0102': ('A', ('breve',)),
+    '\u0103': ('a', ('breve',)),
+    '\u0114': ('E', ('breve',)),
+    '\u0115': ('e', ('breve',)),
+    '\u011e': ('G', ('breve',)),
+    '\u011f': ('g', ('breve',)),
+    '\u012c': ('I', ('breve',)),
+    '\u012d': ('i', ('breve',)),
+    '\u014e': ('O', ('breve',)),
+    '\u014f': ('o', ('breve',)),
+    '\u016c': ('U', ('breve',)),
+    '\u016d': ('u', ('breve',)),
+    '\u1e02': ('B', ('tittle',)),
+    '\u1e03': ('b', ('tittle',)),
+    '\u010a': ('C', ('tittle',)),
+    '\u010b': ('c', ('tittle',)),
+    '\u1e0a': ('D', ('tittle',)),
+    '\u1e0b': ('d', ('tittle',)),
+    '\u0116': ('E', ('tittle',)),
+    '\u0117': ('e', ('tittle',)),
+    '\u1e1e': ('F', ('tittle',)),
+    '\u1e1f': ('f', ('tittle',)),
+    '\u0120': ('G', ('tittle',)),
+    '\u0121': ('g', ('tittle',)),
+    '\u0130': ('I', ('tittle',)),
+    'i\u0307': ('i', ('tittle',)),
+    '\u1e40': ('M', ('tittle',)),
+    '\u1e41': ('m', ('tittle',)),
+    '\u1e56': ('P', ('tittle',)),
+    '\u1e57': ('p', ('tittle',)),
+    '\u1e60': ('S', ('tittle',)),
+    '\u1e61': ('s', ('tittle',)),
+    '\u1e6a': ('T', ('tittle',)),
+    '\u1e6b': ('t', ('tittle',)),
+    '\u017b': ('Z', ('tittle',)),
+    '\u017c': ('z', ('tittle',)),
+    '\u0110': ('D', ('stroke',)),
+    '\u0111': ('d', ('stroke',)),
+    '\u01e4': ('G', ('stroke',)),
+    '\u01e5': ('g', ('stroke',)),
+    '\u0126': ('H', ('stroke',)),
+    '\u0127': ('h', ('stroke',)),
+    '\u0166': ('T', ('stroke',)),
+    '\u0167': ('t', ('stroke',)),
+    '\u013f': ('L', ('interpunct',)),
+    '\u0140': ('l', ('interpunct',)),
+    '\u01de': ('A', ('umlaut_and_macron', 'diaresis_and_macron')),
+    '\u01df': ('a', ('umlaut_and_macron', 'diaresis_and_macron')),
+    '\u01fa': ('A', ('ring_and_acute',)),
+    '\u01fb': ('a', ('ring_and_acute',)),
+    '\u01fe': ('O', ('stroke_and_acute',)),
+    '\u01ff': ('o', ('stroke_and_acute',)),
+    '\u0300': ('', ('grave',)),
+    '\u0301': ('', ('acute',)),
+    '\u0302': ('', ('circumflex',)),
+    '\u0303': ('', ('tilde',)),
+    '\u0304': ('', ('macron',)),
+    '\u0306': ('', ('breve',)),
+    '\u0307': ('', ('tittle',)),
+    '\u0308': ('', ('umlaut', 'diaresis')),
+    '\u030a': ('', ('ring',)),
+    '\u030b': ('', ('double_acute',)),
+    '\u030c': ('', ('caron',)),
+    '\u0327': ('', ('cedilla',)),
+    '\u0328': ('', ('ogonek',)),
+}
+
+_diacritic_apply_map = {
+    ('A', 'grave'): '\xc0',
+    ('a', 'grave'): '\xe0',
+    ('E', 'grave'): '\xc8',
+    ('e', 'grave'): '\xe8',
+    ('I', 'grave'): '\xcc',
+    ('i', 'grave'): '\xec',
+    ('O', 'grave'): '\xd2',
+    ('o', 'grave'): '\xf2',
+    ('U', 'grave'): '\xd9',
+    ('u', 'grave'): '\xf9',
+    ('W', 'grave'): '\u1e80',
+    ('w', 'grave'): '\u1e81',
+    ('Y', 'grave'): '\u1ef2',
+    ('y', 'grave'): '\u1ef3',
+    ('A', 'acute'): '\xc1',
+    ('a', 'acute'): '\xe1',
+    ('C', 'acute'): '\u0106',
+    ('c', 'acute'): '\u0107',
+    ('E', 'acute'): '\xc9',
+    ('e', 'acute'): '\xe9',
+    ('G', 'acute'): '\u01f4',
+    ('g', 'acute'): '\u01f5',
+    ('I', 'acute'): '\xcd',
+    ('i', 'acute'): '\xed',
+    ('K', 'acute'): '\u1e30',
+    ('k', 'acute'): '\u1e31',
+    ('L', 'acute'): '\u0139',
+    ('l', 'acute'): '\u013a',
+    ('N', 'acute'): '\u0143',
+    ('n', 'acute'): '\u0144',
+    ('O', 'acute'): '\xd3',
+    ('o', 'acute'): '\xf3',
+    ('R', 'acute'): '\u0154',
+    ('r', 'acute'): '\u0155',
+    ('S', 'acute'): '\u015a',
+    ('s', 'acute'): '\u015b',
+    ('U', 'acute'): '\xda',
+    ('u', 'acute'): '\xfa',
+    ('W', 'acute'): '\u1e82',
+    ('w', 'acute'): '\u1e83',
+    ('Y', 'acute'): '\xdd',
+    ('y', 'acute'): '\xfd',
+    ('Z', 'acute'): '\u0179',
+    ('z', 'acute'): '\u017a',
+    ('O', 'double_acute'): '\u0150',
+    ('o', 'double_acute'): '\u0151',
+    ('U', 'double_acute'): '\u0170',
+    ('u', 'double_acute'): '\u0171',
+    ('A', 'circumflex'): '\xc2',
+    ('a', 'circumflex'): '\xe2',
+    ('E', 'circumflex'): '\xca',
+    ('e', 'circumflex'): '\xea',
+    ('G', 'circumflex'): '\u011c',
+    ('g', 'circumflex'): '\u011d',
+    ('H', 'circumflex'): '\u0124',
+    ('h', 'circumflex'): '\u0125',
+    ('I', 'circumflex'): '\xce',
+    ('i', 'circumflex'): '\xee',
+    ('J', 'circumflex'): '\u0134',
+    ('j', 'circumflex'): '\u0135',
+    ('O', 'circumflex'): '\xd4',
+    ('o', 'circumflex'): '\xf4',
+    ('S', 'circumflex'): '\u015c',
+    ('s', 'circumflex'): '\u015d',
+    ('U', 'circumflex'): '\xdb',
+    ('u', 'circumflex'): '\xfb',
+    ('W', 'circumflex'): '\u0174',
+    ('w', 'circumflex'): '\u0175',
+    ('Y', 'circumflex'): '\u0176',
+    ('y', 'circumflex'): '\u0177',
+    ('A', 'tilde'): '\xc3',
+    ('a', 'tilde'): '\xe3',
+    ('I', 'tilde'): '\u0128',
+    ('i', 'tilde'): '\u0129',
+    ('N', 'tilde'): '\xd1',
+    ('n', 'tilde'): '\xf1',
+    ('O', 'tilde'): '\xd5',
+    ('o', 'tilde'): '\xf5',
+    ('U', 'tilde'): '\u0168',
+    ('u', 'tilde'): '\u0169',
+    ('A', 'umlaut'): '\xc4',
+    ('a', 'umlaut'): '\xe4',
+    ('E', 'umlaut'): '\xcb',
+    ('e', 'umlaut'): '\xeb',
+    ('I', 'umlaut'): '\xcf',
+    ('i', 'umlaut'): '\xef',
+    ('O', 'umlaut'): '\xd6',
+    ('o', 'umlaut'): '\xf6',
+    ('U', 'umlaut'): '\xdc',
+    ('u', 'umlaut'): '\xfc',
+    ('W', 'umlaut'): '\u1e84',
+    ('w', 'umlaut'): '\u1e85',
+    ('Y', 'umlaut'): '\u0178',
+    ('y', 'umlaut'): '\xff',
+    ('A', 'diaresis'): '\xc4',
+    ('a', 'diaresis'): '\xe4',
+    ('E', 'diaresis'): '\xcb',
+    ('e', 'diaresis'): '\xeb',
+    ('I', 'diaresis'): '\xcf',
+    ('i', 'diaresis'): '\xef',
+    ('O', 'diaresis'): '\xd6',
+    ('o', 'diaresis'): '\xf6',
+    ('U', 'diaresis'): '\xdc',
+    ('u', 'diaresis'): '\xfc',
+    ('W', 'diaresis'): '\u1e84',
+    ('w', 'diaresis'): '\u1e85',
+    ('Y', 'diaresis'): '\u0178',
+    ('y', 'diaresis'): '\xff',
+    ('A', 'ring'): '\xc5',
+    ('a', 'ring'): '\xe5',
+    ('U', 'ring'): '\u016e',
+    ('u', 'ring'): '\u016f',
+    ('C', 'cedilla'): '\xc7',
+    ('c', 'cedilla'): '\xe7',
+    ('D', 'cedilla'): '\u1e10',
+    ('d', 'cedilla'): '\u1e11',
+    ('G', 'cedilla'): '\u0122',
+    ('g', 'cedilla'): '\u0123',
+    ('K', 'cedilla'): '\u0136',
+    ('k', 'cedilla'): '\u0137',
+    ('L', 'cedilla'): '\u013b',
+    ('l', 'cedilla'): '\u013c',
+    ('N', 'cedilla'): '\u0145',
+    ('n', 'cedilla'): '\u0146',
+    ('R', 'cedilla'): '\u0156',
+    ('r', 'cedilla'): '\u0157',
+    ('S', 'cedilla'): '\u015e',
+    ('s', 'cedilla'): '\u015f',
+    ('T', 'cedilla'): '\u0162',
+    ('t', 'cedilla'): '\u0163',
+    ('C', 'caron'): '\u010c',
+    ('c', 'caron'): '\u010d',
+    ('D', 'caron'): '\u010e',
+    ('d', 'caron'): '\u010f',
+    ('E', 'caron'): '\u011a',
+    ('e', 'caron'): '\u011b',
+    ('G', 'caron'): '\u01e6',
+    ('g', 'caron'): '\u01e7',
+    ('K', 'caron'): '\u01e8',
+    ('k', 'caron'): '\u01e9',
+    ('L', 'caron'): '\u013d',
+    ('l', 'caron'): '\u013e',
+    ('N', 'caron'): '\u0147',
+    ('n', 'caron'): '\u0148',
+    ('R', 'caron'): '\u0158',
+    ('r', 'caron'): '\u0159',
+    ('S', 'caron'): '\u0160',
+    ('s', 'caron'): '\u0161',
+    ('T', 'caron'): '\u0164',
+    ('t', 'caron'): '\u0165',
+    ('Z', 'caron'): '\u017d',
+    ('z', 'caron'): '\u017e',
+    ('O', 'slash'): '\xd8',
+    ('o', 'slash'): '\xf8',
+    ('L', 'slash'): '\u0141',
+    ('l', 'slash'): '\u0142',
+    ('A', 'ogonek'): '\u0104',
+    ('a', 'ogonek'): '\u0105',
+    ('E', 'ogonek'): '\u0118',
+    ('e', 'ogonek'): '\u0119',
+    ('I', 'ogonek'): '\u012e',
+    ('i', 'ogonek'): '\u012f',
+    ('U', 'ogonek'): '\u0172',
+    ('u', 'ogonek'): '\u0173',
+    ('A', 'macron'): '\u0100',
+    ('a', 'macron'): '\u0101',
+    ('E', 'macron'): '\u0112',
+    ('e', 'macron'): '\u0113',
+    ('I', 'macron'): '\u012a',
+    ('i', 'macron'): '\u012b',
+    ('O', 'macron'): '\u014c',
+    ('o', 'macron'): '\u014d',
+    ('U', 'macron'): '\u016a',
+    ('u', 'macron'): '\u016b',
+    ('A', 'breve'): '\u0102',
+    ('a', 'breve'): '\u0103',
+    ('E', 'breve'): '\u0114',
+    ('e', 'breve'): '\u0115',
+    ('G', 'breve'): '\u011e',
+    ('g', 'breve'): '\u011f',
+    ('I', 'breve'): '\u012c',
+    ('i', 'breve'): '\u012d',
+    ('O', 'breve'): '\u014e',
+    ('o', 'breve'): '\u014f',
+    ('U', 'breve'): '\u016c',
+    ('u', 'breve'): '\u016d',
+    ('B', 'tittle'): '\u1e02',
+    ('b', 'tittle'): '\u1e03',
+    ('C', 'tittle'): '\u010a',
+    ('c', 'tittle'): '\u010b',
+    ('D', 'tittle'): '\u1e0a',
+    ('d', 'tittle'): '\u1e0b',
+    ('E', 'tittle'): '\u0116',
+    ('e', 'tittle'): '\u0117',
+    ('F', 'tittle'): '\u1e1e',
+    ('f', 'tittle'): '\u1e1f',
+    ('G', 'tittle'): '\u0120',
+    ('g', 'tittle'): '\u0121',
+    ('I', 'tittle'): '\u0130',
+    ('i', 'tittle'): 'i\u0307',
+    ('M', 'tittle'): '\u1e40',
+    ('m', 'tittle'): '\u1e41',
+    ('P', 'tittle'): '\u1e56',
+    ('p', 'tittle'): '\u1e57',
+    ('S', 'tittle'): '\u1e60',
+    ('s', 'tittle'): '\u1e61',
+    ('T', 'tittle'): '\u1e6a',
+    ('t', 'tittle'): '\u1e6b',
+    ('Z', 'tittle'): '\u017b',
+    ('z', 'tittle'): '\u017c',
+    ('D', 'stroke'): '\u0110',
+    ('d', 'stroke'): '\u0111',
+    ('G', 'stroke'): '\u01e4',
+    ('g', 'stroke'): '\u01e5',
+    ('H', 'stroke'): '\u0126',
+    ('h', 'stroke'): '\u0127',
+    ('T', 'stroke'): '\u0166',
+    ('t', 'stroke'): '\u0167',
+    ('L', 'interpunct'): '\u013f',
+    ('l', 'interpunct'): '\u0140',
+    ('A', 'umlaut_and_macron'): '\u01de',
+    ('a', 'umlaut_and_macron'): '\u01df',
+    ('A', 'diaresis_and_macron'): '\u01de',
+    ('a', 'diaresis_and_macron'): '\u01df',
+    ('A', 'ring_and_acute'): '\u01fa',
+    ('a', 'ring_and_acute'): '\u01fb',
+    ('O', 'stroke_and_acute'): '\u01fe',
+    ('o', 'stroke_and_acute'): '\u01ff',
+}
+
+_diacritic_apply_letters = {
+    'grave': {
+        'A': '\xc0',
+        'a': '\xe0',
+        'E': '\xc8',
+        'e': '\xe8',
+        'I': '\xcc',
+        'i': '\xec',
+        'O': '\xd2',
+        'o': '\xf2',
+        'U': '\xd9',
+        'u': '\xf9',
+        'W': '\u1e80',
+        'w': '\u1e81',
+        'Y': '\u1ef2',
+        'y': '\u1ef3',
+    },
+    'acute': {
+        'A': '\xc1',
+        'a': '\xe1',
+        'C': '\u0106',
+        'c': '\u0107',
+        'E': '\xc9',
+        'e': '\xe9',
+        'G': '\u01f4',
+        'g': '\u01f5',
+        'I': '\xcd',
+        'i': '\xed',
+        'K': '\u1e30',
+        'k': '\u1e31',
+        'L': '\u0139',
+        'l': '\u013a',
+        'N': '\u0143',
+        'n': '\u0144',
+        'O': '\xd3',
+        'o': '\xf3',
+        'R': '\u0154',
+        'r': '\u0155',
+        'S': '\u015a',
+        's': '\u015b',
+        'U': '\xda',
+        'u': '\xfa',
+        'W': '\u1e82',
+        'w': '\u1e83',
+        'Y': '\xdd',
+        'y': '\xfd',
+        'Z': '\u0179',
+        'z': '\u017a',
+    },
+    'double_acute': {
+        'O': '\u0150',
+        'o': '\u0151',
+        'U': '\u0170',
+        'u': '\u0171',
+    },
+    'circumflex': {
+        'A': '\xc2',
+        'a': '\xe2',
+        'E': '\xca',
+        'e': '\xea',
+        'G': '\u011c',
+        'g': '\u011d',
+        'H': '\u0124',
+        'h': '\u0125',
+        'I': '\xce',
+        'i': '\xee',
+        'J': '\u0134',
+        'j': '\u0135',
+        'O': '\xd4',
+        'o': '\xf4',
+        'S': '\u015c',
+        's': '\u015d',
+        'U': '\xdb',
+        'u': '\xfb',
+        'W': '\u0174',
+        'w': '\u0175',
+        'Y': '\u0176',
+        'y': '\u0177',
+    },
+    'tilde': {
+        'A': '\xc3',
+        'a': '\xe3',
+        'I': '\u0128',
+        'i': '\u0129',
+        'N': '\xd1',
+        'n': '\xf1',
+        'O': '\xd5',
+        'o': '\xf5',
+        'U': '\u0168',
+        'u': '\u0169',
+    },
+    'umlaut': {
+        'A': '\xc4',
+        'a': '\xe4',
+        'E': '\xcb',
+        'e': '\xeb',
+        'I': '\xcf',
+        'i': '\xef',
+        'O': '\xd6',
+        'o': '\xf6',
+        'U': '\xdc',
+        'u': '\xfc',
+        'W': '\u1e84',
+        'w': '\u1e85',
+        'Y': '\u0178',
+        'y': '\xff',
+    },
+    'diaresis': {
+        'A': '\xc4',
+        'a': '\xe4',
+        'E': '\xcb',
+        'e': '\xeb',
+        'I': '\xcf',
+        'i': '\xef',
+        'O': '\xd6',
+        'o': '\xf6',
+        'U': '\xdc',
+        'u': '\xfc',
+        'W': '\u1e84',
+        'w': '\u1e85',
+        'Y': '\u0178',
+        'y': '\xff',
+    },
+    'ring': {
+        'A': '\xc5',
+        'a': '\xe5',
+        'U': '\u016e',
+        'u': '\u016f',
+    },
+    'cedilla': {
+        'C': '\xc7',
+        'c': '\xe7',
+        'D': '\u1e10',
+        'd': '\u1e11',
+        'G': '\u0122',
+        'g': '\u0123',
+        'K': '\u0136',
+        'k': '\u0137',
+        'L': '\u013b',
+        'l': '\u013c',
+        'N': '\u0145',
+        'n': '\u0146',
+        'R': '\u0156',
+        'r': '\u0157',
+        'S': '\u015e',
+        's': '\u015f',
+        'T': '\u0162',
+        't': '\u0163',
+    },
+    'caron': {
+        'C': '\u010c',
+        'c': '\u010d',
+        'D': '\u010e',
+        'd': '\u010f',
+        'E': '\u011a',
+        'e': '\u011b',
+        'G': '\u01e6',
+        'g': '\u01e7',
+        'K': '\u01e8',
+        'k': '\u01e9',
+        'L': '\u013d',
+        'l': '\u013e',
+        'N': '\u0147',
+        'n': '\u0148',
+        'R': '\u0158',
+        'r': '\u0159',
+        'S': '\u0160',
+        's': '\u0161',
+        'T': '\u0164',
+        't': '\u0165',
+        'Z': '\u017d',
+        'z': '\u017e',
+    },
+    'slash': {
+        'O': '\xd8',
+        'o': '\xf8',
+        'L': '\u0141',
+        'l': '\u0142',
+    },
+    'ogonek': {
+        'A': '\u0104',
+        'a': '\u0105',
+        'E': '\u0118',
+        'e': '\u0119',
+        'I': '\u012e',
+        'i': '\u012f',
+        'U': '\u0172',
+        'u': '\u0173',
+    },
+    'macron': {
+        'A': '\u0100',
+        'a': '\u0101',
+        'E': '\u0112',
+        'e': '\u0113',
+        'I': '\u012a',
+        'i': '\u012b',
+        'O': '\u014c',
+        'o': '\u014d',
+        'U': '\u016a',
+        'u': '\u016b',
+    },
+    'breve': {
+        'A': '\u0102',
+        'a': '\u0103',
+        'E': '\u0114',
+        'e': '\u0115',
+        'G': '\u011e',
+        'g': '\u011f',
+        'I': '\u012c',
+        'i': '\u012d',
+        'O': '\u014e',
+        'o': '\u014f',
+        'U': '\u016c',
+        'u': '\u016d',
+    },
+    'tittle': {
+        'B': '\u1e02',
+        'b': '\u1e03',
+        'C': '\u010a',
+        'c': '\u010b',
+        'D': '\u1e0a',
+        'd': '\u1e0b',
+        'E': '\u0116',
+        'e': '\u0117',
+        'F': '\u1e1e',
+        'f': '\u1e1f',
+        'G': '\u0120',
+        'g': '\u0121',
+        'I': '\u0130',
+        'i': 'i\u0307',
+        'M': '\u1e40',
+        'm': '\u1e41',
+        'P': '\u1e56',
+        'p': '\u1e57',
+        'S': '\u1e60',
+        's': '\u1e61',
+        'T': '\u1e6a',
+        't': '\u1e6b',
+        'Z': '\u017b',
+        'z': '\u017c',
+    },
+    'stroke': {
+        'D': '\u0110',
+        'd': '\u0111',
+        'G': '\u01e4',
+        'g': '\u01e5',
+        'H': '\u0126',
+        'h': '\u0127',
+        'T': '\u0166',
+        't': '\u0167',
+    },
+    'interpunct': {
+        'L': '\u013f',
+        'l': '\u0140',
+    },
+    'umlaut_and_macron': {
+        'A': '\u01de',
+        'a': '\u01df',
+    },
+    'diaresis_and_macron': {
+        'A': '\u01de',
+        'a': '\u01df',
+    },
+    'ring_and_acute': {
+        'A': '\u01fa',
+        'a': '\u01fb',
+    },
+    'stroke_and_acute': {
+        'O': '\u01fe',
+        'o': '\u01ff',
+    },
+}
+
+_diacritic_reject_patterns = {
+    'grave': '[^AEIOUWYaeiouwy]',
+    'acute': '[^ACEGIKLNORSUWYZacegiklnorsuwyz]',
+    'double_acute': '[^OUou]',
+    'circumflex': '[^AEGHIJOSUWYaeghijosuwy]',
+    'tilde': '[^AINOUainou]',
+    'umlaut': '[^AEIOUWYaeiouwy]',
+    'diaresis': '[^AEIOUWYaeiouwy]',
+    'ring': '[^AUau]',
+    'cedilla': '[^CDGKLNRSTcdgklnrst]',
+    'caron': '[^CDEGKLNRSTZcdegklnrstz]',
+    'slash': '[^LOlo]',
+    'ogonek': '[^AEIUaeiu]',
+    'macron': '[^AEIOUaeiou]',
+    'breve': '[^AEGIOUaegiou]',
+    'tittle': '[^BCDEFGIMPSTZbcdefgimpstz]',
+    'stroke': '[^DGHTdght]',
+    'interpunct': '[^Ll]',
+    'umlaut_and_macron': '[^Aa]',
+    'diaresis_and_macron': '[^Aa]',
+    'ring_and_acute': '[^Aa]',
+    'stroke_and_acute': '[^Oo]',
+}
+
+_diacritic_pattern = (
+    '[\xc0\xc1\xc2\xc3\xc4\xc5\xc7\xc8\xc9\xca\xcb\xcc\xcd\xce\xcf\xd1\xd2\xd3\xd4\xd5\xd6\xd8\xd9\xda\xdb\xdc\xdd\xe0\xe1\xe2\xe3\xe4\xe5\xe7\xe8\xe9\xea\xeb\xec\xed\xee\xef\xf1\xf2\xf3\xf4\xf5\xf6\xf8\xf9\xfa\xfb\xfc\xfd\xff\u0100\u0101\u0102\u0103\u0104\u0105\u0106\u0107'
+    '\u010a\u010b\u010c\u010d\u010e\u010f\u0110\u0111\u0112\u0113\u0114\u0115\u0116\u0117\u0118\u0119\u011a\u011b\u011c\u011d\u011e\u011f\u0120\u0121\u0122\u0123\u0124\u0125\u0126\u0127\u0128\u0129\u012a\u012b\u012c\u012d\u012e\u012f\u0130\u0134\u0135\u0136\u0137\u0139\u013a\u013b\u013c\u013d\u013e\u013f\u0140\u0141\u0142\u0143\u0144\u0145\u0146\u0147\u0148\u014c\u014d\u014e\u014f\u0150'
+    '\u0151\u0154\u0155\u0156\u0157\u0158\u0159\u015a\u015b\u015c\u015d\u015e\u015f\u0160\u0161\u0162\u0163\u0164\u0165\u0166\u0167\u0168\u0169\u016a\u016b\u016c\u016d\u016e\u016f\u0170\u0171\u0172\u0173\u0174\u0175\u0176\u0177\u0178\u0179\u017a\u017b\u017c\u017d\u017e\u01de\u01df\u01e4\u01e5\u01e6\u01e7\u01e8\u01e9\u01f4\u01f5\u01fa\u01fb\u01fe\u01ff\u0300\u0301\u0302\u0303\u0304\u0306'
+    '\u0307\u0308\u030a\u030b\u030c\u0327\u0328\u1e02\u1e03\u1e0a\u1e0b\u1e10\u1e11\u1e1e\u1e1f\u1e30\u1e31\u1e40\u1e41\u1e56\u1e57\u1e60\u1e61\u1e6a\u1e6b\u1e80\u1e81\u1e82\u1e83\u1e84\u1e85\u1ef2\u1ef3][\u0300\u0301\u0302\u0303\u0304\u0306\u0307\u0308\u030a\u030b\u030c\u0327\u0328]*'
+)
+
+_diacritic_decomposed_map = {
+    'A\u0300': '\xc0',
+    'a\u0300': '\xe0',
+    'E\u0300': '\xc8',
+    'e\u0300': '\xe8',
+    'I\u0300': '\xcc',
+    'i\u0300': '\xec',
+    'O\u0300': '\xd2',
+    'o\u0300': '\xf2',
+    'U\u0300': '\xd9',
+    'u\u0300': '\xf9',
+    'W\u0300': '\u1e80',
+    'w\u0300': '\u1e81',
+    'Y\u0300': '\u1ef2',
+    'y\u0300': '\u1ef3',
+    'A\u0301': '\xc1',
+    'a\u0301': '\xe1',
+    'C\u0301': '\u0106',
+    'c\u0301': '\u0107',
+    'E\u0301': '\xc9',
+    'e\u0301': '\xe9',
+    'G\u0301': '\u01f4',
+    'g\u0301': '\u01f5',
+    'I\u0301': '\xcd',
+    'i\u0301': '\xed',
+    'K\u0301': '\u1e30',
+    'k\u0301': '\u1e31',
+    'L\u0301': '\u0139',
+    'l\u0301': '\u013a',
+    'N\u0301': '\u0143',
+    'n\u0301': '\u0144',
+    'O\u0301': '\xd3',
+    'o\u0301': '\xf3',
+    'R\u0301': '\u0154',
+    'r\u0301': '\u0155',
+    'S\u0301': '\u015a',
+    's\u0301': '\u015b',
+    'U\u0301': '\xda',
+    'u\u0301': '\xfa',
+    'W\u0301': '\u1e82',
+    'w\u0301': '\u1e83',
+    'Y\u0301': '\xdd',
+    'y\u0301': '\xfd',
+    'Z\u0301': '\u0179',
+    'z\u0301': '\u017a',
+    'O\u030b': '\u0150',
+    'o\u030b': '\u0151',
+    'U\u030b': '\u0170',
+    'u\u030b': '\u0171',
+    'A\u0302': '\xc2',
+    'a\u0302': '\xe2',
+    'E\u0302': '\xca',
+    'e\u0302': '\xea',
+    'G\u0302': '\u011c',
+    'g\u0302': '\u011d',
+    'H\u0302': '\u0124',
+    'h\u0302': '\u0125',
+    'I\u0302': '\xce',
+    'i\u0302': '\xee',
+    'J\u0302': '\u0134',
+    'j\u0302': '\u0135',
+    'O\u0302': '\xd4',
+    'o\u0302': '\xf4',
+    'S\u0302': '\u015c',
+    's\u0302': '\u015d',
+    'U\u0302': '\xdb',
+    'u\u0302': '\xfb',
+    'W\u0302': '\u0174',
+    'w\u0302': '\u0175',
+    'Y\u0302': '\u0176',
+    'y\u0302': '\u0177',
+    'A\u0303': '\xc3',
+    'a\u0303': '\xe3',
+    'I\u0303': '\u0128',
+    'i\u0303': '\u0129',
+    'N\u0303': '\xd1',
+    'n\u0303': '\xf1',
+    'O\u0303': '\xd5',
+    'o\u0303': '\xf5',
+    'U\u0303': '\u0168',
+    'u\u0303': '\u0169',
+    'A\u0308': '\xc4',
+    'a\u0308': '\xe4',
+    'E\u0308': '\xcb',
+    'e\u0308': '\xeb',
+    'I\u0308': '\xcf',
+    'i\u0308': '\xef',
+    'O\u0308': '\xd6',
+    'o\u0308': '\xf6',
+    'U\u0308': '\xdc',
+    'u\u0308': '\xfc',
+    'W\u0308': '\u1e84',
+    'w\u0308': '\u1e85',
+    'Y\u0308': '\u0178',
+    'y\u0308': '\xff',
+    'A\u030a': '\xc5',
+    'a\u030a': '\xe5',
+    'U\u030a': '\u016e',
+    'u\u030a': '\u016f',
+    'C\u0327': '\xc7',
+    'c\u0327': '\xe7',
+    'D\u0327': '\u1e10',
+    'd\u0327': '\u1e11',
+    'G\u0327': '\u0122',
+    'g\u0327': '\u0123',
+    'K\u0327': '\u0136',
+    'k\u0327': '\u0137',
+    'L\u0327': '\u013b',
+    'l\u0327': '\u013c',
+    'N\u0327': '\u0145',
+    'n\u0327': '\u0146',
+    'R\u0327': '\u0156',
+    'r\u0327': '\u0157',
+    'S\u0327': '\u015e',
+    's\u0327': '\u015f',
+    'T\u0327': '\u0162',
+    't\u0327': '\u0163',
+    'C\u030c': '\u010c',
+    'c\u030c': '\u010d',
+    'D\u030c': '\u010e',
+    'd\u030c': '\u010f',
+    'E\u030c': '\u011a',
+    'e\u030c': '\u011b',
+    'G\u030c': '\u01e6',
+    'g\u030c': '\u01e7',
+    'K\u030c': '\u01e8',
+    'k\u030c': '\u01e9',
+    'L\u030c': '\u013d',
+    'l\u030c': '\u013e',
+    'N\u030c': '\u0147',
+    'n\u030c': '\u0148',
+    'R\u030c': '\u0158',
+    'r\u030c': '\u0159',
+    'S\u030c': '\u0160',
+    's\u030c': '\u0161',
+    'T\u030c': '\u0164',
+    't\u030c': '\u0165',
+    'Z\u030c': '\u017d',
+    'z\u030c': '\u017e',
+    'A\u0328': '\u0104',
+    'a\u0328': '\u0105',
+    'E\u0328': '\u0118',
+    'e\u0328': '\u0119',
+    'I\u0328': '\u012e',
+    'i\u0328': '\u012f',
+    'U\u0328': '\u0172',
+    'u\u0328': '\u0173',
+    'A\u0304': '\u0100',
+    'a\u0304': '\u0101',
+    'E\u0304': '\u0112',
+    'e\u0304': '\u0113',
+    'I\u0304': '\u012a',
+    'i\u0304': '\u012b',
+    'O\u0304': '\u014c',
+    'o\u0304': '\u014d',
+    'U\u0304': '\u016a',
+    'u\u0304': '\u016b',
+    'A\u0306': '\u0102',
+    'a\u0306': '\u0103',
+    'E\u0306': '\u0114',
+    'e\u0306': '\u0115',
+    'G\u0306': '\u011e',
+    'g\u0306': '\u011f',
+    'I\u0306': '\u012c',
+    'i\u0306': '\u012d',
+    'O\u0306': '\u014e',
+    'o\u0306': '\u014f',
+    'U\u0306': '\u016c',
+    'u\u0306': '\u016d',
+    'B\u0307': '\u1e02',
+    'b\u0307': '\u1e03',
+    'C\u0307': '\u010a',
+    'c\u0307': '\u010b',
+    'D\u0307': '\u1e0a',
+    'd\u0307': '\u1e0b',
+    'E\u0307': '\u0116',
+    'e\u0307': '\u0117',
+    'F\u0307': '\u1e1e',
+    'f\u0307': '\u1e1f',
+    'G\u0307': '\u0120',
+    'g\u0307': '\u0121',
+    'I\u0307': '\u0130',
+    'M\u0307': '\u1e40',
+    'm\u0307': '\u1e41',
+    'P\u0307': '\u1e56',
+    'p\u0307': '\u1e57',
+    'S\u0307': '\u1e60',
+    's\u0307': '\u1e61',
+    'T\u0307': '\u1e6a',
+    't\u0307': '\u1e6b',
+    'Z\u0307': '\u017b',
+    'z\u0307': '\u017c',
+    'A\u0308\u0304': '\u01de',
+    'a\u0308\u0304': '\u01df',
+    'A\u030a\u0301': '\u01fa',
+    'a\u030a\u0301': '\u01fb',
+    '\xd8\u0301': '\u01fe',
+    '\xf8\u0301': '\u01ff',
+}
+
+_diacritic_fold_classes = {
+    'A': '[A\xc0\xc1\xc2\xc3\xc4\xc5\u0100\u0102\u0104\u01de\u01fa]',
+    'B': '[B\u1e02]',
+    'C': '[C\xc7\u0106\u010a\u010c]',
+    'D': '[D\u010e\u0110\u1e0a\u1e10]',
+    'E': '[E\xc8\xc9\xca\xcb\u0112\u0114\u0116\u0118\u011a]',
+    'F': '[F\u1e1e]',
+    'G': '[G\u011c\u011e\u0120\u0122\u01e4\u01e6\u01f4]',
+    'H': '[H\u0124\u0126]',
+    'I': '[I\xcc\xcd\xce\xcf\u0128\u012a\u012c\u012e\u0130]',
+    'J': '[J\u0134]',
+    'K': '[K\u0136\u01e8\u1e30]',
+    'L': '[L\u0139\u013b\u013d\u013f\u0141]',
+    'M': '[M\u1e40]',
+    'N': '[N\xd1\u0143\u0145\u0147]',
+    'O': '[O\xd2\xd3\xd4\xd5\xd6\xd8\u014c\u014e\u0150\u01fe]',
+    'P': '[P\u1e56]',
+    'R': '[R\u0154\u0156\u0158]',
+    'S': '[S\u015a\u015c\u015e\u0160\u1e60]',
+    'T': '[T\u0162\u0164\u0166\u1e6a]',
+    'U': '[U\xd9\xda\xdb\xdc\u0168\u016a\u016c\u016e\u0170\u0172]',
+    'W': '[W\u0174\u1e80\u1e82\u1e84]',
+    'Y': '[Y\xdd\u0176\u0178\u1ef2]',
+    'Z': '[Z\u0179\u017b\u017d]',
+    'a': '[a\xe0\xe1\xe2\xe3\xe4\xe5\u0101\u0103\u0105\u01df\u01fb]',
+    'b': '[b\u1e03]',
+    'c': '[c\xe7\u0107\u010b\u010d]',
+    'd': '[d\u010f\u0111\u1e0b\u1e11]',
+    'e': '[e\xe8\xe9\xea\xeb\u0113\u0115\u0117\u0119\u011b]',
+    'f': '[f\u1e1f]',
+    'g': '[g\u011d\u011f\u0121\u0123\u01e5\u01e7\u01f5]',
+    'h': '[h\u0125\u0127]',
+    'i': '[i\xec\xed\xee\xef\u0129\u012b\u012d\u012f]',
+    'j': '[j\u0135]',
+    'k': '[k\u0137\u01e9\u1e31]',
+    'l': '[l\u013a\u013c\u013e\u0140\u0142]',
+    'm': '[m\u1e41]',
+    'n': '[n\xf1\u0144\u0146\u0148]',
+    'o': '[o\xf2\xf3\xf4\xf5\xf6\xf8\u014d\u014f\u0151\u01ff]',
+    'p': '[p\u1e57]',
+    'r': '[r\u0155\u0157\u0159]',
+    's': '[s\u015b\u015d\u015f\u0161\u1e61]',
+    't': '[t\u0163\u0165\u0167\u1e6b]',
+    'u': '[u\xf9\xfa\xfb\xfc\u0169\u016b\u016d\u016f\u0171\u0173]',
+    'w': '[w\u0175\u1e81\u1e83\u1e85]',
+    'y': '[y\xfd\xff\u0177\u1ef3]',
+    'z': '[z\u017a\u017c\u017e]',
+}
+
+_diacritic_utf8_map = {
+    b'\xc3\x80': b'A',
+    b'\xc3\x88': b'E',
+    b'\xc3\x8c': b'I',
+    b'\xc3\x92': b'O',
+    b'\xc3\x99': b'U',
+    b'\xe1\xba\x80': b'W',
+    b'\xe1\xbb\xb2': b'Y',
+    b'\xc3\xa0': b'a',
+    b'\xc3\xa8': b'e',
+    b'\xc3\xac': b'i',
+    b'\xc3\xb2': b'o',
+    b'\xc3\xb9': b'u',
+    b'\xe1\xba\x81': b'w',
+    b'\xe1\xbb\xb3': b'y',
+    b'\xc3\x81': b'A',
+    b'\xc4\x86': b'C',
+    b'\xc3\x89': b'E',
+    b'\xc7\xb4': b'G',
+    b'\xc3\x8d': b'I',
+    b'\xe1\xb8\xb0': b'K',
+    b'\xc4\xb9': b'L',
+    b'\xc5\x83': b'N',
+    b'\xc3\x93': b'O',
+    b'\xc5\x94': b'R',
+    b'\xc5\x9a': b'S',
+    b'\xc3\x9a': b'U',
+    b'\xe1\xba\x82': b'W',
+    b'\xc3\x9d': b'Y',
+    b'\xc5\xb9': b'Z',
+    b'\xc3\xa1': b'a',
+    b'\xc4\x87': b'c',
+    b'\xc3\xa9': b'e',
+    b'\xc7\xb5': b'g',
+    b'\xc3\xad': b'i',
+    b'\xe1\xb8\xb1': b'k',
+    b'\xc4\xba': b'l',
+    b'\xc5\x84': b'n',
+    b'\xc3\xb3': b'o',
+    b'\xc5\x95': b'r',
+    b'\xc5\x9b': b's',
+    b'\xc3\xba': b'u',
+    b'\xe1\xba\x83': b'w',
+    b'\xc3\xbd': b'y',
+    b'\xc5\xba': b'z',
+    b'\xc5\x90': b'O',
+    b'\xc5\xb0': b'U',
+    b'\xc5\x91': b'o',
+    b'\xc5\xb1': b'u',
+    b'\xc3\x82': b'A',
+    b'\xc3\x8a': b'E',
+    b'\xc4\x9c': b'G',
+    b'\xc4\xa4': b'H',
+    b'\xc3\x8e': b'I',
+    b'\xc4\xb4': b'J',
+    b'\xc3\x94': b'O',
+    b'\xc5\x9c': b'S',
+    b'\xc3\x9b': b'U',
+    b'\xc5\xb4': b'W',
+    b'\xc5\xb6': b'Y',
+    b'\xc3\xa2': b'a',
+    b'\xc3\xaa': b'e',
+    b'\xc4\x9d': b'g',
+    b'\xc4\xa5': b'h',
+    b'\xc3\xae': b'i',
+    b'\xc4\xb5': b'j',
+    b'\xc3\xb4': b'o',
+    b'\xc5\x9d': b's',
+    b'\xc3\xbb': b'u',
+    b'\xc5\xb5': b'w',
+    b'\xc5\xb7': b'y',
+    b'\xc3\x83': b'A',
+    b'\xc4\xa8': b'I',
+    b'\xc3\x91': b'N',
+    b'\xc3\x95': b'O',
+    b'\xc5\xa8': b'U',
+    b'\xc3\xa3': b'a',
+    b'\xc4\xa9': b'i',
+    b'\xc3\xb1': b'n',
+    b'\xc3\xb5': b'o',
+    b'\xc5\xa9': b'u',
+    b'\xc3\x84': b'A',
+    b'\xc3\x8b': b'E',
+    b'\xc3\x8f': b'I',
+    b'\xc3\x96': b'O',
+    b'\xc3\x9c': b'U',
+    b'\xe1\xba\x84': b'W',
+    b'\xc5\xb8': b'Y',
+    b'\xc3\xa4': b'a',
+    b'\xc3\xab': b'e',
+    b'\xc3\xaf': b'i',
+    b'\xc3\xb6': b'o',
+    b'\xc3\xbc': b'u',
+    b'\xe1\xba\x85': b'w',
+    b'\xc3\xbf': b'y',
+    b'\xc3\x85': b'A',
+    b'\xc5\xae': b'U',
+    b'\xc3\xa5': b'a',
+    b'\xc5\xaf': b'u',
+    b'\xc3\x87': b'C',
+    b'\xe1\xb8\x90': b'D',
+    b'\xc4\xa2': b'G',
+    b'\xc4\xb6': b'K',
+    b'\xc4\xbb': b'L',
+    b'\xc5\x85': b'N',
+    b'\xc5\x96': b'R',
+    b'\xc5\x9e': b'S',
+    b'\xc5\xa2': b'T',
+    b'\xc3\xa7': b'c',
+    b'\xe1\xb8\x91': b'd',
+    b'\xc4\xa3': b'g',
+    b'\xc4\xb7': b'k',
+    b'\xc4\xbc': b'l',
+    b'\xc5\x86': b'n',
+    b'\xc5\x97': b'r',
+    b'\xc5\x9f': b's',
+    b'\xc5\xa3': b't',
+    b'\xc4\x8c': b'C',
+    b'\xc4\x8e': b'D',
+    b'\xc4\x9a': b'E',
+    b'\xc7\xa6': b'G',
+    b'\xc7\xa8': b'K',
+    b'\xc4\xbd': b'L',
+    b'\xc5\x87': b'N',
+    b'\xc5\x98': b'R',
+    b'\xc5\xa0': b'S',
+    b'\xc5\xa4': b'T',
+    b'\xc5\xbd': b'Z',
+    b'\xc4\x8d': b'c',
+    b'\xc4\x8f': b'd',
+    b'\xc4\x9b': b'e',
+    b'\xc7\xa7': b'g',
+    b'\xc7\xa9': b'k',
+    b'\xc4\xbe': b'l',
+    b'\xc5\x88': b'n',
+    b'\xc5\x99': b'r',
+    b'\xc5\xa1': b's',
+    b'\xc5\xa5': b't',
+    b'\xc5\xbe': b'z',
+    b'\xc3\x98': b'O',
+    b'\xc5\x81': b'L',
+    b'\xc3\xb8': b'o',
+    b'\xc5\x82': b'l',
+    b'\xc4\x84': b'A',
+    b'\xc4\x98': b'E',
+    b'\xc4\xae': b'I',
+    b'\xc5\xb2': b'U',
+    b'\xc4\x85': b'a',
+    b'\xc4\x99': b'e',
+    b'\xc4\xaf': b'i',
+    b'\xc5\xb3': b'u',
+    b'\xc4\x80': b'A',
+    b'\xc4\x92': b'E',
+    b'\xc4\xaa': b'I',
+    b'\xc5\x8c': b'O',
+    b'\xc5\xaa': b'U',
+    b'\xc4\x81': b'a',
+    b'\xc4\x93': b'e',
+    b'\xc4\xab': b'i',
+    b'\xc5\x8d': b'o',
+    b'\xc5\xab': b'u',
+    b'\xc4\x82': b'A',
+    b'\xc4\x94': b'E',
+    b'\xc4\x9e': b'G',
+    b'\xc4\xac': b'I',
+    b'\xc5\x8e': b'O',
+    b'\xc5\xac': b'U',
+    b'\xc4\x83': b'a',
+    b'\xc4\x95': b'e',
+    b'\xc4\x9f': b'g',
+    b'\xc4\xad': b'i',
+    b'\xc5\x8f': b'o',
+    b'\xc5\xad': b'u',
+    b'\xe1\xb8\x82': b'B',
+    b'\xc4\x8a': b'C',
+    b'\xe1\xb8\x8a': b'D',
+    b'\xc4\x96': b'E',
+    b'\xe1\xb8\x9e': b'F',
+    b'\xc4\xa0': b'G',
+    b'\xc4\xb0': b'I',
+    b'\xe1\xb9\x80': b'M',
+    b'\xe1\xb9\x96': b'P',
+    b'\xe1\xb9\xa0': b'S',
+    b'\xe1\xb9\xaa': b'T',
+    b'\xc5\xbb': b'Z',
+    b'\xe1\xb8\x83': b'b',
+    b'\xc4\x8b': b'c',
+    b'\xe1\xb8\x8b': b'd',
+    b'\xc4\x97': b'e',
+    b'\xe1\xb8\x9f': b'f',
+    b'\xc4\xa1': b'g',
+    b'\xe1\xb9\x81': b'm',
+    b'\xe1\xb9\x97': b'p',
+    b'\xe1\xb9\xa1': b's',
+    b'\xe1\xb9\xab': b't',
+    b'\xc5\xbc': b'z',
+    b'\xc4\x90': b'D',
+    b'\xc7\xa4': b'G',
+    b'\xc4\xa6': b'H',
+    b'\xc5\xa6': b'T',
+    b'\xc4\x91': b'd',
+    b'\xc7\xa5': b'g',
+    b'\xc4\xa7': b'h',
+    b'\xc5\xa7': b't',
+    b'\xc4\xbf': b'L',
+    b'\xc5\x80': b'l',
+    b'\xc7\x9e': b'A',
+    b'\xc7\x9f': b'a',
+    b'\xc7\xba': b'A',
+    b'\xc7\xbb': b'a',
+    b'\xc7\xbe': b'O',
+    b'\xc7\xbf': b'o',
+    b'\xcc\x80': b'',
+    b'\xcc\x81': b'',
+    b'\xcc\x82': b'',
+    b'\xcc\x83': b'',
+    b'\xcc\x84': b'',
+    b'\xcc\x86': b'',
+    b'\xcc\x87': b'',
+    b'\xcc\x88': b'',
+    b'\xcc\x8a': b'',
+    b'\xcc\x8b': b'',
+    b'\xcc\x8c': b'',
+    b'\xcc\xa7': b'',
+    b'\xcc\xa8': b'',
+}
+
+_diacritic_utf8_pattern = (
+    b'\xc3[\x80\x81\x82\x83\x84\x85\x87\x88\x89\x8a\x8b\x8c\x8d\x8e\x8f\x91\x92\x93\x94\x95\x96\x98\x99\x9a\x9b\x9c\x9d\xa0\xa1\xa2\xa3\xa4\xa5\xa7\xa8\xa9\xaa\xab\xac\xad\xae\xaf\xb1\xb2\xb3\xb4\xb5\xb6\xb8\xb9\xba\xbb\xbc\xbd\xbf]|\xc4[\x80\x81\x82'
+    b'\x83\x84\x85\x86\x87\x8a\x8b\x8c\x8d\x8e\x8f\x90\x91\x92\x93\x94\x95\x96\x97\x98\x99\x9a\x9b\x9c\x9d\x9e\x9f\xa0\xa1\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xab\xac\xad\xae\xaf\xb0\xb4\xb5\xb6\xb7\xb9\xba\xbb\xbc\xbd\xbe\xbf]|\xc5[\x80\x81\x82\x83\x84'
+    b'\x85\x86\x87\x88\x8c\x8d\x8e\x8f\x90\x91\x94\x95\x96\x97\x98\x99\x9a\x9b\x9c\x9d\x9e\x9f\xa0\xa1\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xab\xac\xad\xae\xaf\xb0\xb1\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\xbb\xbc\xbd\xbe]|\xc7[\x9e\x9f\xa4\xa5\xa6\xa7\xa8'
+    b'\xa9\xb4\xb5\xba\xbb\xbe\xbf]|\xcc[\x80\x81\x82\x83\x84\x86\x87\x88\x8a\x8b\x8c\xa7\xa8]|\xe1\xb8[\x82\x83\x8a\x8b\x90\x91\x9e\x9f\xb0\xb1]|\xe1\xb9[\x80\x81\x96\x97\xa0\xa1\xaa\xab]|\xe1\xba[\x80\x81\x82\x83\x84\x85]'
+    b'|\xe1\xbb[\xb2\xb3]'
+)
+
+_diacritic_id_names = ((), ('grave',), ('acute',), ('double_acute',), ('circumflex',), ('tilde',), ('umlaut', 'diaresis'), ('ring',), ('cedilla',), ('caron',), ('slash',), ('ogonek',), ('macron',), ('breve',), ('tittle',), ('stroke',), ('interpunct',), ('umlaut_and_macron', 'diaresis_and_macron'), ('ring_and_acute',), ('stroke_and_acute',))
+
+_diacritic_latin_entries = (
+    b'A\x01A\x02A\x04A\x05A\x06A\x07\x00\x00C\x08E\x01E\x02E\x04E\x06I\x01I\x02I\x04I\x06\x00\x00N\x05O\x01O\x02O\x04O\x05O\x06\x00\x00O\nU\x01U\x02U\x04U\x06Y\x02\x00\x00\x00\x00'
+    b'a\x01a\x02a\x04a\x05a\x06a\x07\x00\x00c\x08e\x01e\x02e\x04e\x06i\x01i\x02i\x04i\x06\x00\x00n\x05o\x01o\x02o\x04o\x05o\x06\x00\x00o\nu\x01u\x02u\x04u\x06y\x02\x00\x00y\x06'
+    b'A\x0ca\x0cA\ra\rA\x0ba\x0bC\x02c\x02\x00\x00\x00\x00C\x0ec\x0eC\tc\tD\td\tD\x0fd\x0fE\x0ce\x0cE\re\rE\x0ee\x0eE\x0be\x0bE\te\tG\x04g\x04G\rg\r'
+    b'G\x0eg\x0eG\x08g\x08H\x04h\x04H\x0fh\x0fI\x05i\x05I\x0ci\x0cI\ri\rI\x0bi\x0bI\x0e\x00\x00\x00\x00\x00\x00J\x04j\x04K\x08k\x08\x00\x00L\x02l\x02L\x08l\x08L\tl\tL\x10'
+    b'l\x10L\nl\nN\x02n\x02N\x08n\x08N\tn\t\x00\x00\x00\x00\x00\x00O\x0co\x0cO\ro\rO\x03o\x03\x00\x00\x00\x00R\x02r\x02R\x08r\x08R\tr\tS\x02s\x02S\x04s\x04S\x08s\x08'
+    b'S\ts\tT\x08t\x08T\tt\tT\x0ft\x0fU\x05u\x05U\x0cu\x0cU\ru\rU\x07u\x07U\x03u\x03U\x0bu\x0bW\x04w\x04Y\x04y\x04Y\x06Z\x02z\x02Z\x0ez\x0eZ\tz\t\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00A\x11a\x11'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00G\x0fg\x0fG\tg\tK\tk\t\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00G\x02g\x02\x00\x00\x00\x00\x00\x00\x00\x00A\x12a\x12\x00\x00\x00\x00O\x13o\x13'
+)
+
+_diacritic_extended_entries = (
+    b'\x00\x00\x00\x00B\x0eb\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00D\x0ed\x0e\x00\x00\x00\x00\x00\x00\x00\x00D\x08d\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00F\x0ef\x0e'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00K\x02k\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'M\x0em\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00P\x0ep\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'S\x0es\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00T\x0et\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'W\x01w\x01W\x02w\x02W\x06w\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00Y\x01y\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+)
@@ -0,0 +1,162 @@
+"""Diacritic tools for asyncio streams.
+
+The functions here read an ``asyncio.StreamReader`` a bounded chunk at a
+time and hand control back to the event loop between chunks, so a large
+body never blocks other coroutines for long:
+
+    import dcl.aio
+
+    async def handle(reader, writer):
+        await dcl.aio.clean_stream(reader, writer)
+"""
+
+import asyncio as _asyncio
+import codecs as _codecs
+from concurrent.futures import Executor as _Executor
+from typing import (
+    Any as _Any,
+    AsyncIterator as _AsyncIterator,
+    Optional as _Optional,
+    Tuple as _Tuple
+)
+
+from . import Character, _iter_diacritics, _maps
+
+__all__ = ("clean_stream", "iter_diacritics")
+
+
+def _clean_text(text):
+    return text.translate(_maps._diacritic_tables.translate)
+
+
+def _find_diacritics(text):
+    # A list rather than a generator, so it can be returned from a process pool.
+    return list(_iter_diacritics(text))
+
+
+def _split_marks(text):
+    # Holds back the last letter and any combining marks after it, since
+    # more marks for it may start the next chunk.
+    if not text:
+        return text, ""
+    reverse = _maps._diacritic_tables.reverse
+    cut = len(text) - 1
+    while cut > 0:
+        # Marks are the only entries without a base letter.
+        entry = reverse.get(text[cut])
+        if entry is None or entry[0]:
+            break
+        cut -= 1
+    return text[:cut], text[cut:]
+
+
+async def _chunks(reader, chunk_size, executor, offload_size, func):
+    """Yields each decoded chunk of reader with func applied to it, when it isn't ASCII."""
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, not {chunk_size}")
+
+    loop = _asyncio.get_running_loop()
+    # Characters split across two chunks are held back until the next one.
+    decoder = _codecs.getincrementaldecoder("utf-8")()
+    carry = ""
+    while True:
+        chunk = await reader.read(chunk_size)
+        text = carry + decoder.decode(chunk, final=not chunk)
+        carry = ""
+        if chunk:
+            text, carry = _split_marks(text)
+        if text.isascii():
+            yield text, None
+        elif executor is not None and len(text) >= offload_size:
+            yield text, await loop.run_in_executor(executor, func, text)
+        else:
+            yield text, func(text)
+        if not chunk:
+            return
+        # read() returns straight away while data is buffered, so this makes
+        # sure other coroutines get to run between chunks.
+        await _asyncio.sleep(0)
+
+
+async def clean_stream(
+    reader: _Any,
+    writer: _Any,
+    chunk_size: int = 65536,
+    *,
+    executor: _Optional[_Executor] = None,
+    offload_size: int = 16384,
+) -> int:
+    """Cleans diacritics from an asyncio stream, writing the result to another.
+
+    Data is read and written as UTF-8, in chunks of at most chunk_size
+    bytes. Characters split across two chunks are handled correctly, and
+    the writer is drained after every chunk. The writer is not closed.
+
+    Parameters
+    ----------
+    reader: asyncio.StreamReader
+        The stream to read from.
+    writer: asyncio.StreamWriter
+        The stream to write the cleaned text to.
+    chunk_size: int
+        The number of bytes read at once.
+    executor: Optional[concurrent.futures.Executor]
+        If given, chunks of at least offload_size characters are cleaned in
+        it instead of on the event loop. Cleaning holds the GIL, so this only
+        helps with a ``ProcessPoolExecutor``.
+    offload_size: int
+        The number of characters from which a chunk is cleaned in the executor.
+
+    Returns
+    -------
+    int
+        The number of characters read.
+    """
+    total = 0
+    async for text, cleaned in _chunks(reader, chunk_size, executor, offload_size, _clean_text):
+        if not text:
+            continue
+        total += len(text)
+        writer.write((text if cleaned is None else cleaned).encode("utf-8"))
+        await writer.drain()
+
+    return total
+
+
+async def iter_diacritics(
+    reader: _Any,
+    chunk_size: int = 65536,
+    *,
+    executor: _Optional[_Executor] = None,
+    offload_size: int = 16384,
+) -> _AsyncIterator[_Tuple[int, Character]]:
+    """Iterate over the diacritics in an asyncio stream, from start to end.
+
+    Like ``dcl.iter_diacritics``, but for UTF-8 data read from a stream in
+    chunks of at most chunk_size bytes.
+
+    Parameters
+    ----------
+    reader: asyncio.StreamReader
+        The stream to read from.
+    chunk_size: int
+        The number of bytes read at once.
+    executor: Optional[concurrent.futures.Executor]
+        If given, chunks of at least offload_size characters are searched in
+        it instead of on the event loop. Searching holds the GIL, so this only
+        helps with a ``ProcessPoolExecutor``.
+    offload_size: int
+        The number of characters from which a chunk is searched in the executor.
+
+    Returns
+    -------
+    AsyncIterator[Tuple[int, Character]]
+        The index of each character with a diacritic, counted in characters
+        from the start of the stream, and its Character representation.
+    """
+    offset = 0
+    async for text, found in _chunks(reader, chunk_size, executor, offload_size, _find_diacritics):
+        if found:
+            for index, char in found:
+                yield offset + index, char
+        offset += len(text)
@@ -0,0 +1,158 @@
+"""Diacritic tools for CSV and TSV files.
+
+Rows are streamed through the standard library ``csv`` module, so files of
+any size are cleaned without loading them into memory:
+
+    import dcl.csvtools
+
+    dcl.csvtools.clean_columns("people.csv", "people-clean.csv", columns=["name", "city"])
+"""
+
+import csv as _csv
+import os as _os
+from contextlib import ExitStack as _ExitStack
+from functools import partial as _partial
+from typing import (
+    Any as _Any,
+    Iterable as _Iterable,
+    Optional as _Optional,
+    Union as _Union
+)
+
+from . import _count_diacritics, _map_chunks, _maps
+
+__all__ = ("clean_columns",)
+
+
+def _open(file, mode, stack):
+    # Paths are opened as UTF-8, anything else is taken to be an open file.
+    if isinstance(file, (str, bytes, _os.PathLike)):
+        return stack.enter_context(open(file, mode, encoding="utf-8", newline=""))
+    return file
+
+
+def _column_indexes(columns, header):
+    indexes = []
+    for column in columns:
+        if isinstance(column, int):
+            indexes.append(column)
+        elif header is None:
+            raise ValueError(f"column {column!r} can only be found by name with a header row")
+        else:
+            try:
+                indexes.append(header.index(column))
+            except ValueError:
+                raise ValueError(f"{column!r} is not a column in the header") from None
+    return tuple(indexes)
+
+
+def _clean_rows(indexes, has, count, width, rows):
+    # Cleans the given columns of every row in place. This runs in worker
+    # processes too, so it is a module level function given through partial.
+    table = _maps._diacritic_tables.translate
+    for row in rows:
+        # Short rows are padded, so added columns line up with the header.
+        if (has or count) and len(row) < width:
+            row.extend([""] * (width - len(row)))
+        found = 0
+        length = len(row)
+        for index in indexes:
+            if index >= length:
+                continue
+            value = row[index]
+            if value.isascii():
+                continue
+            if count:
+                found += _count_diacritics(value)
+            cleaned = value.translate(table)
+            if not count and cleaned != value:
+                found = 1
+            row[index] = cleaned
+        if has:
+            row.append(found > 0)
+        if count:
+            row.append(found)
+    return rows
+
+
+def clean_columns(
+    src: _Union[str, _os.PathLike, _Iterable[str]],
+    dst: _Union[str, _os.PathLike, _Any],
+    columns: _Iterable[_Union[str, int]],
+    dialect: _Union[str, _csv.Dialect] = "excel",
+    *,
+    header: bool = True,
+    has_column: _Optional[str] = None,
+    count_column: _Optional[str] = None,
+    workers: _Optional[int] = None,
+    chunksize: int = 1024,
+    **fmtparams: _Any,
+) -> int:
+    """Cleans diacritics from the given columns of a CSV file, writing every row to another.
+
+    Rows are read and written one block at a time, so memory use doesn't
+    grow with the size of the file. Other columns are written as they are.
+
+    Parameters
+    ----------
+    src: Union[str, PathLike, Iterable[str]]
+        The path of the UTF-8 file to read, or a text file opened with ``newline=""``.
+    dst: Union[str, PathLike, TextIO]
+        The path to write to, or a text file opened with ``newline=""``.
+    columns: Iterable[Union[str, int]]
+        The columns to clean, by name in the header or by index from 0.
+    dialect: Union[str, csv.Dialect]
+        The ``csv`` dialect of both files, such as ``"excel-tab"`` for TSV.
+    header: bool
+        Whether the first row holds the column names. It is written as it is.
+    has_column: Optional[str]
+        If given, a column of this name is added, saying whether the cleaned
+        columns of each row contained diacritics.
+    count_column: Optional[str]
+        If given, a column of this name is added, with the number of
+        diacritics in the cleaned columns of each row.
+    workers: Optional[int]
+        The number of worker processes to spread blocks of rows over. Rows
+        are still written in order. If not provided, everything runs in the
+        current process.
+    chunksize: int
+        The number of rows in each block.
+    **fmtparams
+        Formatting parameters overriding the dialect, as taken by ``csv.reader``.
+
+    Returns
+    -------
+    int
+        The number of rows cleaned, not counting the header.
+    """
+    columns = list(columns)
+    for column in columns:
+        if not isinstance(column, (str, int)):
+            raise TypeError(f"columns must be str or int, not {type(column).__name__}")
+
+    with _ExitStack() as stack:
+        reader = _csv.reader(_open(src, "r", stack), dialect, **fmtparams)
+        writer = _csv.writer(_open(dst, "w", stack), dialect, **fmtparams)
+
+        names = None
+        if header:
+            names = next(reader, None)
+            if names is None:
+                return 0
+        indexes = _column_indexes(columns, names)
+        if header:
+            writer.writerow(names + [name for name in (has_column, count_column) if name is not None])
+
+        process = _partial(
+            _clean_rows,
+            indexes,
+            has_column is not None,
+            count_column is not None,
+            0 if names is None else len(names),
+        )
+
+        rows = 0
+        for row in _map_chunks(process, reader, workers, chunksize):
+            writer.writerow(row)
+            rows += 1
+        return rows
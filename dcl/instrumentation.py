@@ -0,0 +1,327 @@
+"""Opt-in metrics for the dcl hot paths.
+
+While recording, calls to ``clean_diacritics``, ``get_diacritics``,
+``cantake``, ``apply`` and ``apply_to_string`` are counted and timed, along
+with the characters they processed and the diacritics they found. The
+functions giving a single diacritic, such as ``dcl.acute``, go through
+``apply`` and are counted there.
+
+    import dcl.instrumentation
+
+    with dcl.instrumentation.recording():
+        run_job()
+    print(dcl.instrumentation.prometheus())
+
+Setting the ``DCL_INSTRUMENTATION`` environment variable to anything but
+``0`` records from the moment dcl is imported.
+
+Recording works by replacing the functions in the dcl module with timed
+wrappers, and putting the originals back when it stops, so it costs nothing
+while it is off. Functions imported with ``from dcl import ...`` before
+recording started keep pointing at the originals, and aren't counted.
+"""
+
+import bisect as _bisect
+import functools as _functools
+import threading as _threading
+import time as _time
+from contextlib import contextmanager as _contextmanager
+from typing import (
+    Any as _Any,
+    Dict as _Dict,
+    Iterator as _Iterator
+)
+
+import dcl as _dcl
+
+__all__ = (
+    "enable",
+    "disable",
+    "is_enabled",
+    "recording",
+    "reset",
+    "watch_cache",
+    "unwatch_cache",
+    "snapshot",
+    "prometheus",
+)
+
+# Upper bounds of the call duration histogram buckets, in seconds.
+BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 1e-2, 1e-1, 1.0)
+
+_lock = _threading.Lock()
+_depth = 0
+_originals = {}
+# name -> [calls, errors, characters, diacritics, seconds, bucket counts].
+_metrics = {}
+# The caches dcl keeps itself are watched from the start.
+_caches = {"subset_tables": _dcl._subset_table}
+
+
+def _length(value):
+    try:
+        return len(value)
+    except TypeError:
+        return 0
+
+
+@_functools.lru_cache(maxsize=4)
+def _deleting_table(tables):
+    # tables.translate, except every character it cleans is deleted, so the
+    # change in length counts the composed characters and combining marks.
+    return [None if isinstance(entry, str) else entry for entry in tables.translate]
+
+
+def _diacritic_chars(string, table):
+    return len(string) - len(string.translate(table))
+
+
+def _clean_counts(args, kwargs, result):
+    string = args[0] if args else kwargs["string"]
+    if result is string or string.isascii():
+        return len(string), 0
+    # The diacritics cleaned are the ones gone from the result, which also
+    # holds for a subset cleaned with diacritics= or keep=.
+    table = _deleting_table(_dcl._maps._diacritic_tables)
+    return len(string), _diacritic_chars(string, table) - _diacritic_chars(result, table)
+
+
+def _get_counts(args, kwargs, result):
+    return len(args[0] if args else kwargs["string"]), len(result)
+
+
+def _cantake_counts(args, kwargs, result):
+    return _length(args[0] if args else kwargs["characters"]), 0
+
+
+def _apply_counts(args, kwargs, result):
+    return 1, 1
+
+
+def _apply_to_string_counts(args, kwargs, result):
+    text = args[0] if args else kwargs["text"]
+    return len(text), sum(a != b for a, b in zip(text, result))
+
+
+# name -> function returning the characters processed and diacritics found
+# by a successful call, from its arguments and result.
+_counters = {
+    "clean_diacritics": _clean_counts,
+    "get_diacritics": _get_counts,
+    "cantake": _cantake_counts,
+    "apply": _apply_counts,
+    "apply_to_string": _apply_to_string_counts,
+}
+
+
+def _new_metric():
+    return [0, 0, 0, 0, 0.0, [0] * (len(BUCKETS) + 1)]
+
+
+def _record(name, elapsed, characters, diacritics, error):
+    with _lock:
+        metric = _metrics.get(name)
+        if metric is None:
+            metric = _metrics[name] = _new_metric()
+        metric[0] += 1
+        metric[1] += error
+        metric[2] += characters
+        metric[3] += diacritics
+        metric[4] += elapsed
+        metric[5][_bisect.bisect_left(BUCKETS, elapsed)] += 1
+
+
+def _instrument(name, function, counts):
+    perf_counter = _time.perf_counter
+
+    @_functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            result = function(*args, **kwargs)
+        except BaseException:
+            _record(name, perf_counter() - start, 0, 0, 1)
+            raise
+        elapsed = perf_counter() - start
+        _record(name, elapsed, *counts(args, kwargs, result), 0)
+        return result
+
+    return wrapper
+
+
+def enable() -> None:
+    """Starts recording.
+
+    Calls nest, so recording only stops once ``disable`` has been called as
+    many times as this.
+    """
+    global _depth
+    with _lock:
+        _depth += 1
+        if _depth > 1:
+            return
+        for name, counts in _counters.items():
+            function = _originals[name] = getattr(_dcl, name)
+            setattr(_dcl, name, _instrument(name, function, counts))
+
+
+def disable() -> None:
+    """Stops recording, putting the original functions back. The metrics are kept."""
+    global _depth
+    with _lock:
+        if _depth == 0:
+            return
+        _depth -= 1
+        if _depth > 0:
+            return
+        for name, function in _originals.items():
+            setattr(_dcl, name, function)
+        _originals.clear()
+
+
+def is_enabled() -> bool:
+    """Returns whether metrics are being recorded."""
+    return _depth > 0
+
+
+@_contextmanager
+def recording() -> _Iterator[None]:
+    """A context manager recording metrics for the calls made inside it."""
+    enable()
+    try:
+        yield
+    finally:
+        disable()
+
+
+def reset() -> None:
+    """Clears every recorded metric. Watched caches are kept."""
+    with _lock:
+        _metrics.clear()
+
+
+def watch_cache(name: str, cache: _Any) -> None:
+    """Includes a cache's hit rate in the exported metrics.
+
+    Parameters
+    ----------
+    name: str
+        The name the cache is exported under.
+    cache: Union[KeyCache, functools.lru_cache]
+        A ``dcl.KeyCache``, or a function wrapped by ``functools.lru_cache``.
+    """
+    if not hasattr(cache, "cache_info") and not isinstance(cache, _dcl.KeyCache):
+        raise TypeError(f"cache must be a KeyCache or lru_cache function, not {type(cache).__name__}")
+    with _lock:
+        _caches[name] = cache
+
+
+def unwatch_cache(name: str) -> None:
+    """Stops exporting the cache watched under the given name."""
+    with _lock:
+        _caches.pop(name, None)
+
+
+def _cache_stats(cache):
+    if isinstance(cache, _dcl.KeyCache):
+        hits, misses, size, maxsize = cache.hits, cache.misses, cache.size, cache.maxsize
+    else:
+        hits, misses, maxsize, size = cache.cache_info()
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "size": size,
+        "maxsize": maxsize,
+        "hit_rate": hits / total if total else 0.0,
+    }
+
+
+def snapshot() -> _Dict[str, _Any]:
+    """Returns every metric recorded so far.
+
+    Returns
+    -------
+    Dict[str, Any]
+        ``"functions"`` maps each instrumented function that was called to
+        its ``calls``, ``errors``, ``characters``, ``diacritics`` and total
+        ``seconds``, and a ``histogram`` of the number of calls taking at
+        most each of ``BUCKETS`` seconds, or more for ``inf``.
+        ``"caches"`` maps each watched cache to its ``hits``, ``misses``,
+        ``size``, ``maxsize`` and ``hit_rate``.
+    """
+    with _lock:
+        metrics = {name: metric[:5] + [list(metric[5])] for name, metric in _metrics.items()}
+        caches = dict(_caches)
+
+    functions = {}
+    for name, (calls, errors, characters, diacritics, seconds, buckets) in metrics.items():
+        functions[name] = {
+            "calls": calls,
+            "errors": errors,
+            "characters": characters,
+            "diacritics": diacritics,
+            "seconds": seconds,
+            "histogram": dict(zip(BUCKETS + (float("inf"),), buckets)),
+        }
+    return {
+        "functions": functions,
+        "caches": {name: _cache_stats(cache) for name, cache in caches.items()},
+    }
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus() -> str:
+    """Returns every metric recorded so far, in the Prometheus text exposition format."""
+    data = snapshot()
+    functions = data["functions"]
+    caches = data["caches"]
+    lines = []
+
+    def family(metric, kind, description, values):
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} {kind}")
+        for labels, value in values:
+            lines.append(f"{metric}{{{labels}}} {value}")
+
+    for key, description in (
+        ("calls", "Calls to the function."),
+        ("errors", "Calls to the function which raised an exception."),
+        ("characters", "Characters given to the function."),
+        ("diacritics", "Diacritics found or applied by the function."),
+    ):
+        family(
+            f"dcl_{key}_total",
+            "counter",
+            description,
+            ((f'function="{_label(name)}"', metric[key]) for name, metric in functions.items()),
+        )
+
+    lines.append("# HELP dcl_call_duration_seconds Time spent in each call to the function.")
+    lines.append("# TYPE dcl_call_duration_seconds histogram")
+    for name, metric in functions.items():
+        label = f'function="{_label(name)}"'
+        total = 0
+        for bound, count in metric["histogram"].items():
+            total += count
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f'dcl_call_duration_seconds_bucket{{{label},le="{le}"}} {total}')
+        lines.append(f"dcl_call_duration_seconds_sum{{{label}}} {metric['seconds']!r}")
+        lines.append(f"dcl_call_duration_seconds_count{{{label}}} {metric['calls']}")
+
+    for key, kind, description in (
+        ("hits", "counter", "Lookups found in the cache."),
+        ("misses", "counter", "Lookups missing from the cache."),
+        ("size", "gauge", "Entries in the cache."),
+    ):
+        family(
+            f"dcl_cache_{key}" + ("_total" if kind == "counter" else ""),
+            kind,
+            description,
+            ((f'cache="{_label(name)}"', stats[key]) for name, stats in caches.items()),
+        )
+
+    return "\n".join(lines) + "\n"
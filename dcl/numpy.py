@@ -0,0 +1,163 @@
+"""Vectorised diacritic tools for NumPy arrays of strings.
+
+The functions here take fixed-width unicode arrays, such as ``dtype='<U64'``,
+and work on their code points directly through lookup tables, without creating
+a Python str for any element. NumPy is not installed with dcl, so this module
+has to be imported explicitly:
+
+    import dcl.numpy
+"""
+
+try:
+    import numpy as _np
+except ImportError:
+    raise ImportError("dcl.numpy requires NumPy, install it with `pip install numpy`") from None
+
+from . import _maps
+
+__all__ = ("clean_diacritics", "has_diacritics", "count_diacritics")
+
+_size = 0x1F00
+
+
+# What cleaning turns a combining mark into, before it is dropped. It is
+# past the last code point, so nothing else can clean to it.
+_MARK = 0x110000
+
+
+def _build_tables(tables):
+    latin = _np.frombuffer(tables.latin, dtype=_np.uint16)
+    extended = _np.frombuffer(tables.extended, dtype=_np.uint16)
+
+    # Maps every code point below _size to its cleaned code point, or _MARK.
+    fold = _np.arange(_size, dtype=_np.uint32)
+    # Whether a code point is a composed character, 1, or a combining mark,
+    # 2. The extra last entry is 0, so code points can be clipped to _size
+    # before indexing.
+    kind = _np.zeros(_size + 1, dtype=_np.uint8)
+    for start, entries in ((0xC0, latin), (0x1E00, extended)):
+        stop = start + len(entries)
+        _np.copyto(fold[start:stop], entries & 0xFF, where=entries != 0)
+        kind[start:stop] = entries != 0
+
+    # Letters the compact tables have no entry for, such as registered ones
+    # outside their ranges or with a base outside Latin-1, come from reverse.
+    for char, (base, _) in tables.reverse.items():
+        if len(char) != 1 or ord(char) >= _size:
+            continue
+        code = ord(char)
+        if not base:
+            fold[code] = _MARK
+            kind[code] = 2
+        elif not kind[code]:
+            fold[code] = ord(base)
+            kind[code] = 1
+    return tables, fold, kind
+
+
+# Rebuilt whenever a diacritic is registered. Only characters below U+1F00
+# are covered, so a registered diacritic past it is not seen by the
+# functions here.
+_lookup = _build_tables(_maps._diacritic_tables)
+
+
+def _lookup_tables():
+    global _lookup
+    lookup = _lookup
+    if lookup[0] is not _maps._diacritic_tables:
+        lookup = _lookup = _build_tables(_maps._diacritic_tables)
+    return lookup
+
+
+def _check(array, function):
+    if not isinstance(array, _np.ndarray) or array.dtype.kind != "U":
+        dtype = getattr(array, "dtype", type(array).__name__)
+        raise TypeError(f"{function} function takes a unicode ndarray, not {dtype}")
+
+
+def _codepoints(array):
+    # A view of the array with an extra last axis, holding each element's
+    # UCS-4 code points. The array must be C-contiguous.
+    return array[..., _np.newaxis].view(_np.dtype("u4").newbyteorder(array.dtype.byteorder))
+
+
+def clean_diacritics(array: "_np.ndarray", inplace: bool = False) -> "_np.ndarray":
+    """Returns the given array with every element cleaned from diacritics.
+
+    Parameters
+    ----------
+    array: numpy.ndarray
+        A unicode string array to clean accents from.
+    inplace: bool
+        Whether to modify the given array instead of returning a new one.
+
+    Returns
+    -------
+    numpy.ndarray
+        The cleaned array. This is the given array when inplace is True.
+    """
+    _check(array, "clean_diacritics")
+
+    target = array if inplace and array.flags.c_contiguous else _np.array(array, order="C")
+    codes = _codepoints(target)
+    fold = _lookup_tables()[1]
+    _np.copyto(codes, fold[_np.minimum(codes, _size - 1)], where=codes < _size)
+
+    marks = codes == _MARK
+    if marks.any():
+        # Combining marks are moved to the end of each element, keeping the
+        # order of the rest, and become the padding which ends it.
+        order = _np.argsort(marks, axis=-1, kind="stable")
+        codes[...] = _np.take_along_axis(codes, order, axis=-1)
+        codes[_np.take_along_axis(marks, order, axis=-1)] = 0
+
+    if inplace and target is not array:
+        array[...] = target
+        return array
+
+    return target
+
+
+def has_diacritics(array: "_np.ndarray") -> "_np.ndarray":
+    """Returns whether each element of the given array contains diacritics.
+
+    Parameters
+    ----------
+    array: numpy.ndarray
+        A unicode string array to check.
+
+    Returns
+    -------
+    numpy.ndarray
+        A bool array of the same shape.
+    """
+    _check(array, "has_diacritics")
+    codes = _codepoints(_np.asarray(array, order="C"))
+    return _lookup_tables()[2][_np.minimum(codes, _size)].any(axis=-1)
+
+
+def count_diacritics(array: "_np.ndarray") -> "_np.ndarray":
+    """Returns the number of diacritics in each element of the given array.
+
+    Parameters
+    ----------
+    array: numpy.ndarray
+        A unicode string array to count diacritics from.
+
+    Returns
+    -------
+    numpy.ndarray
+        An int array of the same shape.
+    """
+    _check(array, "count_diacritics")
+    codes = _codepoints(_np.asarray(array, order="C"))
+    kind = _lookup_tables()[2][_np.minimum(codes, _size)]
+    if kind.max(initial=0) < 2:
+        return kind.sum(axis=-1, dtype=_np.intp)
+
+    # Combining marks after a diacritic belong to it, like in
+    # dcl.count_diacritics, so only the first is counted.
+    found = kind != 0
+    follows = _np.zeros_like(found)
+    follows[..., 1:] = found[..., :-1]
+    return (found & ~((kind == 2) & follows)).sum(axis=-1)
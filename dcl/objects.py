@@ -1,31 +1,116 @@
-from ._maps import _diacritic_map, _diacritic_char_map
+import re
+from collections import deque
+from functools import lru_cache, total_ordering
+
+from . import _maps
 from .errors import DiacriticError
 
-__all__ = ("DiacriticApplicant", "Character")
+__all__ = ("DiacriticApplicant", "Character", "Cleaner", "FoldedAutomaton", "FoldedMatcher", "KeyCache", "OffsetMap")
+
+
+def _apply(character, diacritic):
+    tables = _maps._diacritic_tables
+    try:
+        return tables.apply[character, diacritic]
+    except (KeyError, TypeError):
+        pass
+
+    if not isinstance(character, str):
+        raise TypeError("Must be str, not {}".format(type(character).__name__))
+    if len(character) != 1:
+        raise ValueError("Given character must be of len 1, not {}".format(str(len(character))))
+    if diacritic not in tables.map:
+        raise ValueError(f"'{diacritic}' is not a valid diacritic")
+
+    # Some characters, such as a dotless i, upper case to a letter in the map.
+    try:
+        char = tables.map[diacritic][character.upper()]
+    except KeyError:
+        raise DiacriticError(character, diacritic.replace("_", " ")) from None
+    if character.islower():
+        char = char.lower()
+    return char
+
+
+@total_ordering
+class Character(object):
+    """A character with a diacritic.
+
+    Characters are immutable, and the ones dcl knows about are interned,
+    so creating the same character twice returns the same object.
+    """
+
+    __slots__ = ("_character", "_diacritic_name")
+
+    _cache = {}
+
+    def __new__(cls, char, diacritic_name):
+        key = (char, diacritic_name)
+        try:
+            return cls._cache[key]
+        except (KeyError, TypeError):
+            pass
+        self = object.__new__(cls)
+        self._character = char
+        self._diacritic_name = diacritic_name
+        # Only the finite set of known characters is interned, so the
+        # cache can't grow without bound.
+        entry = _maps._diacritic_tables.reverse.get(char) if isinstance(char, str) else None
+        if cls is Character and entry is not None and diacritic_name in entry[1]:
+            cls._cache[key] = self
+        return self
+
+    def __reduce__(self):
+        return (self.__class__, (self._character, self._diacritic_name))
+
+    @property
+    def character(self):
+        return self._character
+
+    @property
+    def diacritic_name(self):
+        return self._diacritic_name
+
+    @property
+    def raw(self):
+        # Decomposed characters are a letter followed by combining marks.
+        return "".join(f"\\U{ord(char):08x}" for char in self._character)
 
+    @property
+    def diacritic(self):
+        return _maps._diacritic_tables.char_map.get(self._diacritic_name, "<unprintable>")
 
-class Character:
-    def __init__(self, char, diacritic_name):
-        self.character = char
-        self.raw = f"\\U{f'{ord(char):x}':>08}"
-        self.diacritic = _diacritic_char_map.get(diacritic_name, "<unprintable>")
-        if self.diacritic == "<unprintable>":
-            self.raw_diacritic = self.diacritic
-        else:
-            self.raw_diacritic = f"\\U{f'{ord(self.diacritic):x}':>08}"
-        self.diacritic_name = diacritic_name
+    @property
+    def raw_diacritic(self):
+        diacritic = self.diacritic
+        if diacritic == "<unprintable>":
+            return diacritic
+        return f"\\U{ord(diacritic):08x}"
 
     def __repr__(self):
         return "<{0.diacritic_name} '{0.character}'>".format(self)
 
     def __str__(self):
-        return self.character
+        return self._character
+
+    def __eq__(self, other):
+        if not isinstance(other, Character):
+            return NotImplemented
+        return (self._character, self._diacritic_name) == (other._character, other._diacritic_name)
+
+    def __lt__(self, other):
+        if not isinstance(other, Character):
+            return NotImplemented
+        return (self._character, self._diacritic_name) < (other._character, other._diacritic_name)
+
+    def __hash__(self):
+        return hash((self._character, self._diacritic_name))
 
     def lower(self):
-        return self.character.lower()
+        return self._character.lower()
 
     def upper(self):
-        return self.character.upper()
+        return self._character.upper()
 
 class DiacriticApplicant(object):
     """An object used for applying diacritics to letters.
@@ -48,17 +133,13 @@ class DiacriticApplicant(object):
         return f"<{self.__class__.__name__} '{self.character}>"
 
     def _fetch_diacritic(self, diacritic):
-        try:
-            char = _diacritic_map[diacritic][self.character.upper()]
-        except KeyError:
-            grammar = "a"
-            diacritic = diacritic.replace("_", " ")
-            if diacritic[0] in "aeiou":
-                grammar += "n"
-            raise DiacriticError(self.character, diacritic) from None
-        if self.character.islower():
-            char = char.lower()
-        return Character(char, diacritic)
+        return Character(_apply(self.character, diacritic), diacritic)
+
+    def __getattr__(self, name):
+        # Diacritics added by register_diacritic have no property of their own.
+        if name in _maps._diacritic_tables.registered:
+            return self._fetch_diacritic(name)
+        raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {name!r}")
 
     @property
     def grave(self):
@@ -68,6 +149,10 @@ class DiacriticApplicant(object):
     def acute(self):
         return self._fetch_diacritic("acute")
 
+    @property
+    def double_acute(self):
+        return self._fetch_diacritic("double_acute")
+
     @property
     def circumflex(self):
         return self._fetch_diacritic("circumflex")
@@ -140,4 +225,374 @@ class DiacriticApplicant(object):
 
     @property
     def diaresis_and_macron(self):
-        return self.umlaut_and_macron
\ No newline at end of file
+        return self.umlaut_and_macron
+
+
+class OffsetMap(object):
+    """Maps positions in a cleaned string back to the string it was cleaned from.
+
+    When the cleaned string is as long as the original, every character is
+    still at its own position, so the map is a single run and stores nothing
+    per character. Otherwise it holds an ``array('I')`` with the original
+    position of every cleaned character. When a character expands into
+    several, they all map back to that character.
+    """
+
+    __slots__ = ("_offsets", "_source_length")
+
+    def __init__(self, offsets, source_length):
+        self._offsets = offsets
+        self._source_length = source_length
+
+    def __repr__(self):
+        kind = "identity" if self._offsets is None else "array"
+        return f"<{self.__class__.__name__} {kind} len={len(self)}>"
+
+    def __len__(self):
+        if self._offsets is None:
+            return self._source_length
+        return len(self._offsets)
+
+    def __getitem__(self, index):
+        if self._offsets is not None:
+            return self._offsets[index]
+        if not isinstance(index, int):
+            raise TypeError(f"{self.__class__.__name__} indices must be int, not {type(index).__name__}")
+        if index < 0:
+            index += self._source_length
+        if not 0 <= index < self._source_length:
+            raise IndexError(f"{self.__class__.__name__} index out of range")
+        return index
+
+    def __iter__(self):
+        if self._offsets is None:
+            return iter(range(self._source_length))
+        return iter(self._offsets)
+
+    def __eq__(self, other):
+        if not isinstance(other, OffsetMap):
+            return NotImplemented
+        return self._source_length == other._source_length and list(self) == list(other)
+
+    @property
+    def identity(self):
+        """Whether every character of the cleaned string is at its original position."""
+        return self._offsets is None
+
+    def span(self, start, end):
+        """Returns the span of the original string which cleaned into ``cleaned[start:end]``.
+
+        ``start`` and ``end`` are taken like ``match.span()``, so ``end`` is
+        exclusive and may be the length of the cleaned string. Combining
+        marks after the last character, which cleaning dropped, are part of
+        the span.
+        """
+        length = len(self)
+        if not 0 <= start <= end <= length:
+            raise IndexError(f"span ({start}, {end}) is out of range for length {length}")
+        if self._offsets is None:
+            return start, end
+        if start == end:
+            offset = self._offsets[start] if start < length else self._source_length
+            return offset, offset
+        # The span runs up to the next character kept, unless it is part of
+        # the same expanded character.
+        last = self._offsets[end - 1]
+        following = self._offsets[end] if end < length else self._source_length
+        return self._offsets[start], following if following > last else last + 1
+
+
+class Cleaner(object):
+    """An object used for cleaning diacritics from strings.
+
+    The translation table is built when the library is imported, and
+    again whenever a diacritic is registered. Every call runs the whole
+    string through ``str.translate``.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}>"
+
+    def __call__(self, string):
+        return self.clean(string)
+
+    @property
+    def table(self):
+        return _maps._diacritic_tables.translate
+
+    def clean(self, string):
+        if not isinstance(string, str):
+            raise TypeError("Must be str, not {}".format(type(string).__name__))
+        if string.isascii():
+            return string
+        return string.translate(_maps._diacritic_tables.translate)
+
+
+@lru_cache(maxsize=4)
+def _aligned_table(tables):
+    # tables.translate, except combining marks are kept, so every character
+    # of a cleaned string stays at its position.
+    table = list(tables.translate)
+    for char, (base, _) in tables.reverse.items():
+        if not base and len(char) == 1:
+            table[ord(char)] = ord(char)
+    return table
+
+
+def _folded_pattern(needle):
+    # Each letter of the cleaned needle becomes a class matching it and every
+    # character which cleans to it, so the pattern matches the original text.
+    # Any combining marks after a letter clean to nothing, so they are
+    # matched along with it.
+    tables = _maps._diacritic_tables
+    marks = "" if tables.resizing_regex is None else tables.resizing_regex.pattern + "*"
+    return "".join(
+        (tables.fold_classes.get(char) or re.escape(char)) + marks
+        for char in needle.translate(tables.translate)
+    )
+
+
+class FoldedMatcher(object):
+    """An object used for searching for a string regardless of diacritics.
+
+    Initialize the class with the string to search for. It is compiled
+    once, so the same matcher can be used to search many strings, and the
+    strings searched are never cleaned or copied.
+    """
+
+    __slots__ = ("needle", "_regex")
+
+    def __init__(self, needle):
+        if not isinstance(needle, str):
+            raise TypeError("Must be str, not {}".format(type(needle).__name__))
+        self.needle = needle
+        self._regex = re.compile(_folded_pattern(needle))
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.needle!r}>"
+
+    def find(self, haystack, start=None, end=None):
+        """Returns the lowest index in haystack where the needle is found, or -1."""
+        if not isinstance(haystack, str):
+            raise TypeError("Must be str, not {}".format(type(haystack).__name__))
+        # Bounds are taken like str.find, which never finds anything past the end.
+        if start is not None and start > len(haystack):
+            return -1
+        start, end, _ = slice(start, end).indices(len(haystack))
+        if end < start:
+            return -1
+        match = self._regex.search(haystack, start, end)
+        return -1 if match is None else match.start()
+
+    def contains(self, haystack):
+        """Returns whether the needle is found in haystack."""
+        if not isinstance(haystack, str):
+            raise TypeError("Must be str, not {}".format(type(haystack).__name__))
+        return self._regex.search(haystack) is not None
+
+    def equals(self, text):
+        """Returns whether text is the needle, regardless of diacritics."""
+        if not isinstance(text, str):
+            raise TypeError("Must be str, not {}".format(type(text).__name__))
+        return self._regex.fullmatch(text) is not None
+
+
+class FoldedAutomaton(object):
+    """An object used for searching for many strings at once, regardless of diacritics.
+
+    Initialize the class with the strings to search for. They are cleaned
+    and built into an Aho-Corasick automaton once, after which any amount of
+    text is searched for all of them in a single pass. Automatons can be
+    pickled, so a prebuilt one can be sent to worker processes.
+    """
+
+    __slots__ = ("patterns", "_goto", "_fail", "_out", "_lengths", "_table", "_marks")
+
+    def __init__(self, patterns):
+        # Duplicates would only be reported twice.
+        patterns = tuple(dict.fromkeys(patterns))
+        for pattern in patterns:
+            if not isinstance(pattern, str):
+                raise TypeError("Must be str, not {}".format(type(pattern).__name__))
+            if not pattern:
+                raise ValueError("Patterns can't be empty")
+        tables = _maps._diacritic_tables
+        table = tables.translate
+        cleaned = [pattern.translate(table) for pattern in patterns]
+        if not all(cleaned):
+            raise ValueError("Patterns can't be only combining marks")
+        self.patterns = patterns
+        self._lengths = tuple(map(len, cleaned))
+        # Text is cleaned with the same snapshot as the patterns, even if a
+        # diacritic is registered in the meantime, but keeping its combining
+        # marks, so positions in the cleaned text are positions in the text.
+        # The marks are then skipped, as cleaning would drop them.
+        self._table = _aligned_table(tables)
+        self._marks = frozenset(char for char, (base, _) in tables.reverse.items() if not base)
+
+        # A trie of the cleaned patterns. Each state's outputs are the indexes
+        # of the patterns ending there.
+        goto = [{}]
+        out = [()]
+        for index, pattern in enumerate(cleaned):
+            state = 0
+            for char in pattern:
+                following = goto[state].get(char)
+                if following is None:
+                    following = goto[state][char] = len(goto)
+                    goto.append({})
+                    out.append(())
+                state = following
+            out[state] += (index,)
+
+        # Each state fails over to the longest proper suffix of it which is
+        # also in the trie, and inherits that state's outputs. States are
+        # visited breadth first, so a suffix is always done before its state.
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, following in goto[state].items():
+                queue.append(following)
+                suffix = fail[state]
+                while suffix and char not in goto[suffix]:
+                    suffix = fail[suffix]
+                suffix = goto[suffix].get(char, 0)
+                fail[following] = suffix
+                out[following] += out[suffix]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} patterns={len(self.patterns)}>"
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def finditer(self, text):
+        """Yields ``(start, end, pattern)`` for every occurrence of every pattern in text.
+
+        text is a str, or an iterable of str chunks such as a text file,
+        which are searched as one continuous string. Positions count
+        characters from the start of text, and matches are yielded in order
+        of where they end, longest first. Overlapping matches are all found.
+        Combining marks are skipped, like cleaning drops them, and a match
+        takes in the marks after its last letter.
+        """
+        chunks = (text,) if isinstance(text, str) else text
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        lengths = self._lengths
+        patterns = self.patterns
+        table = self._table
+        marks = self._marks
+
+        state = 0
+        offset = 0
+        # The positions of the latest characters which aren't marks, where
+        # the matches ending at the current one start.
+        starts = deque(maxlen=max(lengths, default=1))
+        # Matches ending at the last character, yielded once the marks after
+        # it, if any, have been passed.
+        found = ()
+        for chunk in chunks:
+            if not isinstance(chunk, str):
+                raise TypeError("Must be str, not {}".format(type(chunk).__name__))
+            # Cleaning keeps every character at its position, so positions in
+            # the cleaned chunk are positions in the original.
+            for position, char in enumerate(chunk.translate(table), offset):
+                if char in marks:
+                    continue
+                if found:
+                    for index in found:
+                        yield starts[-lengths[index]], position, patterns[index]
+                starts.append(position)
+
+                following = goto[state].get(char)
+                while following is None:
+                    if not state:
+                        following = 0
+                        break
+                    state = fail[state]
+                    following = goto[state].get(char)
+                state = following
+                found = out[state]
+            offset += len(chunk)
+
+        for index in found:
+            yield starts[-lengths[index]], offset, patterns[index]
+
+
+def _fold_key(string):
+    if not isinstance(string, str):
+        raise TypeError("Must be str, not {}".format(type(string).__name__))
+    if string.isascii():
+        return string, string
+    tables = _maps._diacritic_tables
+    # Latin-1 text is cleaned through bytes.translate, which is much quicker.
+    bytes_table = tables.bytes_table
+    if bytes_table is None:
+        return string.translate(tables.translate), string
+    try:
+        folded = string.encode("latin-1").translate(bytes_table).decode("latin-1")
+    except UnicodeEncodeError:
+        folded = string.translate(tables.translate)
+    return folded, string
+
+
+class KeyCache(object):
+    """A bounded cache of diacritic insensitive keys, as returned by ``dcl.fold_key``.
+
+    Initialize the class with the number of keys to keep. The least recently
+    used ones are dropped once it is full. This pays off when the same
+    strings come up again and again, as names do in most real data.
+
+    ``key`` is the cached function itself, which is the quickest way to call
+    it, such as ``sorted(names, key=cache.key)``.
+    """
+
+    __slots__ = ("key",)
+
+    def __init__(self, maxsize=65536):
+        if not isinstance(maxsize, int):
+            raise TypeError("Must be int, not {}".format(type(maxsize).__name__))
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, not {maxsize}")
+        self.key = lru_cache(maxsize)(_fold_key)
+
+    def __repr__(self):
+        return "<{0.__class__.__name__} hits={0.hits} misses={0.misses} size={0.size}/{0.maxsize}>".format(self)
+
+    def __call__(self, string):
+        return self.key(string)
+
+    @property
+    def hits(self):
+        return self.key.cache_info().hits
+
+    @property
+    def misses(self):
+        return self.key.cache_info().misses
+
+    @property
+    def size(self):
+        return self.key.cache_info().currsize
+
+    @property
+    def maxsize(self):
+        return self.key.cache_info().maxsize
+
+    @property
+    def hit_rate(self):
+        info = self.key.cache_info()
+        lookups = info.hits + info.misses
+        return info.hits / lookups if lookups else 0.0
+
+    def clear(self):
+        """Empties the cache and resets its counts."""
+        self.key.cache_clear()
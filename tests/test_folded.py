@@ -0,0 +1,15 @@
+import unittest
+
+import dcl
+
+
+class FoldedAutomatonTest(unittest.TestCase):
+    def test_no_patterns(self):
+        automaton = dcl.FoldedAutomaton([])
+        self.assertEqual(len(automaton), 0)
+        self.assertEqual(list(automaton.finditer("abc")), [])
+        self.assertEqual(list(automaton.finditer(["ab", "ć"])), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
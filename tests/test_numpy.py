@@ -0,0 +1,24 @@
+import unittest
+
+import dcl
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+else:
+    import dcl.numpy
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class DecomposedTest(unittest.TestCase):
+    def test_same_as_scalar(self):
+        strings = ["Café", "é̈x", "é́", "Café", "abc", "́"]
+        array = np.array(strings)
+        self.assertEqual(list(dcl.numpy.clean_diacritics(array)), [dcl.clean_diacritics(s) for s in strings])
+        self.assertEqual(list(dcl.numpy.has_diacritics(array)), [dcl.has_diacritics(s) for s in strings])
+        self.assertEqual(list(dcl.numpy.count_diacritics(array)), [dcl.count_diacritics(s) for s in strings])
+
+
+if __name__ == "__main__":
+    unittest.main()
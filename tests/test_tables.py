@@ -0,0 +1,81 @@
+import unittest
+
+import dcl
+from dcl import _maps, _tablegen
+
+
+class GeneratedTablesTest(unittest.TestCase):
+    def test_tables_up_to_date(self):
+        # The same comparison as `python -m dcl._tablegen --check`.
+        with open(_tablegen._path(), encoding="ascii") as f:
+            current = f.read()
+        expected = _tablegen.render(_tablegen.build_tables(_maps._diacritic_map))
+        self.assertTrue(current == expected, "dcl/_tables.py is out of date, run `python -m dcl._tablegen`")
+
+
+class DiacriticNamesTest(unittest.TestCase):
+    def test_every_diacritic_is_public(self):
+        for name in _maps._diacritic_map:
+            self.assertIn(name, dcl.diacritic_list)
+            self.assertTrue(dcl.isdiacritictype(name), name)
+            self.assertTrue(callable(getattr(dcl, name)), name)
+            self.assertTrue(dcl.cantakelist(name), name)
+
+
+class RegistryTest(unittest.TestCase):
+    def assertRestored(self, name, mapping, symbol=None):
+        before = _maps._diacritic_tables
+        dcl.register_diacritic(name, mapping, symbol)
+        try:
+            self.assertIsNot(_maps._diacritic_tables, before)
+        finally:
+            dcl.unregister_diacritic(name)
+        after = _maps._diacritic_tables
+        fields = (
+            "cleaner", "reverse", "decomposed", "translate", "pattern", "utf8_map", "fold_classes",
+            "latin", "extended", "id_names",
+        )
+        for field in fields:
+            self.assertEqual(getattr(after, field), getattr(before, field), field)
+        self.assertEqual(after.regex.pattern, before.regex.pattern)
+        self.assertEqual(after.bytes_table, before.bytes_table)
+        self.assertNotIn(name, dcl.diacritic_list)
+
+    def test_register_unregister(self):
+        self.assertRestored("horn", {"O": "Ơ", "U": "Ư"}, symbol="̛")
+
+    def test_register_unregister_new_mark(self):
+        # Dot below, whose combining mark U+0323 is new to the tables.
+        self.assertRestored("dot_below", {"A": "Ạ", "E": "Ẹ"})
+
+    def test_register_unregister_shared_character(self):
+        # Characters the built in diacritics already clean stay in the tables.
+        self.assertRestored("acute_again", {"E": "É"})
+
+    def test_register_unregister_outside_latin1(self):
+        self.assertRestored("ligature", {"Ω": "Æ"})
+
+    def test_register_unregister_past_table_end(self):
+        # U+1F08 lies past the end of the built in translate table.
+        self.assertRestored("psili", {"Α": "Ἀ"})
+
+    def test_ids_reused(self):
+        # Every registration gets a new diacritic id, which is freed again
+        # when it is unregistered.
+        before = _maps._diacritic_tables.id_names
+        for index in range(300):
+            dcl.register_diacritic(f"hook{index}", {"B": "Ɓ"})
+            dcl.unregister_diacritic(f"hook{index}")
+        self.assertEqual(_maps._diacritic_tables.id_names, before)
+
+        dcl.register_diacritic("hook", {"B": "Ɓ"})
+        try:
+            entry = _maps._diacritic_tables.latin[ord("Ɓ") - 0xC0]
+            self.assertEqual(chr(entry & 0xFF), "B")
+            self.assertEqual(_maps._diacritic_tables.id_names[entry >> 8], ("hook",))
+        finally:
+            dcl.unregister_diacritic("hook")
+
+
+if __name__ == "__main__":
+    unittest.main()